@@ -0,0 +1,189 @@
+"""Benchmarks solver parts and compares them against a JSON baseline
+
+Usage (from the repository root):
+
+    python -m aoc.bench --save baseline.json
+    python -m aoc.bench --compare baseline.json --threshold 0.2
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from aoc.days import PARTS, ROOT_DIR, find_days, get_solver, load_module
+from aoc.results import solve_module
+from aoc.runner import PartTask, get_tasks
+
+
+class BenchmarkResult(NamedTuple):
+    day: str
+    part: int
+    input_file: str
+    repeats: int
+    min: float
+    median: float
+    p95: float
+    peak_memory: int
+
+    @property
+    def key(self) -> str:
+        input_name = os.path.basename(self.input_file)
+        return f'{self.day}/part{self.part}/{input_name}'
+
+
+def _percentile_95(timings: List[float]) -> float:
+    if len(timings) < 2:
+        return timings[0]
+    return statistics.quantiles(timings, n=20, method='inclusive')[-1]
+
+
+def benchmark_part(
+    task: PartTask,
+    repeats: int = 5,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    day, = find_days(names=[task.day])
+    solver = get_solver(day=day, part=task.part)
+
+    # Solvers print debug information - keep the benchmark output clean
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            solver(task.input_file)
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            solver(task.input_file)
+            timings.append(time.perf_counter() - start)
+
+        # Memory is traced in a separate run, as tracing slows down the solver
+        result = solve_module(
+            module=load_module(day),
+            path=task.input_file,
+            parts=[task.part],
+        )
+        peak_memory = result.peak_memory[task.part]
+
+    return BenchmarkResult(
+        day=task.day,
+        part=task.part,
+        input_file=os.path.relpath(task.input_file, ROOT_DIR),
+        repeats=repeats,
+        min=min(timings),
+        median=statistics.median(timings),
+        p95=_percentile_95(timings),
+        peak_memory=peak_memory,
+    )
+
+
+def save_baseline(results: List[BenchmarkResult], path: str):
+    with open(path, 'w') as fout:
+        json.dump(
+            {r.key: r._asdict() for r in results},
+            fout,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    with open(path, 'r') as fin:
+        return {
+            key: BenchmarkResult(**value)
+            for key, value in json.load(fin).items()
+        }
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float,
+    min_time: float,
+) -> List[str]:
+    """Compares medians; parts faster than `min_time` are considered noise."""
+    regressions = []
+
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+
+        limit = max(reference.median * (1 + threshold), min_time)
+        if result.median > limit:
+            regressions.append(
+                f'{result.key}: {result.median:.4f}s > {limit:.4f}s '
+                f'(baseline median: {reference.median:.4f}s)'
+            )
+
+    return regressions
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return (
+        f'{result.key}: '
+        f'min={result.min:.4f}s '
+        f'median={result.median:.4f}s '
+        f'p95={result.p95:.4f}s '
+        f'peak_memory={result.peak_memory / 2 ** 20:.2f}MiB'
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--days', nargs='+', help='e.g. day01 day15')
+    parser.add_argument(
+        '--parts', nargs='+', type=int, choices=PARTS, default=PARTS,
+    )
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--save', help='Write results as a JSON baseline')
+    parser.add_argument('--compare', help='JSON baseline to compare against')
+    parser.add_argument(
+        '--threshold', type=float, default=0.2,
+        help='Allowed relative slowdown of the median (default: 20%%)',
+    )
+    parser.add_argument(
+        '--min-time', type=float, default=0.005,
+        help='Medians below this many seconds never regress',
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    for task in get_tasks(days=args.days, parts=args.parts):
+        result = benchmark_part(
+            task=task,
+            repeats=args.repeats,
+            warmup=args.warmup,
+        )
+        print(format_result(result))
+        results.append(result)
+
+    if args.save:
+        save_baseline(results=results, path=args.save)
+
+    if args.compare:
+        regressions = find_regressions(
+            results=results,
+            baseline=load_baseline(path=args.compare),
+            threshold=args.threshold,
+            min_time=args.min_time,
+        )
+
+        print('-------')
+        for regression in regressions:
+            print('Regression:', regression)
+        print(f'Found {len(regressions)} regressions')
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
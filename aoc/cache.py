@@ -0,0 +1,128 @@
+"""Persistent, content-addressed cache of solver answers
+
+An entry is keyed by the hash of the input file bytes, the hash of the
+solver source (`dayNN/main.py`), the hash of the `aoc` package sources (the
+solvers parse their inputs with its shared modules), the part number and the
+parameters the solver derives for the input besides its content (see
+`aoc.days.get_input_params`), so editing the input, the solver or the shared
+code invalidates it. The cache
+directory is bounded in size; least recently used entries (by modification
+time, refreshed on every hit) are evicted first.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+from aoc.days import ROOT_DIR
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'AOC_CACHE_DIR',
+    os.path.join(ROOT_DIR, '.cache'),
+)
+DEFAULT_MAX_SIZE = 16 * 2 ** 20  # 16 MiB
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_MISSING = object()
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fin:
+        for chunk in iter(lambda: fin.read(2 ** 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def hash_package(directory: str = PACKAGE_DIR) -> str:
+    """Hash of all module sources of the package (once per process)."""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.py'):
+            path = os.path.join(directory, name)
+            digest.update(f'{name}:{hash_file(path)}\n'.encode())
+    return digest.hexdigest()
+
+
+def make_key(
+    input_file: str,
+    solver_file: str,
+    part: int,
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    return hashlib.sha256(
+        f'{hash_file(input_file)}:{hash_file(solver_file)}:'
+        f'{hash_package()}:{part}:'
+        f'{json.dumps(params or {}, sort_keys=True)}'.encode()
+    ).hexdigest()
+
+
+class ResultCache:
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+
+        try:
+            with open(path, 'r') as fin:
+                value = json.load(fin)['answer']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return default
+
+        # Mark as recently used
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        # Write atomically, as several workers may share the directory
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as fout:
+            json.dump({'answer': value}, fout)
+        os.replace(tmp_path, self._path(key))
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        value = self.get(key, default=_MISSING)
+        return value is not _MISSING, value
+
+    def evict(self) -> int:
+        """Removes least recently used entries exceeding `max_size`."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+
+            path = os.path.join(self.directory, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        num_evicted = 0
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            os.remove(path)
+            total_size -= size
+            num_evicted += 1
+
+        return num_evicted
@@ -0,0 +1,85 @@
+"""Discovery and loading of the `dayNN/main.py` solvers"""
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTS = (1, 2)
+
+_LOADED_MODULES: Dict[str, ModuleType] = {}
+
+
+class Day(NamedTuple):
+    name: str
+    path: str
+
+    @property
+    def directory(self) -> str:
+        return os.path.dirname(self.path)
+
+
+def find_days(
+    root_dir: str = ROOT_DIR,
+    names: Optional[Sequence[str]] = None,
+) -> List[Day]:
+    days = []
+
+    for entry in sorted(os.listdir(root_dir)):
+        path = os.path.join(root_dir, entry, 'main.py')
+
+        if not (entry.startswith('day') and os.path.isfile(path)):
+            continue
+
+        if names and entry not in names:
+            continue
+
+        days.append(Day(name=entry, path=path))
+
+    if names:
+        missing = set(names) - {day.name for day in days}
+        if missing:
+            raise ValueError(f'Unknown days: {sorted(missing)}')
+
+    return days
+
+
+def load_module(day: Day) -> ModuleType:
+    """Imports `main.py` of the given day (once per process)."""
+    if day.path in _LOADED_MODULES:
+        return _LOADED_MODULES[day.path]
+
+    module_name = f'{day.name}_main'
+    spec = importlib.util.spec_from_file_location(module_name, day.path)
+    module = importlib.util.module_from_spec(spec)
+
+    # Dataclasses look up their defining module in `sys.modules`
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+    _LOADED_MODULES[day.path] = module
+    return module
+
+
+def get_input_files(day: Day, part: int) -> List[str]:
+    """Returns absolute paths of the inputs declared in `INPUT_FILES`."""
+    module = load_module(day)
+
+    return [
+        os.path.normpath(os.path.join(day.directory, path))
+        for path in module.INPUT_FILES[part]
+    ]
+
+
+def get_solver(day: Day, part: int):
+    return getattr(load_module(day), f'solve_part_{part}')
+
+
+def get_input_params(day: Day, path: str) -> Dict[str, Any]:
+    """Parameters the answers depend on besides the input content (e.g. the
+    preamble of day 9), from the optional `get_input_params` of the day.
+    """
+    get_params = getattr(load_module(day), 'get_input_params', None)
+    return get_params(path) if get_params is not None else {}
@@ -0,0 +1,831 @@
+"""Synthetic inputs of configurable size for every puzzle
+
+Every generator returns the file content in the format expected by the
+`parse_file` function of the given day (no trailing newline, like the real
+inputs). The meaning of `size` differs per day and is described in the
+docstring of each generator. Usage (from the repository root):
+
+    python -m aoc.generators day11 --size 1000 --output /tmp/day11.txt
+"""
+import argparse
+import random
+import string
+import sys
+from itertools import product
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+
+def generate_expense_report(size: int, rng: random.Random) -> str:
+    """`size` expenses with exactly one pair and one triplet summing to
+    2020."""
+    pair = [1721, 299]
+    triplet = [979, 366, 675]
+
+    # Values above 2020 can never be part of a matching pair or triplet
+    values = [rng.randint(2021, 10 * size + 2021) for _ in range(size - 5)]
+    values.extend(pair + triplet)
+    rng.shuffle(values)
+
+    return '\n'.join(str(v) for v in values)
+
+
+def generate_password_policies(size: int, rng: random.Random) -> str:
+    """`size` password policy rows."""
+    rows = []
+    for _ in range(size):
+        password = ''.join(
+            rng.choice(string.ascii_lowercase[:6])
+            for _ in range(rng.randint(5, 20))
+        )
+        min_val = rng.randint(1, len(password) - 1)
+        max_val = rng.randint(min_val + 1, len(password))
+        character = rng.choice(password)
+
+        rows.append(f'{min_val}-{max_val} {character}: {password}')
+
+    return '\n'.join(rows)
+
+
+def generate_tree_map(size: int, rng: random.Random) -> str:
+    """Map with `size` rows (31 columns wide like the real input)."""
+    return '\n'.join(
+        ''.join('#' if rng.random() < 0.2 else '.' for _ in range(31))
+        for _ in range(size)
+    )
+
+
+def generate_passports(size: int, rng: random.Random) -> str:
+    """`size` passport records (valid, invalid and incomplete ones)."""
+    def hex_digits() -> str:
+        return ''.join(rng.choice('0123456789abcdef') for _ in range(6))
+
+    def field_values() -> Dict[str, str]:
+        return {
+            'byr': str(rng.randint(1900, 2010)),
+            'iyr': str(rng.randint(2005, 2025)),
+            'eyr': str(rng.randint(2015, 2035)),
+            'hgt': rng.choice([
+                f'{rng.randint(140, 200)}cm',
+                f'{rng.randint(50, 80)}in',
+            ]),
+            'hcl': rng.choice([
+                '#' + hex_digits(),
+                hex_digits(),
+            ]),
+            'ecl': rng.choice(
+                ('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth', 'xyz')
+            ),
+            'pid': ''.join(
+                rng.choice(string.digits)
+                for _ in range(rng.choice((8, 9, 9, 9, 10)))
+            ),
+            'cid': str(rng.randint(100, 350)),
+        }
+
+    records = []
+    for _ in range(size):
+        fields = [
+            f'{key}:{value}'
+            for key, value in field_values().items()
+            if rng.random() < 0.95
+        ]
+        rng.shuffle(fields)
+
+        # Fields are separated by spaces or newlines
+        record = ''
+        for idx, field in enumerate(fields):
+            if idx > 0:
+                record += '\n' if rng.random() < 0.3 else ' '
+            record += field
+        records.append(record)
+
+    return '\n\n'.join(records)
+
+
+def generate_boarding_passes(size: int, rng: random.Random) -> str:
+    """`size` boarding passes with exactly one missing seat.
+
+    There are only 1024 seats - for larger sizes seats are repeated.
+    """
+    if size < 2:
+        raise ValueError(f'Need at least 2 boarding passes, got {size}')
+
+    first_seat = rng.randint(8, 100)
+    last_seat = min(first_seat + size, 1015)
+    missing_seat = rng.randint(first_seat + 1, last_seat - 1)
+
+    seat_ids = [
+        sid
+        for sid in range(first_seat, last_seat + 1)
+        if sid != missing_seat
+    ]
+    seat_ids.extend(rng.choice(seat_ids) for _ in range(size - len(seat_ids)))
+    rng.shuffle(seat_ids)
+
+    row_table = str.maketrans('01', 'FB')
+    column_table = str.maketrans('01', 'LR')
+    return '\n'.join(
+        f'{sid >> 3:07b}'.translate(row_table)
+        + f'{sid & 7:03b}'.translate(column_table)
+        for sid in seat_ids
+    )
+
+
+def generate_customs_forms(size: int, rng: random.Random) -> str:
+    """`size` groups of 1-5 people."""
+    groups = []
+    for _ in range(size):
+        people = [
+            ''.join(rng.sample(string.ascii_lowercase, rng.randint(1, 26)))
+            for _ in range(rng.randint(1, 5))
+        ]
+        groups.append('\n'.join(people))
+
+    return '\n\n'.join(groups)
+
+
+def _bag_colors(size: int) -> List[str]:
+    adjectives = [
+        'light', 'dark', 'bright', 'muted', 'shiny', 'faded', 'dotted',
+        'vibrant', 'dull', 'pale', 'clear', 'dim', 'drab', 'mirrored',
+        'plaid', 'posh', 'striped', 'wavy',
+    ]
+    colors = [
+        'red', 'orange', 'white', 'yellow', 'gold', 'olive', 'plum', 'black',
+        'blue', 'green', 'cyan', 'lime', 'teal', 'tan', 'beige', 'coral',
+        'magenta', 'maroon', 'salmon', 'silver', 'violet', 'indigo',
+    ]
+    names = [f'{a} {c}' for a, c in product(adjectives, colors)]
+
+    # Extend the vocabulary for large rule sets
+    suffix = 0
+    while len(names) < size:
+        suffix += 1
+        names.extend(
+            f'{a}{suffix} {c}'
+            for a, c in product(adjectives, colors)
+        )
+
+    return names
+
+
+def generate_bag_rules(size: int, rng: random.Random) -> str:
+    """`size` bag rules forming a DAG which contains a `shiny gold` bag."""
+    colors = [c for c in _bag_colors(size + 1) if c != 'shiny gold']
+    colors = rng.sample(colors, size - 1)
+    colors.insert(size // 2, 'shiny gold')
+
+    rules = []
+    for idx, color in enumerate(colors):
+        # Bags only contain bags further in the list (no cycles)
+        candidates = colors[idx + 1:idx + 50]
+        inner = rng.sample(candidates, min(len(candidates), rng.randint(0, 4)))
+
+        if not inner:
+            rules.append(f'{color} bags contain no other bags.')
+            continue
+
+        contents = ', '.join(
+            f'{num} {c} bag' + ('s' if num > 1 else '')
+            for c in inner
+            for num in [rng.randint(1, 5)]
+        )
+        rules.append(f'{color} bags contain {contents}.')
+
+    rng.shuffle(rules)
+    return '\n'.join(rules)
+
+
+def generate_boot_code(size: int, rng: random.Random) -> str:
+    """Program of `size` instructions with exactly one corrupted `jmp`."""
+    if size < 3:
+        raise ValueError(f'Need at least 3 instructions, got {size}')
+
+    instructions = []
+    for _ in range(size - 2):
+        if rng.random() < 0.5:
+            instructions.append(f'acc {rng.randint(-50, 50):+d}')
+        elif rng.random() < 0.5:
+            # Flipped into `jmp +0` this creates a loop
+            instructions.append('nop +0')
+        else:
+            # Flipped into `nop` this behaves in the same way
+            instructions.append('jmp +1')
+
+    # The corrupted instruction (jumps back to the beginning)
+    corrupted_idx = rng.randint(size // 2, size - 2)
+    instructions.insert(corrupted_idx, f'jmp {-corrupted_idx:+d}')
+    instructions.append('acc +1')
+
+    return '\n'.join(instructions)
+
+
+def generate_xmas_data(
+    size: int,
+    rng: random.Random,
+    window: int = 25,
+) -> str:
+    """`size` numbers where the last one breaks the XMAS property.
+
+    Valid numbers are sums of two previous ones, so their magnitude grows
+    exponentially with `size / window`.
+    """
+    numbers = rng.sample(range(1, 10 * window), window)
+
+    while len(numbers) < size - 1:
+        a, b = rng.sample(numbers[-window:], 2)
+        if a != b:
+            numbers.append(a + b)
+
+    # Sum of a contiguous range which is not a sum of the last `window` values
+    buffer = set(numbers[-window:])
+    while True:
+        start = rng.randint(0, window)
+        invalid_number = sum(numbers[start:start + rng.randint(2, window)])
+
+        if not any(invalid_number - v in buffer for v in buffer):
+            break
+
+    numbers.append(invalid_number)
+    return '\n'.join(str(v) for v in numbers)
+
+
+def generate_adapters(
+    size: int,
+    rng: random.Random,
+    max_run: int = 4,
+) -> str:
+    """`size` adapters with 1-jolt runs of at most `max_run` adapters."""
+    jolts = []
+    current, run = 0, 0
+    for _ in range(size):
+        if run < max_run and rng.random() < 0.7:
+            current, run = current + 1, run + 1
+        else:
+            current, run = current + 3, 0
+        jolts.append(current)
+
+    rng.shuffle(jolts)
+    return '\n'.join(str(v) for v in jolts)
+
+
+# `(visible, tolerance)` of the seating rules of both parts of day 11
+SEATING_RULES = ((False, 4), (True, 5))
+
+
+class _SeatBoard:
+    """Seat layout as bitboards (Python ints) with a bit per cell, simulated
+    independently of the day 11 solvers.
+
+    Rows are `width + 1` bits apart: the extra column is never a seat, so
+    shifting cells sideways never wraps around into the adjacent row.
+    """
+
+    def __init__(self, rows: List[str]):
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.stride = self.width + 1
+        self.all_cells = (1 << (self.height * self.stride)) - 1
+
+        # The most significant bit comes first
+        to_bits = str.maketrans('L.', '10')
+        self.seats = int('0' + ''.join(
+            '0' + row[::-1].translate(to_bits)
+            for row in reversed(rows)
+        ), 2)
+        self.floor = self.all_cells & ~self.seats & ~int(
+            ('1' + '0' * self.width) * self.height or '0', 2
+        )
+
+        self.offsets = [
+            dr * self.stride + dc
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            if (dr, dc) != (0, 0)
+        ]
+
+    def to_rows(self) -> List[str]:
+        cells = format(self.seats, f'0{self.height * self.stride}b')[::-1]
+        to_cells = str.maketrans('10', 'L.')
+        return [
+            cells[row * self.stride:row * self.stride + self.width]
+            .translate(to_cells)
+            for row in range(self.height)
+        ]
+
+    def remove_seats(self, cells: int):
+        self.seats &= ~cells
+        self.floor |= cells
+
+    def _shift(self, cells: int, offset: int) -> int:
+        """Moves the value of cell `i + offset` to cell `i`."""
+        if offset > 0:
+            return cells >> offset
+        return (cells << -offset) & self.all_cells
+
+    def _seen(self, occupied: int, offset: int) -> int:
+        """Cells whose first seat in the direction of `offset` is occupied.
+
+        Occupied seats are spread across the floor with doubling shifts
+        (Kogge-Stone fill), so it takes `log2(size)` steps per direction.
+        """
+        filled, passable, shift = occupied, self.floor, offset
+        while passable:
+            filled |= passable & self._shift(filled, shift)
+            passable &= self._shift(passable, shift)
+            shift *= 2
+        return self._shift(filled, offset)
+
+    def step(self, occupied: int, visible: bool, tolerance: int) -> int:
+        # Bit-sliced counters of the occupied neighbors (up to 8)
+        counts = [0, 0, 0, 0]
+        any_occupied = 0
+        for offset in self.offsets:
+            if visible:
+                carry = self._seen(occupied, offset)
+            else:
+                carry = self._shift(occupied, offset)
+            any_occupied |= carry
+
+            for bit in range(len(counts)):
+                counts[bit], carry = counts[bit] ^ carry, counts[bit] & carry
+
+        # Cells with at least `tolerance` occupied neighbors
+        crowded, equal = 0, self.all_cells
+        for bit in reversed(range(len(counts))):
+            if tolerance >> bit & 1:
+                equal &= counts[bit]
+            else:
+                crowded |= equal & counts[bit]
+                equal &= ~counts[bit]
+        crowded |= equal
+
+        return self.seats & (
+            (occupied & ~crowded) | (~occupied & ~any_occupied)
+        )
+
+    def find_oscillating(self, visible: bool, tolerance: int) -> int:
+        """Seats alternating forever between two states (0 once stable)."""
+        previous, occupied = None, 0
+        while True:
+            updated = self.step(occupied, visible=visible, tolerance=tolerance)
+            if updated == occupied:
+                return 0
+            if updated == previous:
+                return updated ^ occupied
+            previous, occupied = occupied, updated
+
+
+def generate_seat_layout(size: int, rng: random.Random) -> str:
+    """Seat layout of `size` x `size` cells which becomes stable under both
+    seating rules.
+
+    Large random layouts end up alternating between two states somewhere -
+    the seats doing so are replaced by floor until both rules converge.
+    """
+    board = _SeatBoard(rows=[
+        ''.join('L' if rng.random() < 0.75 else '.' for _ in range(size))
+        for _ in range(size)
+    ])
+
+    stable = False
+    while not stable:
+        stable = True
+        for visible, tolerance in SEATING_RULES:
+            oscillating = board.find_oscillating(
+                visible=visible,
+                tolerance=tolerance,
+            )
+            if oscillating:
+                board.remove_seats(cells=oscillating)
+                stable = False
+
+    return '\n'.join(board.to_rows())
+
+
+def generate_navigation(size: int, rng: random.Random) -> str:
+    """`size` navigation instructions."""
+    instructions = []
+    for _ in range(size):
+        action = rng.choice('NSEWLRF')
+        if action in ('L', 'R'):
+            value = rng.choice((90, 180, 270))
+        else:
+            value = rng.randint(1, 100)
+        instructions.append(f'{action}{value}')
+
+    return '\n'.join(instructions)
+
+
+def _primes(count: int, start: int) -> List[int]:
+    primes = []
+    candidate = start
+    while len(primes) < count:
+        if all(candidate % d for d in range(2, int(candidate ** 0.5) + 1)):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate_bus_schedule(size: int, rng: random.Random) -> str:
+    """Schedule with `size` buses (pairwise coprime IDs) and `x` gaps."""
+    bus_ids = [str(bid) for bid in _primes(count=size, start=13)]
+    rng.shuffle(bus_ids)
+
+    schedule = []
+    for bid in bus_ids:
+        schedule.extend(['x'] * rng.randint(0, 3))
+        schedule.append(bid)
+
+    return f'{rng.randint(100_000, 10_000_000)}\n' + ','.join(schedule)
+
+
+def generate_docking_program(
+    size: int,
+    rng: random.Random,
+    max_floating: int = 9,
+) -> str:
+    """`size` instructions; masks contain at most `max_floating` `X` bits."""
+    lines = []
+    for idx in range(size):
+        if idx % 5 == 0:
+            mask = [rng.choice('01') for _ in range(36)]
+            for pos in rng.sample(range(36), rng.randint(0, max_floating)):
+                mask[pos] = 'X'
+            lines.append('mask = ' + ''.join(mask))
+        else:
+            lines.append(
+                f'mem[{rng.randint(0, 2 ** 16)}] = {rng.randint(0, 2 ** 30)}'
+            )
+
+    return '\n'.join(lines)
+
+
+def generate_starting_numbers(size: int, rng: random.Random) -> str:
+    """`size` distinct starting numbers."""
+    return ','.join(str(v) for v in rng.sample(range(0, 10 * size + 10), size))
+
+
+def generate_tickets(size: int, rng: random.Random) -> str:
+    """`size` nearby tickets with 20 fields (some tickets are invalid).
+
+    Column `c` satisfies rule `i` iff `c >= i`, hence the field names can be
+    matched by elimination.
+    """
+    num_fields = 20
+    names = [
+        *[f'departure {n}' for n in ('location', 'station', 'platform')],
+        *[f'field {i}' for i in range(num_fields - 3)],
+    ]
+    rng.shuffle(names)
+
+    upper = 100 * num_fields - 1
+    rules = [
+        f'{name}: {100 * i}-{upper} or '
+        f'{upper + 1000 + 2 * i}-{upper + 1001 + 2 * i}'
+        for i, name in enumerate(names)
+    ]
+
+    columns = list(range(num_fields))
+    rng.shuffle(columns)
+
+    def ticket(valid: bool) -> str:
+        values = [rng.randint(100 * c, 100 * c + 99) for c in columns]
+        if not valid:
+            values[rng.randrange(num_fields)] = upper + rng.randint(1, 900)
+        return ','.join(str(v) for v in values)
+
+    nearby = [ticket(valid=rng.random() < 0.8) for _ in range(size)]
+
+    return (
+        '\n'.join(rules)
+        + '\n\nyour ticket:\n' + ticket(valid=True)
+        + '\n\nnearby tickets:\n' + '\n'.join(nearby)
+    )
+
+
+def generate_cube_layer(size: int, rng: random.Random) -> str:
+    """Initial layer of `size` x `size` cubes."""
+    return '\n'.join(
+        ''.join('#' if rng.random() < 0.5 else '.' for _ in range(size))
+        for _ in range(size)
+    )
+
+
+def _expression(depth: int, rng: random.Random) -> str:
+    operands = []
+    for _ in range(rng.randint(2, 4)):
+        if depth > 0 and rng.random() < 0.4:
+            operands.append(f'({_expression(depth=depth - 1, rng=rng)})')
+        else:
+            operands.append(str(rng.randint(1, 9)))
+
+    expression = operands[0]
+    for operand in operands[1:]:
+        expression += f' {rng.choice("+*")} {operand}'
+    return expression
+
+
+def generate_expressions(
+    size: int,
+    rng: random.Random,
+    max_depth: int = 3,
+) -> str:
+    """`size` expressions with parenthesis nested up to `max_depth` levels."""
+    return '\n'.join(
+        _expression(depth=max_depth, rng=rng)
+        for _ in range(size)
+    )
+
+
+def generate_message_rules(
+    size: int,
+    rng: random.Random,
+    depth: int = 3,
+) -> str:
+    """`size` messages and a grammar of the given `depth`.
+
+    Rules `42` and `31` match strings of length `2 ** depth` with an odd and
+    even number of `b`s, respectively (O_k = E O | O E, E_k = E E | O O).
+    """
+    reserved = {'0', '8', '11', '31', '42'}
+    free_ids = (str(i) for i in range(1, 10 ** 6) if str(i) not in reserved)
+
+    rules = {'0': '8 11', '8': '42', '11': '42 31'}
+    even, odd = next(free_ids), next(free_ids)
+    rules[even], rules[odd] = '"a"', '"b"'
+
+    for level in range(1, depth + 1):
+        if level == depth:
+            new_odd, new_even = '42', '31'
+        else:
+            new_odd, new_even = next(free_ids), next(free_ids)
+
+        rules[new_odd] = f'{even} {odd} | {odd} {even}'
+        rules[new_even] = f'{even} {even} | {odd} {odd}'
+        even, odd = new_even, new_odd
+
+    # Rules `42` / `31` are built as odd / even parity at the last level
+    def chunk(num_b_parity: int) -> str:
+        value = [rng.choice('ab') for _ in range(2 ** depth)]
+        if value.count('b') % 2 != num_b_parity:
+            value[0] = 'a' if value[0] == 'b' else 'b'
+        return ''.join(value)
+
+    messages = []
+    for _ in range(size):
+        num_42 = rng.randint(1, 5)
+        num_31 = rng.randint(0, 4)
+        messages.append(
+            ''.join(chunk(num_b_parity=1) for _ in range(num_42))
+            + ''.join(chunk(num_b_parity=0) for _ in range(num_31))
+        )
+
+    rule_lines = [f'{rid}: {body}' for rid, body in rules.items()]
+    rng.shuffle(rule_lines)
+
+    return '\n'.join(rule_lines) + '\n\n' + '\n'.join(messages)
+
+
+def _canonical_border(border: str) -> str:
+    return min(border, border[::-1])
+
+
+def _transform_tile(
+    pixels: List[str],
+    rotations: int,
+    flip: bool,
+) -> List[str]:
+    for _ in range(rotations):
+        pixels = [''.join(line) for line in zip(*pixels[::-1])]
+    if flip:
+        pixels = [line[::-1] for line in pixels]
+    return pixels
+
+
+def _unmatched_borders(pixels: List[str], unique: Set[str]) -> Set[str]:
+    borders = {
+        'top': pixels[0],
+        'bottom': pixels[-1],
+        'left': ''.join(line[0] for line in pixels),
+        'right': ''.join(line[-1] for line in pixels),
+    }
+    return {
+        name
+        for name, border in borders.items()
+        if _canonical_border(border) in unique
+    }
+
+
+def generate_tiles(
+    size: int,
+    rng: random.Random,
+    tile_size: int = 10,
+) -> str:
+    """`size` x `size` tiles (each `tile_size` pixels wide) of one image.
+
+    Every border is unique (also when reversed), no border is a palindrome and
+    exactly one corner tile has its unmatched borders on top and left, as in
+    the real input.
+    """
+    step = tile_size - 1
+    image_size = size * step + 1
+
+    if 2 * size * (size + 1) > 2 ** (tile_size - 1):
+        raise ValueError(f'Tiles of size {tile_size} are too small for {size}')
+
+    grid = [
+        [rng.choice('#.') for _ in range(image_size)]
+        for _ in range(image_size)
+    ]
+
+    # Make every border segment unique (corners are left as they are)
+    used_borders = set()
+    segments = [
+        (horizontal, line * step, offset * step)
+        for horizontal in (True, False)
+        for line in range(size + 1)
+        for offset in range(size)
+    ]
+    for horizontal, line, offset in segments:
+        while True:
+            inner = [rng.choice('#.') for _ in range(tile_size - 2)]
+            for idx, value in enumerate(inner, start=offset + 1):
+                if horizontal:
+                    grid[line][idx] = value
+                else:
+                    grid[idx][line] = value
+
+            border = ''.join(
+                (
+                    grid[line][offset + i]
+                    if horizontal
+                    else grid[offset + i][line]
+                )
+                for i in range(tile_size)
+            )
+            # Palindromes would match in two orientations
+            if (
+                border != border[::-1]
+                and _canonical_border(border) not in used_borders
+            ):
+                used_borders.add(_canonical_border(border))
+                break
+
+    # Outer borders are the ones without a matching tile
+    outer_borders = set()
+    for offset in range(size):
+        for line in (0, size * step):
+            outer_borders.add(_canonical_border(''.join(
+                grid[line][offset * step + i] for i in range(tile_size)
+            )))
+            outer_borders.add(_canonical_border(''.join(
+                grid[offset * step + i][line] for i in range(tile_size)
+            )))
+
+    tile_ids = rng.sample(range(1000, 1000 + 10 * size * size), size * size)
+    upper_left_corner = rng.choice([
+        (0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1),
+    ])
+
+    tiles = []
+    for row, col in product(range(size), range(size)):
+        pixels = [
+            ''.join(grid[row * step + y][col * step:col * step + tile_size])
+            for y in range(tile_size)
+        ]
+
+        while True:
+            transformed = _transform_tile(
+                pixels=pixels,
+                rotations=rng.randint(0, 3),
+                flip=rng.random() < 0.5,
+            )
+            is_upper_left = _unmatched_borders(
+                pixels=transformed,
+                unique=outer_borders,
+            ) >= {'top', 'left'}
+
+            if is_upper_left == ((row, col) == upper_left_corner):
+                break
+
+        tile_id = tile_ids[row * size + col]
+        tiles.append(f'Tile {tile_id}:\n' + '\n'.join(transformed))
+
+    rng.shuffle(tiles)
+    return '\n\n'.join(tiles)
+
+
+def _resolve_allergens(food: List[Tuple[Set[str], Set[str]]]) -> bool:
+    candidates = {}
+    for ingredients, allergens in food:
+        for a in allergens:
+            candidates[a] = candidates.get(a, ingredients) & ingredients
+
+    while candidates:
+        resolved = {
+            a: next(iter(c))
+            for a, c in candidates.items()
+            if len(c) == 1
+        }
+        if not resolved:
+            return False
+
+        candidates = {
+            a: c - set(resolved.values())
+            for a, c in candidates.items()
+            if a not in resolved
+        }
+
+    return True
+
+
+def generate_food_list(size: int, rng: random.Random) -> str:
+    """`size` foods; allergens can be assigned to ingredients by
+    elimination."""
+    allergens = [
+        'dairy', 'eggs', 'fish', 'nuts', 'peanuts', 'sesame', 'shellfish',
+        'soy', 'wheat',
+    ]
+    ingredients = [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(7))
+        for _ in range(max(50, size // 5))
+    ]
+    allergen_ingredients = dict(zip(allergens, rng.sample(ingredients, 9)))
+
+    food = []
+    while len(food) < size or not _resolve_allergens(food=food):
+        listed = set(rng.sample(allergens, rng.randint(1, 3)))
+        contained = set(rng.sample(ingredients, rng.randint(5, 15)))
+        contained.update(allergen_ingredients[a] for a in listed)
+        food.append((contained, listed))
+
+    return '\n'.join(
+        ' '.join(sorted(contained, key=lambda _: rng.random()))
+        + ' (contains ' + ', '.join(sorted(listed)) + ')'
+        for contained, listed in food
+    )
+
+
+def generate_decks(size: int, rng: random.Random) -> str:
+    """Two decks of `size` cards each."""
+    cards = list(range(1, 2 * size + 1))
+    rng.shuffle(cards)
+
+    return (
+        'Player 1:\n' + '\n'.join(str(c) for c in cards[:size])
+        + '\n\nPlayer 2:\n' + '\n'.join(str(c) for c in cards[size:])
+    )
+
+
+GENERATORS: Dict[str, Callable[..., str]] = {
+    'day01': generate_expense_report,
+    'day02': generate_password_policies,
+    'day03': generate_tree_map,
+    'day04': generate_passports,
+    'day05': generate_boarding_passes,
+    'day06': generate_customs_forms,
+    'day07': generate_bag_rules,
+    'day08': generate_boot_code,
+    'day09': generate_xmas_data,
+    'day10': generate_adapters,
+    'day11': generate_seat_layout,
+    'day12': generate_navigation,
+    'day13': generate_bus_schedule,
+    'day14': generate_docking_program,
+    'day15': generate_starting_numbers,
+    'day16': generate_tickets,
+    'day17': generate_cube_layer,
+    'day18': generate_expressions,
+    'day19': generate_message_rules,
+    'day20': generate_tiles,
+    'day21': generate_food_list,
+    'day22': generate_decks,
+}
+
+
+def generate(day: str, size: int, seed: int = 0, **kwargs) -> str:
+    return GENERATORS[day](size=size, rng=random.Random(seed), **kwargs)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('day', choices=sorted(GENERATORS.keys()))
+    parser.add_argument('--size', type=int, required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Defaults to stdout')
+    args = parser.parse_args(argv)
+
+    content = generate(day=args.day, size=args.size, seed=args.seed)
+
+    if args.output:
+        with open(args.output, 'w') as fout:
+            fout.write(content)
+    else:
+        sys.stdout.write(content)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
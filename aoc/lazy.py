@@ -0,0 +1,36 @@
+"""Deferred imports for solvers started as short-lived processes"""
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Iterable, Optional
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Returns a module proxy which executes the module on first access."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
+def progress(iterable: Iterable, desc: Optional[str] = None) -> Iterable:
+    """Wraps `iterable` in a `tqdm` progress bar if stderr is a terminal."""
+    if not sys.stderr.isatty():
+        return iterable
+
+    try:
+        tqdm = lazy_import('tqdm')
+    except ModuleNotFoundError:
+        return iterable
+
+    return tqdm.tqdm(iterable, desc=desc)
@@ -0,0 +1,62 @@
+"""Memory-mapped input loading
+
+Inputs are memory-mapped instead of being read (and split) as a whole, so
+only the currently processed line / record has to be materialized. The
+iterators yield `memoryview` slices of the mapping - they are only meant to be
+decoded (`str(view, 'ascii')`, `int(view)`) while iterating.
+"""
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[memoryview]:
+    with open(path, 'rb') as fin:
+        # Empty files cannot be memory-mapped
+        if os.fstat(fin.fileno()).st_size == 0:
+            yield memoryview(b'')
+            return
+
+        mm = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mm.close()
+            except BufferError:
+                # Some slices are still referenced - the mapping will be
+                # closed once they are garbage collected
+                pass
+
+
+def _iter_slices(view: memoryview, separator: bytes) -> Iterator[memoryview]:
+    data = view.obj
+    start, end = 0, view.nbytes
+
+    # Ignore trailing newlines at the end of the file
+    while end > 0 and view[end - 1] == ord('\n'):
+        end -= 1
+
+    while start < end:
+        stop = data.find(separator, start, end)
+        if stop == -1:
+            stop = end
+
+        yield view[start:stop]
+        start = stop + len(separator)
+
+
+def iter_lines(path: str) -> Iterator[memoryview]:
+    """Yields every line of the file (without the newline character)."""
+    with map_file(path) as view:
+        yield from _iter_slices(view=view, separator=b'\n')
+
+
+def iter_records(path: str) -> Iterator[memoryview]:
+    """Yields blank-line separated records (lines are kept within records)."""
+    with map_file(path) as view:
+        yield from _iter_slices(view=view, separator=b'\n\n')
@@ -0,0 +1,227 @@
+"""Opt-in profiling of solver parts
+
+Every function defined in the day module is accounted for (call counts,
+own and cumulative time from `cProfile`). Allocations are sampled with
+`tracemalloc`: a background thread takes a snapshot whenever the traced
+memory grows past the previously sampled maximum (by `SAMPLING_GROWTH`), and
+the memory allocated at that point is attributed to the innermost function
+containing the allocating line.
+
+Reports are JSON documents with sorted keys, so they can be diffed across
+commits. Usage (from the repository root):
+
+    python -m aoc.profiling --days day11 --parts 2 --output day11.json
+    python -m aoc.runner --profile profiles/    # or AOC_PROFILE=profiles/
+"""
+import argparse
+import contextlib
+import cProfile
+import dis
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from types import CodeType
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from aoc.days import (
+    PARTS, ROOT_DIR, Day, find_days, get_input_files, get_solver,
+)
+
+PROFILE_ENV_VAR = 'AOC_PROFILE'
+
+# Snapshots are expensive - only take them after significant memory growth
+SAMPLING_GROWTH = 1.1
+
+
+def _iter_code_objects(code: CodeType) -> Iterator[CodeType]:
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield const
+            yield from _iter_code_objects(const)
+
+
+def _get_functions(path: str) -> Dict[Tuple[int, str], Tuple[str, int, int]]:
+    """Maps `(first line, name)` to `(qualified name, first line, last
+    line)`."""
+    with open(path, 'r') as fin:
+        module_code = compile(fin.read(), path, 'exec')
+
+    functions = {}
+    for code in _iter_code_objects(module_code):
+        lines = [
+            line
+            for _, line in dis.findlinestarts(code)
+            if line is not None
+        ]
+        functions[(code.co_firstlineno, code.co_name)] = (
+            # `co_qualname` is new in Python 3.11
+            getattr(code, 'co_qualname', code.co_name),
+            code.co_firstlineno,
+            max(lines, default=code.co_firstlineno),
+        )
+
+    return functions
+
+
+class _AllocationSampler(threading.Thread):
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._max_memory = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._max_memory * SAMPLING_GROWTH:
+                self._max_memory = current
+                self.snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def _allocations_by_function(
+    snapshot: Optional[tracemalloc.Snapshot],
+    path: str,
+    functions: Dict[Tuple[int, str], Tuple[str, int, int]],
+) -> Dict[str, int]:
+    if snapshot is None:
+        return {}
+
+    # Innermost function first
+    ranges = sorted(functions.values(), key=lambda f: f[2] - f[1])
+
+    allocations = {}
+    for stat in snapshot.statistics('lineno'):
+        frame = stat.traceback[0]
+        if frame.filename != path:
+            continue
+
+        name = next(
+            (qualname for qualname, first, last in ranges
+             if first <= frame.lineno <= last),
+            '<module>',
+        )
+        allocations[name] = allocations.get(name, 0) + stat.size
+
+    return allocations
+
+
+def profile_part(
+    day: Day,
+    part: int,
+    input_file: str,
+    sampling_interval: float = 0.05,
+) -> dict:
+    solver = get_solver(day=day, part=part)
+    functions = _get_functions(path=day.path)
+
+    profiler = cProfile.Profile()
+    sampler = _AllocationSampler(interval=sampling_interval)
+
+    tracemalloc.start()
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        # Solvers print debug information - keep the report output clean
+        with contextlib.redirect_stdout(io.StringIO()):
+            answer = profiler.runcall(solver, input_file)
+    finally:
+        elapsed = time.perf_counter() - start
+        sampler.stop()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    allocations = _allocations_by_function(
+        snapshot=sampler.snapshot,
+        path=day.path,
+        functions=functions,
+    )
+
+    report = {}
+    stats = pstats.Stats(profiler).stats
+    for (filename, lineno, name), values in stats.items():
+        if filename != day.path:
+            continue
+
+        primitive_calls, calls, total_time, cumulative_time, _ = values
+        qualname = functions.get((lineno, name), (name,))[0]
+
+        report[qualname] = {
+            'calls': calls,
+            'primitive_calls': primitive_calls,
+            'total_time': total_time,
+            'cumulative_time': cumulative_time,
+            'allocated_at_peak': allocations.get(qualname, 0),
+        }
+
+    return {
+        'day': day.name,
+        'part': part,
+        'input_file': os.path.relpath(input_file, ROOT_DIR),
+        'answer': answer,
+        'elapsed': elapsed,
+        'peak_memory': peak_memory,
+        'functions': report,
+    }
+
+
+def _get_report_name(report: dict) -> str:
+    """Name of the report file, unique per day, part and input path."""
+    input_file = report['input_file']  # relative to the root
+    if input_file.split(os.sep)[0] == os.pardir:
+        # Absolute paths of inputs outside the repository
+        input_file = os.path.abspath(os.path.join(ROOT_DIR, input_file))
+
+    input_name = os.path.splitext(input_file)[0].strip(os.sep)
+    return (
+        f'{report["day"]}-part{report["part"]}-'
+        f'{input_name.replace(os.sep, "-")}.json'
+    )
+
+
+def save_report(report: dict, directory: str):
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(directory, _get_report_name(report=report))
+
+    with open(path, 'w') as fout:
+        json.dump(report, fout, indent=2, sort_keys=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--days', nargs='+', help='e.g. day01 day15')
+    parser.add_argument(
+        '--parts', nargs='+', type=int, choices=PARTS, default=PARTS,
+    )
+    parser.add_argument('--output', help='Defaults to stdout')
+    args = parser.parse_args(argv)
+
+    reports = [
+        profile_part(day=day, part=part, input_file=input_file)
+        for day in find_days(names=args.days)
+        for part in args.parts
+        for input_file in get_input_files(day=day, part=part)
+    ]
+
+    output = json.dumps(reports, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as fout:
+            fout.write(output)
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""Checks solver answers against expected answers and per-day time budgets
+
+Expected answers are recorded per part and input file in `aoc/expected.json`,
+together with the time budget (in seconds) of every day. The budget applies
+to each single check, i.e. one part solved on one input, and is enforced:
+checks still running shortly after exceeding it are killed. Days may define
+`EXAMPLES` (`{part: [(example, expected answer), ...]}`) solved by
+`solve_example(part, example)` for the puzzle examples that do not have an
+input file - these are not run by `main()` of the days.
+
+Usage (from the repository root):
+
+    python -m aoc.regression
+    python -m aoc.regression --days day15 --no-examples
+    python -m aoc.regression --budget-scale 2    # on slower hosts
+    python -m aoc.regression --record    # after adding new inputs
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from aoc.days import PARTS, find_days, get_solver, load_module
+from aoc.runner import PartTask, get_tasks
+
+EXPECTED_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'expected.json',
+)
+DEFAULT_BUDGET = 1.0  # seconds
+# Checks are killed once they exceed their budget by this much (seconds), the
+# grace period covers starting the worker process
+TIMEOUT_GRACE = 1.0
+
+
+class Check(NamedTuple):
+    day: str
+    part: int
+    input_file: Optional[str] = None
+    example_index: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        if self.input_file is None:
+            name = f'example[{self.example_index}]'
+        else:
+            name = os.path.basename(self.input_file)
+        return f'{self.day}/part{self.part}/{name}'
+
+
+class CheckResult(NamedTuple):
+    key: str
+    answer: Any
+    expected: Any
+    elapsed: float
+    budget: float
+    error: Optional[str] = None
+    timed_out: bool = False
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return 'ERROR'
+        if self.timed_out:
+            return 'SLOW'
+        if self.expected is None:
+            return 'UNKNOWN'
+        if self.answer != self.expected:
+            return 'FAIL'
+        if self.elapsed > self.budget:
+            return 'SLOW'
+        return 'OK'
+
+
+def load_expected(path: str = EXPECTED_FILE) -> Dict[str, Dict[str, Any]]:
+    with open(path, 'r') as fin:
+        return json.load(fin)
+
+
+def save_expected(
+    expected: Dict[str, Dict[str, Any]],
+    path: str = EXPECTED_FILE,
+):
+    with open(path, 'w') as fout:
+        json.dump(expected, fout, indent=2, sort_keys=True)
+        fout.write('\n')
+
+
+def get_checks(
+    tasks: List[PartTask],
+    examples: bool = True,
+) -> List[Check]:
+    checks = [
+        Check(day=task.day, part=task.part, input_file=task.input_file)
+        for task in tasks
+    ]
+
+    if examples:
+        for day, part in sorted({(task.day, task.part) for task in tasks}):
+            module = load_module(find_days(names=[day])[0])
+            day_examples = getattr(module, 'EXAMPLES', {}).get(part, [])
+
+            checks.extend(
+                Check(day=day, part=part, example_index=idx)
+                for idx in range(len(day_examples))
+            )
+
+    return checks
+
+
+def run_check(
+    check: Check,
+    expected: Optional[Any],
+    budget: float,
+) -> CheckResult:
+    """Solves a single input or example (executed in a worker)."""
+    day, = find_days(names=[check.day])
+
+    if check.input_file is None:
+        module = load_module(day)
+        example, expected = module.EXAMPLES[check.part][check.example_index]
+        solve = functools.partial(module.solve_example, check.part, example)
+    else:
+        solver = get_solver(day=day, part=check.part)
+        solve = functools.partial(solver, check.input_file)
+
+    start = time.perf_counter()
+    try:
+        # Solvers print debug information - keep the report output clean
+        with contextlib.redirect_stdout(io.StringIO()):
+            answer = solve()
+        error = None
+    except Exception as e:
+        answer, error = None, f'{type(e).__name__}: {e}'
+    elapsed = time.perf_counter() - start
+
+    return CheckResult(
+        key=check.key,
+        answer=answer,
+        expected=expected,
+        elapsed=elapsed,
+        budget=budget,
+        error=error,
+    )
+
+
+def _run_check_worker(
+    conn: Connection,
+    check: Check,
+    expected: Optional[Any],
+    budget: float,
+):
+    conn.send(run_check(check=check, expected=expected, budget=budget))
+    conn.close()
+
+
+def run_checks(
+    checks: List[Check],
+    expected: Dict[str, Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    budget_scale: float = 1.0,
+) -> List[CheckResult]:
+    """Runs every check in its own process, which is killed once the check
+    exceeds its budget, multiplied by `budget_scale` (it is reported as
+    `SLOW`).
+    """
+    max_workers = max_workers or os.cpu_count()
+    pending = [
+        (
+            check,
+            expected['answers'].get(check.key),
+            budget_scale * expected['budgets'].get(check.day, DEFAULT_BUDGET),
+        )
+        for check in reversed(checks)
+    ]
+
+    results = []
+    running = {}  # connection -> (check, expected, budget, process, start)
+
+    while pending or running:
+        while pending and len(running) < max_workers:
+            check, check_expected, budget = pending.pop()
+            conn, child_conn = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_run_check_worker,
+                args=(child_conn, check, check_expected, budget),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            running[conn] = (
+                check, check_expected, budget, process, time.perf_counter(),
+            )
+
+        deadline = min(
+            start + budget + TIMEOUT_GRACE
+            for _, _, budget, _, start in running.values()
+        )
+        ready = wait(
+            list(running),
+            timeout=max(deadline - time.perf_counter(), 0),
+        )
+
+        now = time.perf_counter()
+        for conn in list(running):
+            check, check_expected, budget, process, start = running[conn]
+
+            if conn in ready:
+                try:
+                    result = conn.recv()
+                except EOFError:
+                    result = CheckResult(
+                        key=check.key,
+                        answer=None,
+                        expected=check_expected,
+                        elapsed=now - start,
+                        budget=budget,
+                        error=f'Worker exited with code {process.exitcode}',
+                    )
+            elif now >= start + budget + TIMEOUT_GRACE:
+                process.kill()
+                result = CheckResult(
+                    key=check.key,
+                    answer=None,
+                    expected=check_expected,
+                    elapsed=now - start,
+                    budget=budget,
+                    timed_out=True,
+                )
+            else:
+                continue
+
+            process.join()
+            conn.close()
+            del running[conn]
+            results.append(result)
+
+    return sorted(results, key=lambda r: r.key)
+
+
+def format_result(result: CheckResult) -> str:
+    if result.status == 'ERROR':
+        details = result.error
+    elif result.status == 'FAIL':
+        details = f'{result.answer!r} != expected {result.expected!r}'
+    elif result.timed_out:
+        details = 'killed after exceeding the budget'
+    else:
+        details = repr(result.answer)
+
+    return (
+        f'{result.status:7} {result.key}: {details} '
+        f'[{result.elapsed:.3f}s / {result.budget:.1f}s]'
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--days', nargs='+', help='e.g. day01 day15')
+    parser.add_argument(
+        '--parts', nargs='+', type=int, choices=PARTS, default=PARTS,
+    )
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--expected', default=EXPECTED_FILE)
+    parser.add_argument(
+        '--budget-scale', type=float, default=1.0,
+        help='Multiply the time budgets, e.g. on slower hosts',
+    )
+    parser.add_argument(
+        '--no-examples', action='store_true',
+        help='Only check the input files',
+    )
+    parser.add_argument(
+        '--record', action='store_true',
+        help='Store answers of inputs without an expected answer',
+    )
+    args = parser.parse_args(argv)
+
+    expected = load_expected(path=args.expected)
+    checks = get_checks(
+        tasks=get_tasks(days=args.days, parts=args.parts),
+        examples=not args.no_examples,
+    )
+
+    results = run_checks(
+        checks=checks,
+        expected=expected,
+        max_workers=args.workers,
+        budget_scale=args.budget_scale,
+    )
+
+    for result in results:
+        print(format_result(result))
+
+    statuses = [result.status for result in results]
+    print('-------')
+    print(', '.join(
+        f'{status}: {statuses.count(status)}'
+        for status in ('OK', 'FAIL', 'SLOW', 'ERROR', 'UNKNOWN')
+    ))
+
+    if args.record:
+        expected['answers'].update(
+            (result.key, result.answer)
+            for result in results
+            if result.status == 'UNKNOWN'
+        )
+        save_expected(expected=expected, path=args.expected)
+
+    return 1 if any(s in ('FAIL', 'SLOW', 'ERROR') for s in statuses) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Structured results of solving both parts of a day on one input
+
+`solve_module(module, path, parts=None) -> Result` solves the parts of any
+`dayNN/main.py` module, so answers, timings and memory can be collected
+without parsing what `main()` prints.
+"""
+import os
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence
+
+from aoc.days import PARTS
+from aoc.lazy import lazy_import
+
+# Only needed once memory is traced
+tracemalloc = lazy_import('tracemalloc')
+
+
+class Result(NamedTuple):
+    input_file: str
+    input_size: int  # bytes
+    answers: Dict[int, Any]
+    elapsed: Dict[int, float]  # seconds
+    peak_memory: Dict[int, Optional[int]]  # bytes, `None` if not traced
+
+
+def solve_parts(
+    path: str,
+    solvers: Dict[int, Callable[[str], Any]],
+    parts: Optional[Sequence[int]] = None,
+    trace_memory: bool = True,
+) -> Result:
+    """Solves the given parts (all by default) one after the other.
+
+    Memory is traced with `tracemalloc`, which slows down allocation-heavy
+    solvers - the elapsed times include that overhead unless `trace_memory`
+    is disabled.
+    """
+    answers, elapsed, peak_memory = {}, {}, {}
+
+    for part in (parts or sorted(solvers)):
+        if trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        try:
+            answers[part] = solvers[part](path)
+            elapsed[part] = time.perf_counter() - start
+            peak_memory[part] = (
+                tracemalloc.get_traced_memory()[1] if trace_memory else None
+            )
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+
+    return Result(
+        input_file=path,
+        input_size=os.path.getsize(path),
+        answers=answers,
+        elapsed=elapsed,
+        peak_memory=peak_memory,
+    )
+
+
+def solve_module(
+    module: ModuleType,
+    path: str,
+    parts: Optional[Sequence[int]] = None,
+    trace_memory: bool = True,
+) -> Result:
+    """Solves the given parts (all by default) of a day module, using its
+    `solve_part_<part>` functions (see `solve_parts`).
+    """
+    solvers = {
+        part: getattr(module, f'solve_part_{part}')
+        for part in PARTS
+        if hasattr(module, f'solve_part_{part}')
+    }
+    return solve_parts(
+        path=path,
+        solvers=solvers,
+        parts=parts,
+        trace_memory=trace_memory,
+    )
@@ -0,0 +1,278 @@
+"""Runs all solver parts in parallel using a process pool
+
+Usage (from the repository root):
+
+    python -m aoc.runner
+    python -m aoc.runner --days day15 day20 --workers 4
+    python -m aoc.runner --no-cache
+    python -m aoc.runner --profile profiles/
+    python -m aoc.runner --days day11 --inputs /tmp/day11-*.txt --json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from aoc.cache import DEFAULT_CACHE_DIR, ResultCache, make_key
+from aoc.days import (
+    PARTS, find_days, get_input_files, get_input_params, load_module,
+)
+from aoc.profiling import PROFILE_ENV_VAR, profile_part, save_report
+from aoc.results import solve_module
+
+
+class PartTask(NamedTuple):
+    day: str
+    part: int
+    input_file: str
+
+
+class PartResult(NamedTuple):
+    day: str
+    part: int
+    input_file: str
+    answer: Any
+    elapsed: float  # seconds of solving, `0.0` if cached
+    error: Optional[str] = None
+    cached: bool = False
+    lookup_elapsed: Optional[float] = None  # seconds, only if caching
+    input_size: Optional[int] = None  # bytes
+    peak_memory: Optional[int] = None  # bytes, only if traced
+
+
+def get_tasks(
+    days: Optional[Sequence[str]] = None,
+    parts: Sequence[int] = PARTS,
+    input_files: Optional[Sequence[str]] = None,
+) -> List[PartTask]:
+    """Tasks for the `INPUT_FILES` of the days, unless inputs are given."""
+    return [
+        PartTask(day=day.name, part=part, input_file=input_file)
+        for day in find_days(names=days)
+        for part in parts
+        for input_file in (
+            [os.path.abspath(path) for path in input_files]
+            if input_files else get_input_files(day=day, part=part)
+        )
+    ]
+
+
+def run_part(
+    task: PartTask,
+    cache_dir: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    trace_memory: bool = False,
+) -> PartResult:
+    """Solves a single part on a single input (executed in a worker)."""
+    day, = find_days(names=[task.day])
+
+    try:
+        input_size = os.path.getsize(task.input_file)
+
+        # Hashing large inputs takes time - it is not part of the solve
+        lookup_start = time.perf_counter()
+        if cache_dir is not None:
+            cache = ResultCache(directory=cache_dir)
+            key = make_key(
+                input_file=task.input_file,
+                solver_file=day.path,
+                part=task.part,
+                params=get_input_params(day=day, path=task.input_file),
+            )
+    except Exception as e:
+        # E.g. a mistyped `--inputs` path or a broken day module, which only
+        # fails this part
+        return PartResult(
+            day=task.day,
+            part=task.part,
+            input_file=task.input_file,
+            answer=None,
+            elapsed=0.0,
+            error=f'{type(e).__name__}: {e}',
+        )
+
+    lookup_elapsed = None
+    if cache_dir is not None:
+        found, answer = cache.lookup(key)
+        lookup_elapsed = time.perf_counter() - lookup_start
+
+        if found:
+            return PartResult(
+                day=task.day,
+                part=task.part,
+                input_file=task.input_file,
+                answer=answer,
+                elapsed=0.0,
+                cached=True,
+                lookup_elapsed=lookup_elapsed,
+                input_size=input_size,
+            )
+
+    start = time.perf_counter()
+    try:
+        if profile_dir is not None:
+            # The profiled run is the solve, its answer and time are reported
+            report = profile_part(
+                day=day,
+                part=task.part,
+                input_file=task.input_file,
+            )
+            save_report(report=report, directory=profile_dir)
+
+            answer, peak_memory = report['answer'], report['peak_memory']
+            elapsed = report['elapsed']
+        else:
+            # Importing the day is not part of the solve
+            module = load_module(day)
+            start = time.perf_counter()
+
+            # Solvers print debug information - keep the runner output clean
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = solve_module(
+                    module=module,
+                    path=task.input_file,
+                    parts=[task.part],
+                    trace_memory=trace_memory,
+                )
+            answer = result.answers[task.part]
+            elapsed = result.elapsed[task.part]
+            peak_memory = result.peak_memory[task.part]
+        error = None
+    except Exception as e:
+        answer, peak_memory, error = None, None, f'{type(e).__name__}: {e}'
+        elapsed = time.perf_counter() - start
+
+    if cache_dir is not None and error is None:
+        cache.put(key, answer)
+
+    return PartResult(
+        day=task.day,
+        part=task.part,
+        input_file=task.input_file,
+        answer=answer,
+        elapsed=elapsed,
+        error=error,
+        lookup_elapsed=lookup_elapsed,
+        input_size=input_size,
+        peak_memory=peak_memory,
+    )
+
+
+def run_tasks(
+    tasks: List[PartTask],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    trace_memory: bool = False,
+) -> List[PartResult]:
+    results = []
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as ex:
+        futures = [
+            ex.submit(run_part, task, cache_dir, profile_dir, trace_memory)
+            for task in tasks
+        ]
+
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    return sorted(results, key=lambda r: (r.day, r.part, r.input_file))
+
+
+def format_result(result: PartResult) -> str:
+    input_file = os.path.relpath(result.input_file)
+    value = result.answer if result.error is None else f'ERROR {result.error}'
+    cached = ', cached' if result.cached else ''
+
+    return (
+        f'{result.day} (Part {result.part}) {input_file}: '
+        f'{value} [{result.elapsed:.3f}s{cached}]'
+    )
+
+
+def format_json(result: PartResult) -> str:
+    return json.dumps({
+        **result._asdict(),
+        'input_file': os.path.relpath(result.input_file),
+    })
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--days', nargs='+', help='e.g. day01 day15')
+    parser.add_argument(
+        '--parts', nargs='+', type=int, choices=PARTS, default=PARTS,
+    )
+    parser.add_argument(
+        '--inputs', nargs='+',
+        help='Solve these files instead of the declared inputs of the days',
+    )
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument(
+        '--profile', default=os.environ.get(PROFILE_ENV_VAR),
+        help=f'Directory for profiling reports (also: ${PROFILE_ENV_VAR})',
+    )
+    parser.add_argument(
+        '--memory', action='store_true',
+        help='Trace peak memory of every part (slows down the solvers)',
+    )
+    parser.add_argument(
+        '--json', action='store_true',
+        help='Print results as JSON Lines (one object per part and input)',
+    )
+    args = parser.parse_args(argv)
+
+    # Profiling and tracing memory imply solving, so the cache is bypassed
+    bypass_cache = args.no_cache or args.profile or args.memory
+    cache_dir = None if bypass_cache else args.cache_dir
+    tasks = get_tasks(
+        days=args.days,
+        parts=args.parts,
+        input_files=args.inputs,
+    )
+
+    start = time.perf_counter()
+    results = run_tasks(
+        tasks=tasks,
+        max_workers=args.workers,
+        cache_dir=cache_dir,
+        profile_dir=args.profile,
+        trace_memory=args.memory,
+    )
+    elapsed = time.perf_counter() - start
+
+    if cache_dir is not None:
+        ResultCache(directory=cache_dir).evict()
+
+    has_errors = any(r.error is not None for r in results)
+
+    if args.json:
+        for result in results:
+            print(format_json(result))
+        return 1 if has_errors else 0
+
+    for result in results:
+        print(format_result(result))
+
+    print('-------')
+    print(
+        f'Solved {len(results)} parts in {elapsed:.3f}s '
+        f'(sum of part times: {sum(r.elapsed for r in results):.3f}s)'
+    )
+
+    if cache_dir is not None:
+        num_hits = sum(r.cached for r in results)
+        print(f'Cache hits: {num_hits}, misses: {len(results) - num_hits}')
+
+    return 1 if has_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
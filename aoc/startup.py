@@ -0,0 +1,128 @@
+"""Measures interpreter startup and import cost of every day
+
+Each day module is imported in a fresh interpreter started with
+`-X importtime`. Usage (from the repository root):
+
+    python -m aoc.startup
+    python -m aoc.startup --days day20 --repeats 10 --save startup.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from aoc.days import Day, find_days
+
+
+class ImportEntry(NamedTuple):
+    name: str
+    depth: int
+    self_time: int  # microseconds
+    cumulative_time: int  # microseconds
+
+
+class StartupProfile(NamedTuple):
+    day: str
+    import_time: int  # microseconds (cumulative for the day module)
+    wall_time: float  # seconds (whole interpreter run)
+    direct_imports: Dict[str, int]
+
+
+def parse_importtime(output: str) -> List[ImportEntry]:
+    entries = []
+
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        self_time, cumulative_time, name = (
+            line[len('import time:'):].split('|')
+        )
+        stripped_name = name.lstrip(' ')
+
+        entries.append(ImportEntry(
+            name=stripped_name,
+            # The name is indented by 2 spaces per nesting level
+            depth=(len(name) - len(stripped_name) - 1) // 2,
+            self_time=int(self_time),
+            cumulative_time=int(cumulative_time),
+        ))
+
+    return entries
+
+
+def profile_day(day: Day, module: str = 'main') -> StartupProfile:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=day.directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_time = time.perf_counter() - start
+
+    # Nested imports are reported before the module importing them
+    direct_imports = {}
+    for entry in parse_importtime(output=proc.stderr):
+        if entry.depth == 1:
+            direct_imports[entry.name] = entry.cumulative_time
+        elif entry.depth == 0 and entry.name != module:
+            direct_imports = {}
+        elif entry.depth == 0:
+            return StartupProfile(
+                day=day.name,
+                import_time=entry.cumulative_time,
+                wall_time=wall_time,
+                direct_imports=direct_imports,
+            )
+
+    raise RuntimeError(
+        f'Module `{module}` not found in `-X importtime` output'
+    )
+
+
+def format_profile(profile: StartupProfile, top: int = 3) -> str:
+    slowest = sorted(
+        profile.direct_imports.items(),
+        key=lambda v: v[1],
+        reverse=True,
+    )[:top]
+
+    return (
+        f'{profile.day}: import {profile.import_time / 1000:.2f}ms, '
+        f'process {profile.wall_time * 1000:.1f}ms | '
+        + ', '.join(f'{name} {t / 1000:.2f}ms' for name, t in slowest)
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--days', nargs='+', help='e.g. day01 day20')
+    parser.add_argument(
+        '--repeats', type=int, default=5,
+        help='The fastest run out of the repeats is reported',
+    )
+    parser.add_argument('--save', help='Write the profiles as JSON')
+    args = parser.parse_args(argv)
+
+    profiles = []
+    for day in find_days(names=args.days):
+        profile = min(
+            (profile_day(day=day) for _ in range(args.repeats)),
+            key=lambda p: p.import_time,
+        )
+        print(format_profile(profile))
+        profiles.append(profile)
+
+    if args.save:
+        with open(args.save, 'w') as fout:
+            json.dump([p._asdict() for p in profiles], fout, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
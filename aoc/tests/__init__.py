@@ -0,0 +1,23 @@
+"""Behavior tests of the solver building blocks (answers of whole inputs are
+checked by `aoc.regression`)"""
+import atexit
+import os
+import tempfile
+from types import ModuleType
+
+from aoc.days import find_days, load_module
+
+
+def load_day(name: str) -> ModuleType:
+    day, = find_days(names=[name])
+    return load_module(day)
+
+
+def write_input(content: str) -> str:
+    """Writes `content` to a temporary input file (removed at exit)."""
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'w') as fout:
+        fout.write(content)
+
+    atexit.register(os.remove, path)
+    return path
@@ -0,0 +1,62 @@
+import random
+import unittest
+from itertools import combinations
+
+from aoc.tests import load_day
+
+day01 = load_day('day01')
+
+
+def brute_force_k_sums(values, k, const):
+    return sorted({
+        entries
+        for entries in combinations(sorted(values), k)
+        if sum(entries) == const
+    })
+
+
+class IterKSumsTest(unittest.TestCase):
+    def test_example(self):
+        values = [1721, 979, 366, 299, 675, 1456]
+        self.assertEqual(list(day01.iter_k_sums(values, k=2)), [(299, 1721)])
+        self.assertEqual(
+            list(day01.iter_k_sums(values, k=3)),
+            [(366, 675, 979)],
+        )
+
+    def test_duplicates_are_used_once(self):
+        self.assertEqual(list(day01.iter_k_sums([1010], k=2)), [])
+        self.assertEqual(
+            list(day01.iter_k_sums([1010, 1010, 1010], k=2)),
+            [(1010, 1010)],
+        )
+
+    def test_negative_values(self):
+        self.assertEqual(
+            list(day01.iter_k_sums([-5, 3, 2, 0, 7, -2], k=3, const=0)),
+            [(-5, -2, 7), (-5, 2, 3), (-2, 0, 2)],
+        )
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            values = [rng.randint(-20, 20) for _ in range(rng.randint(0, 12))]
+            k = rng.randint(1, 4)
+            const = rng.randint(-30, 30)
+
+            self.assertEqual(
+                sorted(day01.iter_k_sums(values, k=k, const=const)),
+                brute_force_k_sums(values, k=k, const=const),
+            )
+
+    def test_invalid_k(self):
+        with self.assertRaises(ValueError):
+            list(day01.iter_k_sums([1, 2], k=0))
+
+    def test_find_k_sum_without_match(self):
+        with self.assertRaises(ValueError):
+            day01.find_k_sum([1, 2, 3], k=2, const=100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import importlib.util
+import random
+import string
+import unittest
+
+from aoc.tests import load_day, write_input
+
+day02 = load_day('day02')
+
+
+@unittest.skipUnless(importlib.util.find_spec('numpy'), 'requires numpy')
+class ValidateBatchTest(unittest.TestCase):
+    def validate(self, content: str):
+        return day02.validate_batch(
+            columns=day02.load_columns(path=write_input(content)),
+            return_masks=True,
+        )
+
+    def test_example(self):
+        validation = self.validate(
+            '1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc'
+        )
+        self.assertEqual(validation.num_valid_range, 2)
+        self.assertEqual(validation.num_valid_position, 1)
+        self.assertEqual(validation.range_mask.tolist(), [True, False, True])
+        self.assertEqual(
+            validation.position_mask.tolist(),
+            [True, False, False],
+        )
+
+    def test_positions_out_of_range_match_nothing(self):
+        validation = self.validate('1-12 a: abc\n10-11 a: aa\n')
+        self.assertEqual(validation.position_mask.tolist(), [True, False])
+
+    def test_matches_row_checks(self):
+        rng = random.Random(0)
+        rows = []
+        for _ in range(500):
+            password = ''.join(
+                rng.choice(string.ascii_lowercase[:3])
+                for _ in range(rng.randint(1, 25))
+            )
+            min_val = rng.randint(1, len(password))
+            max_val = rng.randint(min_val, len(password))
+            rows.append(day02.InputRow(
+                min=min_val,
+                max=max_val,
+                character=rng.choice('abc'),
+                password=password,
+            ))
+
+        validation = self.validate('\n'.join(
+            f'{row.min}-{row.max} {row.character}: {row.password}'
+            for row in rows
+        ))
+
+        self.assertEqual(validation.range_mask.tolist(), [
+            day02.is_valid_password_range(
+                password=row.password,
+                character=row.character,
+                min_occurrences=row.min,
+                max_occurrences=row.max,
+            )
+            for row in rows
+        ])
+        self.assertEqual(validation.position_mask.tolist(), [
+            day02.is_valid_password_position(
+                password=row.password,
+                character=row.character,
+                first_position=row.min,
+                second_position=row.max,
+            )
+            for row in rows
+        ])
+
+    def test_malformed_rows(self):
+        with self.assertRaises(ValueError):
+            self.validate('1-3 a abcde\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
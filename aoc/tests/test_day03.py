@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from aoc.tests import load_day, write_input
+
+day03 = load_day('day03')
+
+
+class CountTreesOnPathsTest(unittest.TestCase):
+    def write_map(self, rows) -> str:
+        return write_input('\n'.join(rows) + '\n')
+
+    def test_matches_row_walk(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            width, height = rng.randint(1, 40), rng.randint(1, 80)
+            rows = [
+                ''.join(rng.choice('#.') for _ in range(width))
+                for _ in range(height)
+            ]
+            slopes = [
+                (rng.randint(0, 2 * width), rng.randint(1, 4))
+                for _ in range(5)
+            ]
+
+            tree_map = day03.parse_tree_map(path=self.write_map(rows))
+            self.assertEqual(
+                day03.count_trees_on_paths(tree_map=tree_map, slopes=slopes),
+                [
+                    day03.count_trees_on_path(rows, right=right, down=down)
+                    for right, down in slopes
+                ],
+            )
+
+    def test_non_rectangular_maps(self):
+        for rows in (['..#', '#', '..#.'], ['...', '.', '.....']):
+            with self.assertRaisesRegex(ValueError, 'differ in width'):
+                day03.parse_tree_map(path=self.write_map(rows))
+
+    def test_empty_map(self):
+        for rows in ([], ['']):
+            tree_map = day03.parse_tree_map(path=self.write_map(rows))
+            self.assertEqual(tree_map, day03.TreeMap(0, 0, []))
+            self.assertEqual(
+                day03.count_trees_on_paths(
+                    tree_map=tree_map,
+                    slopes=day03.ALL_SLOPES,
+                ),
+                [0] * len(day03.ALL_SLOPES),
+            )
+
+    def test_slope_must_go_down(self):
+        tree_map = day03.parse_tree_map(path=self.write_map(['.#', '#.']))
+        with self.assertRaises(ValueError):
+            day03.count_trees_on_paths(tree_map=tree_map, slopes=[(1, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
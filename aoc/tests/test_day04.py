@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from aoc.generators import generate_passports
+from aoc.tests import load_day, write_input
+
+day04 = load_day('day04')
+
+VALID_FIELDS = {
+    'pid': '087499704', 'hgt': '74in', 'ecl': 'grn', 'iyr': '2012',
+    'eyr': '2030', 'byr': '1980', 'hcl': '#623a2f',
+}
+
+
+class CompiledRulesTest(unittest.TestCase):
+    def test_values(self):
+        cases = [
+            ('byr', '2002', True), ('byr', '2003', False),
+            ('byr', '02002', False), ('hgt', '60in', True),
+            ('hgt', '190cm', True), ('hgt', '190in', False),
+            ('hgt', '190', False), ('hcl', '#123abc', True),
+            ('hcl', '#123abz', False), ('hcl', '123abc', False),
+            ('ecl', 'brn', True), ('ecl', 'wat', False),
+            ('pid', '000000001', True), ('pid', '0123456789', False),
+            ('pid', '12345678a', False),
+        ]
+        for field, value, valid in cases:
+            with self.subTest(field=field, value=value):
+                self.assertEqual(
+                    bool(day04.COMPILED_RULES[field](value)),
+                    valid,
+                )
+
+    def test_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            day04.compile_rule(kind='color', argument=None)
+
+
+class ValidateRecordsTest(unittest.TestCase):
+    def test_rejection_reasons(self):
+        records = [
+            {**VALID_FIELDS, 'cid': '100'},
+            {k: v for k, v in VALID_FIELDS.items() if k not in ('byr', 'hgt')},
+            {**VALID_FIELDS, 'hgt': '190in', 'byr': '1900'},
+            {**VALID_FIELDS, 'pid': '1'},
+        ]
+        path = write_input('\n\n'.join(
+            '\n'.join(f'{k}:{v}' for k, v in record.items())
+            for record in records
+        ))
+
+        self.assertEqual(
+            day04.validate_records(path=path),
+            day04.ValidationReport(
+                num_complete=3,
+                num_valid=1,
+                rejections={'missing byr': 1, 'hgt': 1, 'pid': 1},
+            ),
+        )
+
+    def test_matches_per_passport_checks(self):
+        path = write_input(
+            generate_passports(size=500, rng=random.Random(0))
+        )
+        passports = day04.parse_file(path=path)
+        complete = [p for p in passports if day04.has_all_required_keys(p)]
+
+        report = day04.validate_records(path=path)
+        self.assertEqual(report.num_complete, len(complete))
+        self.assertEqual(
+            report.num_valid,
+            sum(day04.is_valid_passport(p) for p in complete),
+        )
+        self.assertEqual(
+            sum(report.rejections.values()),
+            len(passports) - report.num_valid,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
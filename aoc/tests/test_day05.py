@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from aoc.generators import generate_boarding_passes
+from aoc.tests import load_day, write_input
+
+day05 = load_day('day05')
+
+
+class SeatIdsTest(unittest.TestCase):
+    def test_parse_seat_id(self):
+        self.assertEqual(day05.parse_seat_id('FBFBBFFRLR'), 357)
+        self.assertEqual(day05.parse_seat_id('BBFFBBFRLL'), 820)
+
+    def test_bulk_decoding_matches_single_passes(self):
+        content = generate_boarding_passes(size=3000, rng=random.Random(0))
+
+        # Small chunks split the input at many places
+        seat_ids = list(day05.iter_seat_ids(
+            path=write_input(content),
+            chunk_size=100,
+        ))
+
+        self.assertEqual(
+            seat_ids,
+            [day05.parse_seat_id(line) for line in content.split('\n')],
+        )
+
+
+class GetMySeatIdTest(unittest.TestCase):
+    def test_duplicates(self):
+        self.assertEqual(day05.get_my_seat_id([10, 12, 11, 14, 10, 14]), 13)
+
+    def test_seats_out_of_range(self):
+        for seat_id in (-1, day05.NUM_SEATS):
+            with self.assertRaisesRegex(ValueError, 'out of range'):
+                day05.get_my_seat_id([10, 12, seat_id])
+
+    def test_not_one_free_seat(self):
+        for seat_ids in ([], [10, 11, 12], [10, 13]):
+            with self.assertRaises(ValueError):
+                day05.get_my_seat_id(seat_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
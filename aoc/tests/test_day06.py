@@ -0,0 +1,64 @@
+import random
+import string
+import unittest
+
+from aoc.tests import load_day, write_input
+
+day06 = load_day('day06')
+
+
+def random_groups(rng: random.Random, num_groups: int):
+    return [
+        [
+            ''.join(rng.sample(string.ascii_lowercase, rng.randint(1, 26)))
+            for _ in range(rng.randint(1, 5))
+        ]
+        for _ in range(num_groups)
+    ]
+
+
+class AnswerMasksTest(unittest.TestCase):
+    def test_get_answer_mask(self):
+        self.assertEqual(day06.get_answer_mask(b''), 0)
+        self.assertEqual(day06.get_answer_mask(b'abz'), 0b11 | 1 << 25)
+        # Repeated answers and newlines do not change the mask
+        self.assertEqual(day06.get_answer_mask(b'ba\nab\n'), 0b11)
+        self.assertEqual(
+            day06.get_answer_mask(string.ascii_lowercase.encode()),
+            day06.ALL_ANSWERS,
+        )
+        self.assertEqual(day06.count_answers(day06.ALL_ANSWERS), 26)
+
+    def test_counts_match_sets(self):
+        groups = random_groups(rng=random.Random(0), num_groups=300)
+
+        self.assertEqual(
+            day06.count_any_answer(groups),
+            sum(len(set(''.join(group))) for group in groups),
+        )
+        self.assertEqual(
+            day06.count_all_answer(groups),
+            sum(len(set.intersection(*map(set, group))) for group in groups),
+        )
+
+    def test_streamed_masks_match_counts(self):
+        groups = random_groups(rng=random.Random(1), num_groups=300)
+
+        path = write_input('\n\n'.join('\n'.join(g) for g in groups) + '\n')
+
+        any_masks = list(day06.iter_any_masks(path=path))
+        all_masks = list(day06.iter_all_masks(path=path))
+
+        self.assertEqual(len(any_masks), len(groups))
+        self.assertEqual(
+            sum(map(day06.count_answers, any_masks)),
+            day06.count_any_answer(groups),
+        )
+        self.assertEqual(
+            sum(map(day06.count_answers, all_masks)),
+            day06.count_all_answer(groups),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
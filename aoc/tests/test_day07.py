@@ -0,0 +1,98 @@
+import random
+import unittest
+from graphlib import CycleError
+
+from aoc.tests import load_day
+
+day07 = load_day('day07')
+
+
+def make_rules(contents):
+    return [
+        {
+            'parent': parent,
+            'inner': [{'num': num, 'color': color} for color, num in inner],
+        }
+        for parent, inner in contents.items()
+    ]
+
+
+def brute_force_containing(contents, color):
+    def contains(outer):
+        return any(
+            inner == color or contains(inner)
+            for inner, _ in contents.get(outer, [])
+        )
+
+    return frozenset(outer for outer in contents if contains(outer))
+
+
+def brute_force_inside(contents, color):
+    return sum(
+        num * (1 + brute_force_inside(contents, inner))
+        for inner, num in contents.get(color, [])
+    )
+
+
+class BagGraphTest(unittest.TestCase):
+    def test_example(self):
+        graph = day07.BagGraph(make_rules({
+            'shiny gold': [('dark red', 2)],
+            'dark red': [('dark orange', 2)],
+            'dark orange': [('dark yellow', 2)],
+            'dark yellow': [],
+            'bright white': [('shiny gold', 1)],
+        }))
+
+        self.assertEqual(graph.get_num_bags_inside('shiny gold'), 14)
+        self.assertEqual(
+            graph.get_bags_containing('shiny gold'),
+            {'bright white'},
+        )
+        # Colors without a rule of their own
+        self.assertEqual(graph.get_num_bags_inside('faded blue'), 0)
+        self.assertEqual(graph.get_bags_containing('faded blue'), set())
+
+    def test_matches_recursion(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            colors = [f'color {i}' for i in range(30)]
+            # Bags only contain bags further in the list (no cycles)
+            contents = {
+                color: [
+                    (inner, rng.randint(1, 4))
+                    for inner in rng.sample(
+                        colors[idx + 1:],
+                        min(len(colors) - idx - 1, rng.randint(0, 3)),
+                    )
+                ]
+                for idx, color in enumerate(colors)
+            }
+            graph = day07.BagGraph(make_rules(contents))
+
+            for color in colors:
+                self.assertEqual(
+                    graph.get_num_bags_inside(color),
+                    brute_force_inside(contents, color),
+                )
+                self.assertEqual(
+                    graph.get_bags_containing(color),
+                    brute_force_containing(contents, color),
+                )
+
+    def test_recursive_rules(self):
+        graph = day07.BagGraph(make_rules({
+            'shiny gold': [('dark red', 1)],
+            'dark red': [('shiny gold', 1)],
+        }))
+
+        self.assertEqual(
+            graph.get_bags_containing('shiny gold'),
+            {'shiny gold', 'dark red'},
+        )
+        with self.assertRaises(CycleError):
+            graph.get_num_bags_inside('shiny gold')
+
+
+if __name__ == '__main__':
+    unittest.main()
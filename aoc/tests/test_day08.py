@@ -0,0 +1,134 @@
+import random
+import unittest
+
+from aoc.tests import load_day
+
+day08 = load_day('day08')
+
+Instruction = day08.Instruction
+
+EXAMPLE = [
+    Instruction('nop', +0), Instruction('acc', +1), Instruction('jmp', +4),
+    Instruction('acc', +3), Instruction('jmp', -3), Instruction('acc', -99),
+    Instruction('acc', +1), Instruction('jmp', -4), Instruction('acc', +6),
+]
+
+
+def make_vm(instructions) -> 'day08.VM':
+    return day08.VM(program=day08.compile_program(instructions))
+
+
+class VMTest(unittest.TestCase):
+    def test_loop(self):
+        vm = make_vm(EXAMPLE)
+        self.assertEqual(
+            list(vm.trace()),
+            [(0, 0), (1, 0), (2, 1), (6, 1), (7, 2), (3, 2), (4, 5)],
+        )
+        self.assertTrue(vm.in_loop)
+        self.assertFalse(vm.terminated)
+        self.assertEqual(vm.acc, 5)
+
+        vm = make_vm(EXAMPLE)
+        self.assertFalse(vm.run())
+        self.assertEqual((vm.pc, vm.acc), (1, 5))
+
+    def test_termination(self):
+        instructions = [Instruction('acc', +2), Instruction('jmp', +1)]
+
+        vm = make_vm(instructions)
+        self.assertEqual(list(vm.trace()), [(0, 0), (1, 2)])
+        self.assertTrue(vm.terminated)
+        self.assertFalse(vm.in_loop)
+
+        vm = make_vm(instructions)
+        self.assertTrue(vm.run())
+        with self.assertRaises(RuntimeError):
+            vm.step()
+
+    def test_jumps_outside_of_the_program(self):
+        for argument in (+5, -1):
+            instructions = [Instruction('jmp', argument)]
+
+            with self.subTest(argument=argument):
+                with self.assertRaisesRegex(RuntimeError, 'outside'):
+                    list(make_vm(instructions).trace())
+                with self.assertRaisesRegex(RuntimeError, 'outside'):
+                    make_vm(instructions).run()
+                with self.assertRaisesRegex(RuntimeError, 'outside'):
+                    day08.execute_code(instructions)
+
+                vm = make_vm(instructions)
+                vm.step()
+                self.assertFalse(vm.in_loop)
+                self.assertFalse(vm.terminated)
+
+    def test_unknown_instruction(self):
+        with self.assertRaises(ValueError):
+            day08.compile_program([Instruction('hlt', 0)])
+
+
+def brute_force_repairs(instructions):
+    """Accumulators of all programs with a `nop` / `jmp` flipped which
+    terminate, by the flipped index."""
+    repairs = {}
+    for idx, ins in enumerate(instructions):
+        if ins.opcode == 'acc':
+            continue
+
+        patched = list(instructions)
+        patched[idx] = ins._replace(
+            opcode='jmp' if ins.opcode == 'nop' else 'nop',
+        )
+
+        vm = make_vm(patched)
+        try:
+            if vm.run():
+                repairs[idx] = vm.acc
+        except RuntimeError:
+            pass
+
+    return repairs
+
+
+class RepairProgramTest(unittest.TestCase):
+    def test_example(self):
+        repair = day08.repair_program(day08.compile_program(EXAMPLE))
+        self.assertEqual(repair, day08.Repair(index=7, acc=8))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        num_repaired = 0
+
+        while num_repaired < 200:
+            size = rng.randint(1, 15)
+            instructions = [
+                Instruction(
+                    rng.choice(('nop', 'acc', 'jmp')),
+                    rng.randint(-size, size),
+                )
+                for _ in range(size)
+            ]
+
+            # Only looping programs need a repair
+            try:
+                if make_vm(instructions).run():
+                    continue
+            except RuntimeError:
+                continue
+
+            program = day08.compile_program(instructions)
+            repairs = brute_force_repairs(instructions)
+            if not repairs:
+                with self.assertRaises(RuntimeError):
+                    day08.repair_program(program)
+                continue
+
+            repair = day08.repair_program(program)
+            self.assertIn(repair.index, repairs)
+            self.assertEqual(repair.acc, repairs[repair.index])
+            num_repaired += 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import random
+import unittest
+from itertools import combinations
+
+from aoc.tests import load_day, write_input
+
+day09 = load_day('day09')
+
+
+def brute_force_invalid(numbers, window):
+    for idx in range(window, len(numbers)):
+        if not any(
+            a + b == numbers[idx] and a != b
+            for a, b in combinations(numbers[idx - window:idx], 2)
+        ):
+            return numbers[idx]
+    return None
+
+
+def brute_force_range(numbers, target, min_size):
+    for stop in range(len(numbers) + 1):
+        for start in range(stop - min_size + 1):
+            if sum(numbers[start:stop]) == target:
+                return start, stop
+    return None
+
+
+class SlidingWindowTest(unittest.TestCase):
+    def test_keeps_the_last_values(self):
+        window = day09.SlidingWindow(size=3)
+        for value in (1, 2, 2, 5):
+            window.push(value)
+
+        self.assertTrue(window.full)
+        self.assertEqual(list(window.values), [2, 2, 5])
+        self.assertEqual(window.counts, {2: 2, 5: 1})
+        self.assertTrue(window.has_pair_sum(7))
+        # The two values of a pair have to differ
+        self.assertFalse(window.has_pair_sum(4))
+        self.assertFalse(window.has_pair_sum(3))
+
+    def test_example(self):
+        numbers = [
+            35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127,
+            219, 299, 277, 309, 576,
+        ]
+        self.assertEqual(day09.find_invalid_number(numbers, window=5), 127)
+
+        path = write_input('\n'.join(map(str, numbers)))
+        self.assertEqual(day09.solve_part_1(path=path, window=5), 127)
+        self.assertEqual(day09.solve_part_2(path=path, window=5), 62)
+
+        # The example is shorter than the puzzle preamble of 25 numbers
+        for solve in (day09.solve_part_1, day09.solve_part_2):
+            with self.assertRaisesRegex(ValueError, 'window 25'):
+                solve(path=path)
+
+    def test_window_sizes(self):
+        day_dir = os.path.dirname(day09.__file__)
+        self.assertEqual(
+            day09.get_window_size(os.path.join(day_dir, 'data/example.txt')),
+            5,
+        )
+        # Only the declared example has a shorter preamble
+        for path in (
+            os.path.join(day_dir, 'data/input.txt'),
+            os.path.join(os.path.dirname(day_dir), 'example.txt'),
+        ):
+            self.assertEqual(
+                day09.get_window_size(path),
+                day09.PREAMBLE_SIZE,
+            )
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            window = rng.randint(2, 6)
+            numbers = [rng.randint(-10, 10) for _ in range(rng.randint(0, 30))]
+
+            self.assertEqual(
+                day09.find_invalid_number(iter(numbers), window=window),
+                brute_force_invalid(numbers, window=window),
+            )
+
+
+class ContiguousRangesTest(unittest.TestCase):
+    def test_two_pointers_match_brute_force(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            numbers = [rng.randint(0, 9) for _ in range(rng.randint(0, 20))]
+            target = rng.randint(0, 40)
+            min_size = rng.randint(1, 4)
+
+            self.assertEqual(
+                day09.find_contiguous_range(
+                    iter(numbers),
+                    target=target,
+                    min_size=min_size,
+                ),
+                brute_force_range(numbers, target=target, min_size=min_size),
+            )
+
+    def test_prefix_sums_match_brute_force(self):
+        rng = random.Random(2)
+        for _ in range(300):
+            numbers = [rng.randint(-9, 9) for _ in range(rng.randint(0, 20))]
+            targets = [rng.randint(-20, 20) for _ in range(rng.randint(1, 4))]
+            min_size = rng.randint(1, 4)
+
+            expected = {
+                target: brute_force_range(
+                    numbers,
+                    target=target,
+                    min_size=min_size,
+                )
+                for target in targets
+            }
+            self.assertEqual(
+                day09.find_contiguous_ranges(
+                    iter(numbers),
+                    targets=targets,
+                    min_size=min_size,
+                ),
+                {t: found for t, found in expected.items() if found},
+            )
+
+    def test_empty_ranges(self):
+        with self.assertRaises(ValueError):
+            day09.RangeFinder(targets=[0], min_size=0)
+
+    def test_stops_once_all_targets_are_found(self):
+        finder = day09.RangeFinder(targets=[3, 5])
+        for number in (1, 2, 3):
+            finder.push(number)
+
+        self.assertTrue(finder.done)
+        self.assertEqual(finder.found, {3: (0, 2), 5: (1, 3)})
+
+
+if __name__ == '__main__':
+    unittest.main()
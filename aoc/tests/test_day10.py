@@ -0,0 +1,122 @@
+import random
+import unittest
+
+from aoc.tests import load_day
+
+day10 = load_day('day10')
+
+
+def brute_force_arrangements(jolts, gaps):
+    """Enumerates every chain from the first to the last jolt."""
+    present = set(jolts)
+
+    def count_from(jolt):
+        if jolt == jolts[-1]:
+            return 1
+        return sum(
+            count_from(jolt + gap)
+            for gap in gaps
+            if jolt + gap in present
+        )
+
+    return count_from(jolts[0])
+
+
+class CountArrangementsTest(unittest.TestCase):
+    def test_long_runs_of_1_jolt(self):
+        # Tribonacci numbers - runs longer than 4 had no table entry
+        self.assertEqual(
+            [day10.count_arrangements(list(range(n))) for n in range(1, 9)],
+            [1, 1, 2, 4, 7, 13, 24, 44],
+        )
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            gaps = rng.sample(range(1, 9), rng.randint(1, 4))
+            jolts = sorted(rng.sample(range(40), rng.randint(1, 25)))
+
+            self.assertEqual(
+                day10.count_arrangements(jolts, gaps=gaps),
+                brute_force_arrangements(jolts, gaps=gaps),
+            )
+
+    def test_gaps_larger_than_4(self):
+        jolts = [0, 5, 7, 10, 12, 15, 17]
+        self.assertEqual(
+            day10.count_arrangements(jolts, gaps=(5, 7)),
+            brute_force_arrangements(jolts, gaps=(5, 7)),
+        )
+        self.assertEqual(day10.count_arrangements(jolts, gaps=(5, 7)), 3)
+        # No chain reaches the last jolt
+        self.assertEqual(day10.count_arrangements(jolts, gaps=(6,)), 0)
+
+    def test_modulus(self):
+        jolts = list(range(200))
+        self.assertEqual(
+            day10.count_arrangements(jolts, modulus=1_000_007),
+            day10.count_arrangements(jolts) % 1_000_007,
+        )
+
+    def test_invalid_inputs(self):
+        for jolts, gaps in [
+            ([0, 2, 1], (1, 2, 3)),
+            ([0, 1, 1], (1, 2, 3)),
+            ([0, 1], ()),
+            ([0, 1], (0, 1)),
+        ]:
+            with self.subTest(jolts=jolts, gaps=gaps):
+                with self.assertRaises(ValueError):
+                    day10.count_arrangements(jolts, gaps=gaps)
+
+
+class BuildAdapterChainTest(unittest.TestCase):
+    def test_example(self):
+        adapters = [16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]
+
+        chain = day10.build_adapter_chain(adapters)
+        self.assertEqual(
+            list(chain.jolts),
+            [0, 1, 4, 5, 6, 7, 10, 11, 12, 15, 16, 19, 22],
+        )
+        self.assertEqual(chain.differences, {1: 7, 3: 5})
+        self.assertEqual(chain.num_arrangements, 8)
+
+        # The differences do not depend on the DP
+        self.assertEqual(
+            day10.build_adapter_chain(adapters, arrangements=False),
+            chain._replace(num_arrangements=None),
+        )
+
+    def test_matches_separate_passes(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            adapters = rng.sample(range(1, 60), rng.randint(1, 30))
+            chain = day10.build_adapter_chain(adapters, modulus=97)
+            jolts = sorted(adapters + [0, max(adapters) + 3])
+
+            self.assertEqual(list(chain.jolts), jolts)
+            self.assertEqual(
+                chain.differences,
+                day10.count_jolt_differences(jolts),
+            )
+            self.assertEqual(
+                chain.num_arrangements,
+                brute_force_arrangements(jolts, gaps=(1, 2, 3)) % 97,
+            )
+
+    def test_iter_arrangements(self):
+        self.assertEqual(
+            list(day10.iter_arrangements([0, 1, 2, 3, 6])),
+            [(0, 1), (1, 1), (2, 2), (3, 4), (6, 4)],
+        )
+
+    def test_invalid_adapters(self):
+        for adapters in ([], [0, 1], [-3, 1], [1, 2, 2]):
+            with self.subTest(adapters=adapters):
+                with self.assertRaises(ValueError):
+                    day10.build_adapter_chain(adapters)
+
+
+if __name__ == '__main__':
+    unittest.main()
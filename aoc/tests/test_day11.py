@@ -0,0 +1,210 @@
+import importlib.util
+import random
+import unittest
+
+from aoc.generators import _SeatBoard
+from aoc.tests import load_day
+
+day11 = load_day('day11')
+
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+# Layouts alternating between two states with the given neighbors and
+# tolerance, starting from empty seats
+OSCILLATING = [
+    (['.LL.', 'LLLL', 'LLLL', 'LLLL', '.LL.'], False, 4),
+    (['.LL.', 'L.LL', 'LLLL', '.LL.'], True, 4),
+]
+
+NEIGHBOR_FNS = {
+    False: day11.get_direct_neighbors,
+    True: day11.get_visible_neighbors,
+}
+
+
+def random_layout(rng: random.Random, occupied: bool = False):
+    height, width = rng.randint(1, 12), rng.randint(1, 12)
+    seats = 'L#' if occupied else 'L'
+    return [
+        ''.join(
+            rng.choice(seats) if rng.random() < 0.7 else '.'
+            for _ in range(width)
+        )
+        for _ in range(height)
+    ]
+
+
+def to_seat_arrays(rows):
+    import numpy as np
+
+    grid = np.array([[ord(c) for c in row] for row in rows], dtype=np.uint8)
+    return day11.SeatArrays(
+        seats=(grid != ord(day11.FLOOR)).view(np.uint8),
+        occupied=(grid == ord(day11.OCCUPIED_SEAT)).view(np.uint8),
+    )
+
+
+def simulate_rows(rows, visible: bool, tolerance: int):
+    """Final layout of the cell by cell simulation, `None` if it oscillates."""
+    try:
+        layout = day11.simulate(
+            seats_layout=[list(row) for row in rows],
+            neighbor_fn=NEIGHBOR_FNS[visible],
+            tolerance=tolerance,
+        )
+    except RuntimeError:
+        return None
+    return [''.join(row) for row in layout]
+
+
+class SimulateTest(unittest.TestCase):
+    def test_oscillating_layouts(self):
+        for rows, visible, tolerance in OSCILLATING:
+            with self.subTest(rows=rows):
+                with self.assertRaisesRegex(RuntimeError, 'oscillates'):
+                    day11.simulate(
+                        seats_layout=[list(row) for row in rows],
+                        neighbor_fn=NEIGHBOR_FNS[visible],
+                        tolerance=tolerance,
+                    )
+
+    def test_stable_layout(self):
+        self.assertEqual(
+            simulate_rows(['LLL', 'L.L', 'LLL'], visible=False, tolerance=4),
+            ['#L#', 'L.L', '#L#'],
+        )
+
+
+class ArrayEngineTestCase(unittest.TestCase):
+    def assert_same_layout(self, rows, visible: bool, tolerance: int):
+        expected = simulate_rows(rows, visible=visible, tolerance=tolerance)
+        seats = to_seat_arrays(rows)
+
+        if expected is None:
+            with self.assertRaisesRegex(RuntimeError, 'oscillates'):
+                day11.simulate_arrays(
+                    seats=seats,
+                    tolerance=tolerance,
+                    visible=visible,
+                )
+            return
+
+        final_seats = day11.simulate_arrays(
+            seats=seats,
+            tolerance=tolerance,
+            visible=visible,
+        )
+        self.assertEqual(
+            final_seats.occupied.tolist(),
+            [[int(c == day11.OCCUPIED_SEAT) for c in row] for row in expected],
+        )
+
+
+@unittest.skipUnless(HAS_NUMPY, 'requires numpy')
+class SimulateArraysTest(ArrayEngineTestCase):
+    def test_direct_neighbors_match_cell_by_cell(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            self.assert_same_layout(
+                random_layout(rng=rng, occupied=True),
+                visible=False,
+                tolerance=day11.DIRECT_TOLERANCE,
+            )
+
+    def test_oscillating_layouts(self):
+        for rows, visible, tolerance in OSCILLATING:
+            with self.subTest(rows=rows):
+                self.assert_same_layout(
+                    rows,
+                    visible=visible,
+                    tolerance=tolerance,
+                )
+
+                # Same seats as found by the independent bitboard simulation
+                changing = day11.find_oscillating_seats(
+                    seats=to_seat_arrays(rows),
+                    tolerance=tolerance,
+                    visible=visible,
+                )
+                cells = format(
+                    _SeatBoard(rows=rows).find_oscillating(
+                        visible=visible,
+                        tolerance=tolerance,
+                    ),
+                    f'0{len(rows) * (len(rows[0]) + 1)}b',
+                )[::-1]
+                self.assertEqual(
+                    changing.tolist(),
+                    [
+                        [int(c) for c in cells[r:r + len(rows[0])]]
+                        for r in range(0, len(cells), len(rows[0]) + 1)
+                    ],
+                )
+
+    def test_stable_layouts_have_no_oscillating_seats(self):
+        self.assertIsNone(day11.find_oscillating_seats(
+            seats=to_seat_arrays(['LLL', 'L.L', 'LLL']),
+            tolerance=day11.DIRECT_TOLERANCE,
+        ))
+
+
+def brute_force_visible_cell(rows, row: int, col: int, dr: int, dc: int):
+    row, col = row + dr, col + dc
+    while 0 <= row < len(rows) and 0 <= col < len(rows[0]):
+        if rows[row][col] != day11.FLOOR:
+            return row * len(rows[0]) + col
+        row, col = row + dr, col + dc
+    return None
+
+
+@unittest.skipUnless(HAS_NUMPY, 'requires numpy')
+class VisibleSeatsTest(ArrayEngineTestCase):
+    def test_matches_walking_each_direction(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            rows = random_layout(rng=rng)
+            width = len(rows[0])
+            visible_seats = day11.build_visible_seats(
+                seats=to_seat_arrays(rows).seats,
+            )
+
+            seat_cells = visible_seats.seat_cells.tolist()
+            self.assertEqual(seat_cells, [
+                row * width + col
+                for row, values in enumerate(rows)
+                for col, value in enumerate(values)
+                if value != day11.FLOOR
+            ])
+
+            # The extra seat `len(seat_cells)` stands for no visible seat
+            cells = seat_cells + [None]
+            for direction, (dr, dc) in enumerate(day11.DIRECTIONS):
+                self.assertEqual(
+                    [cells[n] for n in visible_seats.neighbors[direction]],
+                    [
+                        brute_force_visible_cell(
+                            rows, cell // width, cell % width, dr, dc,
+                        )
+                        for cell in seat_cells
+                    ],
+                )
+
+    def test_visible_neighbors_match_cell_by_cell(self):
+        rng = random.Random(2)
+        for _ in range(100):
+            rows = random_layout(rng=rng, occupied=True)
+            self.assert_same_layout(
+                rows,
+                visible=True,
+                tolerance=day11.VISIBLE_TOLERANCE,
+            )
+
+    def test_no_seats(self):
+        visible_seats = day11.build_visible_seats(
+            seats=to_seat_arrays(['...', '...']).seats,
+        )
+        self.assertEqual(visible_seats.neighbors.shape, (8, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from aoc.generators import (
+    generate,
+    generate_message_rules,
+    generate_seat_layout,
+)
+from aoc.tests import load_day, write_input
+
+day11 = load_day('day11')
+day19 = load_day('day19')
+
+
+class SmallSizesTest(unittest.TestCase):
+    def test_sizes_below_minimum(self):
+        for day, min_size in (('day05', 2), ('day08', 3)):
+            with self.subTest(day=day):
+                generate(day=day, size=min_size)
+                with self.assertRaisesRegex(ValueError, 'at least'):
+                    generate(day=day, size=min_size - 1)
+
+
+class MessageRulesTest(unittest.TestCase):
+    def test_messages_are_chunks_of_rules_42_and_31(self):
+        for depth in (1, 2, 3, 4):
+            with self.subTest(depth=depth):
+                rules, messages = day19.parse_file(path=write_input(
+                    generate_message_rules(
+                        size=50,
+                        rng=random.Random(depth),
+                        depth=depth,
+                    )
+                ))
+                rule_42 = set(rules['42'].get(rules))
+                rule_31 = set(rules['31'].get(rules))
+                length = 2 ** depth
+
+                num_matched = 0
+                for message in messages:
+                    chunks = [
+                        message[i:i + length]
+                        for i in range(0, len(message), length)
+                    ]
+                    num_42 = next(
+                        (i for i, c in enumerate(chunks) if c not in rule_42),
+                        len(chunks),
+                    )
+                    self.assertGreaterEqual(num_42, 1)
+                    self.assertTrue(rule_31.issuperset(chunks[num_42:]))
+
+                    num_31 = len(chunks) - num_42
+                    matched = num_42 > num_31 >= 1
+                    self.assertEqual(
+                        day19.matches_looped_rule_set(rules, message),
+                        matched,
+                    )
+                    num_matched += matched
+
+                self.assertGreater(num_matched, 0)
+
+
+class SeatLayoutTest(unittest.TestCase):
+    def test_layouts_become_stable(self):
+        rules = [
+            (day11.get_direct_neighbors, day11.DIRECT_TOLERANCE),
+            (day11.get_visible_neighbors, day11.VISIBLE_TOLERANCE),
+        ]
+        # Random layouts of seeds 22 and 65 oscillate before the repair
+        for seed in (0, 22, 65):
+            rows = generate_seat_layout(
+                size=40,
+                rng=random.Random(seed),
+            ).split('\n')
+            self.assertEqual(len(rows), 40)
+            self.assertTrue(all(len(row) == 40 for row in rows))
+
+            for neighbor_fn, tolerance in rules:
+                # Raises `RuntimeError` for oscillating layouts
+                day11.simulate(
+                    seats_layout=[list(row) for row in rows],
+                    neighbor_fn=neighbor_fn,
+                    tolerance=tolerance,
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,44 +1,138 @@
 """Day 1 - Advent of Code"""
-from typing import List, Tuple
+import os
+import sys
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+
+def iter_file(path: str) -> Iterator[int]:
+    for line in iter_lines(path):
+        yield int(line)
+
+
+def parse_file(path: str) -> List[int]:
+    return list(iter_file(path=path))
+
+
+def _iter_k_sums(
+    values: List[int],
+    k: int,
+    const: int,
+    start: int,
+) -> Iterator[Tuple[int, ...]]:
+    if k == 1:
+        idx = bisect_left(values, const, lo=start)
+        if idx < len(values) and values[idx] == const:
+            yield (const,)
+        return
+
+    if k == 2:
+        lo, hi = start, len(values) - 1
+        while lo < hi:
+            total = values[lo] + values[hi]
+            if total < const:
+                lo += 1
+            elif total > const:
+                hi -= 1
+            else:
+                yield values[lo], values[hi]
+
+                # Skip entries with the same value to yield unique sums
+                lo += 1
+                while lo < hi and values[lo] == values[lo - 1]:
+                    lo += 1
+        return
+
+    largest_rest = sum(values[len(values) - k + 1:])
+
+    for idx in range(start, len(values) - k + 1):
+        if idx > start and values[idx] == values[idx - 1]:
+            continue
+
+        # The `k` smallest remaining entries are already too large
+        if sum(values[idx:idx + k]) > const:
+            break
+
+        # Even the largest entries are not enough
+        if values[idx] + largest_rest < const:
+            continue
+
+        for rest in _iter_k_sums(values, k - 1, const - values[idx], idx + 1):
+            yield (values[idx], *rest)
+
+
+def iter_k_sums(
+    values: Iterable[int],
+    k: int,
+    const: int = 2020,
+) -> Iterator[Tuple[int, ...]]:
+    """Yields unique (ascending) `k`-tuples of entries summing to `const`.
+
+    Every entry is used at most once, but different entries may have the
+    same value. Sorting and two pointers for the innermost pair take
+    O(n log n + n^(k - 1)) time and O(n) memory.
+    """
+    if k < 1:
+        raise ValueError(f'k must be positive, got {k}')
+
+    yield from _iter_k_sums(sorted(values), k, const, 0)
+
+
+def find_k_sum(
+    values: Iterable[int],
+    k: int,
+    const: int = 2020,
+) -> Tuple[int, ...]:
+    for entries in iter_k_sums(values=values, k=k, const=const):
+        return entries
+
+    raise ValueError(f'No {k} entries sum to {const}')
 
 
 def find_pairs_summing_to_const(
     values: List[int],
     const: int = 2020,
 ) -> Tuple[int, int]:
-    v = tuple(set(values).intersection(set([const - v for v in values])))
-    assert len(v) == 2
-    assert sum(v) == const
-    return v
+    return find_k_sum(values=values, k=2, const=const)
 
 
 def find_triplets_summing_to_const(
     values: List[int],
     const: int = 2020,
 ) -> Tuple[int, int, int]:
-    all_pairs = [(a, b) for a in values for b in values if a != b]
-    v = tuple(
-        set(values)
-        .intersection(set([const - (a + b) for a, b in all_pairs]))
-    )
-    assert len(v) == 3
-    assert sum(v) == const
-    return v
+    return find_k_sum(values=values, k=3, const=const)
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def solve_part_1(path: str) -> int:
+    x, y = find_pairs_summing_to_const(parse_file(path=path))
+    return x * y
+
 
-    for tf in test_files:
+def solve_part_2(path: str) -> int:
+    x, y, z = find_triplets_summing_to_const(parse_file(path=path))
+    return x * y * z
+
+
+def main():
+    for tf in INPUT_FILES[1]:
         print('Test file:', tf)
-        with open(tf, 'r') as fin:
-            values = [int(v.strip()) for v in fin.readlines()]
 
-            x, y = find_pairs_summing_to_const(values)
-            print('Pairs =>', '(X, Y):', (x, y), 'X * Y:', x * y)
+        values = parse_file(path=tf)
+
+        x, y = find_pairs_summing_to_const(values)
+        print('Pairs =>', '(X, Y):', (x, y), 'X * Y:', x * y)
 
-            x, y, z = find_triplets_summing_to_const(values)
-            print('Triplets =>', '(X, Y, Z):', (x, y, z), 'X * Y * Z:', x * y * z)
+        x, y, z = find_triplets_summing_to_const(values)
+        print('Triplets =>', '(X, Y, Z):', (x, y, z), 'X * Y * Z:', x * y * z)
         print('-------')
 
 
@@ -1,26 +1,50 @@
 """Day 2 - Advent of Code"""
+import os
+import sys
 from collections import Counter, namedtuple
-from typing import List
+from typing import Iterator, List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.loader import iter_lines, map_file  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
 
 InputRow = namedtuple('InputRow', ['min', 'max', 'character', 'password'])
 
+# Column arrays of all rows: `min`, `max` and `character` (as byte code) are
+# 1-D, `passwords` is a zero-padded byte matrix with an extra zero column
+PasswordColumns = namedtuple(
+    'PasswordColumns',
+    ['min', 'max', 'character', 'passwords'],
+)
+
+BatchValidation = namedtuple(
+    'BatchValidation',
+    ['num_valid_range', 'num_valid_position', 'range_mask', 'position_mask'],
+)
+
+
+def iter_file(path: str) -> Iterator[InputRow]:
+    for row in iter_lines(path):
+        allowed_range, character, password = str(row, 'ascii').split(' ')
+        min_val, max_val = [int(v) for v in allowed_range.split('-')]
+        character = character.replace(':', '')
+
+        yield InputRow(
+            min=min_val,
+            max=max_val,
+            character=character,
+            password=password,
+        )
+
 
 def parse_file(path: str) -> List[InputRow]:
-    rows = []
-    with open(path, 'r') as fin:
-        for row in fin:
-            allowed_range, character, password = row.strip().split(' ')
-            min_val, max_val = [int(v) for v in allowed_range.split('-')]
-            character = character.replace(':', '')
-
-            rows.append(InputRow(
-                min=min_val,
-                max=max_val,
-                character=character,
-                password=password,
-            ))
-    return rows
+    return list(iter_file(path=path))
 
 
 def is_valid_password_range(
@@ -46,34 +70,133 @@ def is_valid_password_position(
     )
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def _parse_numbers(data, starts, stops):
+    """Parses the decimal numbers `data[starts[i]:stops[i]]` (vectorized)."""
+    np = lazy_import('numpy')
+
+    lengths = stops - starts
+    values = np.zeros(len(starts), dtype=np.int64)
+
+    for offset in range(lengths.max(initial=0)):
+        has_digit = offset < lengths
+        digits = data[np.where(has_digit, starts + offset, 0)] - ord('0')
+        values = np.where(has_digit, values * 10 + digits, values)
+
+    return values
+
+
+def load_columns(path: str) -> PasswordColumns:
+    """Parses all rows without a Python loop over them.
+
+    Requires `numpy` (optional dependency of the batch mode).
+    """
+    np = lazy_import('numpy')
+
+    with map_file(path) as view:
+        data = np.frombuffer(view, dtype=np.uint8)
+
+        ends = np.flatnonzero(data == ord('\n'))
+        if len(data) > 0 and data[-1] != ord('\n'):
+            ends = np.append(ends, len(data))
+        starts = np.concatenate(([0], ends[:-1] + 1))
+
+        non_empty = ends > starts
+        starts, ends = starts[non_empty], ends[non_empty]
+
+        # Passwords are lower-case letters, so every row has exactly one `-`
+        # and one `:` - as in `1-3 a: abcde`
+        dashes = np.flatnonzero(data == ord('-'))
+        colons = np.flatnonzero(data == ord(':'))
+        if not len(dashes) == len(colons) == len(starts):
+            raise ValueError(f'Malformed password policies in {path}')
+
+        password_starts = colons + 2
+        lengths = ends - password_starts
+
+        # Padding with at least one zero byte, which never matches a
+        # character, gives out of range positions a column to point to
+        width = lengths.max(initial=0) + 1
+        passwords = np.zeros((len(starts), width), dtype=np.uint8)
+        for offset in range(width - 1):
+            inside = offset < lengths
+            passwords[inside, offset] = data[password_starts[inside] + offset]
+
+        columns = PasswordColumns(
+            min=_parse_numbers(data=data, starts=starts, stops=dashes),
+            max=_parse_numbers(data=data, starts=dashes + 1, stops=colons - 2),
+            character=data[colons - 1].copy(),
+            passwords=passwords,
+        )
 
-    for tf in test_files:
+        # Release the mapping before it is closed
+        del data
+
+    return columns
+
+
+def validate_batch(
+    columns: PasswordColumns,
+    return_masks: bool = False,
+) -> BatchValidation:
+    """Evaluates both policies for all rows at once."""
+    np = lazy_import('numpy')
+
+    matches = columns.passwords == columns.character[:, np.newaxis]
+    padding_column = columns.passwords.shape[1] - 1
+
+    counts = matches.sum(axis=1)
+    range_mask = (columns.min <= counts) & (counts <= columns.max)
+
+    rows = np.arange(len(matches))
+
+    def matches_at(positions):
+        # Positions are 1-indexed, the ones out of range match nothing
+        indexes = positions - 1
+        indexes[(indexes < 0) | (indexes > padding_column)] = padding_column
+        return matches[rows, indexes]
+
+    position_mask = matches_at(columns.min) ^ matches_at(columns.max)
+
+    return BatchValidation(
+        num_valid_range=int(range_mask.sum()),
+        num_valid_position=int(position_mask.sum()),
+        range_mask=range_mask if return_masks else None,
+        position_mask=position_mask if return_masks else None,
+    )
+
+
+def solve_part_1(path: str) -> int:
+    return sum(
+        is_valid_password_range(
+            password=row.password,
+            character=row.character,
+            min_occurrences=row.min,
+            max_occurrences=row.max,
+        )
+        for row in iter_file(path=path)
+    )
+
+
+def solve_part_2(path: str) -> int:
+    return sum(
+        is_valid_password_position(
+            password=row.password,
+            character=row.character,
+            first_position=row.min,
+            second_position=row.max,
+        )
+        for row in iter_file(path=path)
+    )
+
+
+def main():
+    for tf in INPUT_FILES[1]:
         print('Test file:', tf)
-        input_rows = parse_file(path=tf)
-        solution_range = len([
-            row
-            for row in input_rows
-            if is_valid_password_range(
-                password=row.password,
-                character=row.character,
-                min_occurrences=row.min,
-                max_occurrences=row.max,
-            )
-        ])
+
+        solution_range = solve_part_1(path=tf)
         print('(Part 1 - Range) Number of valid password:', solution_range)
 
-        solution_pos = len([
-            row
-            for row in input_rows
-            if is_valid_password_position(
-                password=row.password,
-                character=row.character,
-                first_position=row.min,
-                second_position=row.max,
-            )
-        ])
+        solution_pos = solve_part_2(path=tf)
         print('(Part 2 - Positions) Number of valid password:', solution_pos)
 
         print('-------')
@@ -1,7 +1,41 @@
 """Day 3 - Advent of Code"""
+import os
+import sys
 from functools import reduce
+from math import gcd
 from operator import mul
-from typing import List
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import map_file  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+ALL_SLOPES = [
+    (1, 1),
+    (3, 1),
+    (5, 1),
+    (7, 1),
+    (1, 2),
+]
+
+_TREE_BITS = bytes.maketrans(b'#.', b'10')
+
+
+class TreeMap(NamedTuple):
+    height: int
+    width: int
+    # Bit `i` of `columns[c]` is set if there is a tree in row `i`, column `c`
+    columns: List[int]
+
+
+def parse_file(path: str) -> List[str]:
+    with open(path, 'r') as fin:
+        return [row.strip() for row in fin]
 
 
 def count_trees_on_path(
@@ -24,34 +58,109 @@ def count_trees_on_path(
     return num_trees
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def parse_tree_map(path: str) -> TreeMap:
+    with map_file(path) as view:
+        data, size = view.obj, view.nbytes
+        while size > 0 and data[size - 1] == ord('\n'):
+            size -= 1
 
-    ALL_SLOPES = [
-        (1, 1),
-        (3, 1),
-        (5, 1),
-        (7, 1),
-        (1, 2),
-    ]
+        if size == 0:
+            return TreeMap(height=0, width=0, columns=[])
 
-    for tf in test_files:
-        print('Test file:', tf)
+        width = data.find(b'\n')
+        if width == -1:
+            width = size
+
+        # Every row has to end exactly `width` bytes after it starts
+        height, remainder = divmod(size + 1, width + 1)
+        row_ends = data[width:size:width + 1]
+        if remainder != 0 or row_ends.count(b'\n') != len(row_ends):
+            raise ValueError(f'Rows of the map in {path} differ in width')
+
+        # Column `c` is every `width + 1`th byte (including the newline)
+        columns = [
+            int(data[c:size:width + 1].translate(_TREE_BITS)[::-1], 2)
+            for c in range(width)
+        ]
+
+    return TreeMap(height=height, width=width, columns=columns)
+
+
+def _every_nth_bit(step: int, num_bits: int) -> int:
+    """Returns an integer with bits `0, step, 2 * step, ...` set."""
+    num_ones = -(-num_bits // step)
+    return ((1 << (step * num_ones)) - 1) // ((1 << step) - 1)
+
+
+def count_trees_on_paths(
+    tree_map: TreeMap,
+    slopes: Sequence[Tuple[int, int]],
+) -> List[int]:
+    """Counts trees on the paths of all `(right, down)` slopes.
 
-        with open(tf, 'r') as fin:
-            grid = [row.strip() for row in fin]
+    Step `k` of a slope visits row `k * down` and column
+    `k * right % width`, so the steps visiting the same column repeat every
+    `period = width / gcd(right, width)` steps. Trees of a column are then
+    counted by a single AND of its bits with the bits of the visited rows.
+    """
+    masks: Dict[int, int] = {}
+    num_trees = []
+
+    for right, down in slopes:
+        if down < 1:
+            raise ValueError(f'Slope must go down, got {(right, down)}')
+
+        if tree_map.width == 0:
+            num_trees.append(0)  # There are no trees on an empty map
+            continue
+
+        period = tree_map.width // gcd(right, tree_map.width)
+        step = period * down
+        if step not in masks:
+            masks[step] = _every_nth_bit(step=step, num_bits=tree_map.height)
+
+        count = 0
+        for k in range(period):
+            rows = masks[step] << (k * down)
+            if k == 0:
+                rows ^= 1  # Trees at the starting position are not counted
+
+            column = tree_map.columns[k * right % tree_map.width]
+            # Not `int.bit_count()`, which needs Python 3.10
+            count += bin(column & rows).count('1')
+
+        num_trees.append(count)
+
+    return num_trees
+
+
+def solve_part_1(path: str) -> int:
+    num_trees, = count_trees_on_paths(
+        tree_map=parse_tree_map(path=path),
+        slopes=[(3, 1)],
+    )
+    return num_trees
+
+
+def solve_part_2(path: str) -> int:
+    return reduce(
+        mul,
+        count_trees_on_paths(
+            tree_map=parse_tree_map(path=path),
+            slopes=ALL_SLOPES,
+        ),
+    )
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
-            num_trees = count_trees_on_path(grid=grid)
-            print('(Part 1) Number of trees:', num_trees)
+        num_trees = solve_part_1(path=tf)
+        print('(Part 1) Number of trees:', num_trees)
 
-            prod_num_trees = reduce(
-                mul,
-                [
-                    count_trees_on_path(grid=grid, right=r, down=d)
-                    for r, d in ALL_SLOPES
-                ],
-            )
-            print('(Part 2) Product of number of trees:', prod_num_trees)
+        prod_num_trees = solve_part_2(path=tf)
+        print('(Part 2) Product of number of trees:', prod_num_trees)
 
         print('-------')
 
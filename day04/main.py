@@ -1,124 +1,152 @@
 """Day 4 - Advent of Code"""
-from typing import Dict, List
+import os
+import re
+import sys
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def parse_file(path: str) -> List[Dict[str, str]]:
-    passports = []
+from aoc.loader import iter_records  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+
+# Field rules as data - `(kind, argument)` compiled once by `compile_rule`
+FIELD_RULES = {
+    'byr': ('year', (1920, 2002)),
+    'iyr': ('year', (2010, 2020)),
+    'eyr': ('year', (2020, 2030)),
+    'hgt': ('units', {'cm': (150, 193), 'in': (59, 76)}),
+    'hcl': ('pattern', r'#[0-9a-f]{6}'),
+    'ecl': ('enum', ('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth')),
+    'pid': ('pattern', r'[0-9]{9}'),
+}
+
+REQUIRED_FIELDS = tuple(FIELD_RULES)
+
+FieldCheck = Callable[[str], Any]
+
+
+class ValidationReport(NamedTuple):
+    num_complete: int  # passports with all required fields
+    num_valid: int  # complete passports with valid values
+    # Rejected passports by the reason - the first missing field
+    # (`missing <field>`), or else the first field with an invalid value
+    rejections: Dict[str, int]
 
-    record = ''
-    with open(path, 'r') as fin:
-        for row in fin.readlines():
-            row = row.replace('\n', ' ')
 
-            if row == ' ':
-                passports.append({
-                    v.split(':')[0]: v.split(':')[1]
-                    for v in record.strip().split(' ')
-                })
-                record = ''
-            else:
-                record += row
+def compile_rule(kind: str, argument: Any) -> FieldCheck:
+    """Returns a function which is truthy for valid values."""
+    # Ranges are small, so every valid value is enumerated up front
+    if kind == 'year':
+        low, high = argument
+        return frozenset(str(v) for v in range(low, high + 1)).__contains__
+    if kind == 'units':
+        return frozenset(
+            f'{v}{unit}'
+            for unit, (low, high) in argument.items()
+            for v in range(low, high + 1)
+        ).__contains__
+    if kind == 'enum':
+        return frozenset(argument).__contains__
+    if kind == 'pattern':
+        return re.compile(argument).fullmatch
 
-        passports.append({
-            v.split(':')[0]: v.split(':')[1]
-            for v in record.strip().split(' ')
-        })
+    raise ValueError(f'Unknown rule: {kind}')
 
-    return passports
+
+COMPILED_RULES = {
+    field: compile_rule(kind=kind, argument=argument)
+    for field, (kind, argument) in FIELD_RULES.items()
+}
+
+
+def iter_fields(record: memoryview) -> Iterator[Tuple[str, str]]:
+    for field in str(record, 'ascii').split():
+        key, _, value = field.partition(':')
+        yield key, value
+
+
+def parse_file(path: str) -> List[Dict[str, str]]:
+    return [dict(iter_fields(record)) for record in iter_records(path)]
 
 
 def has_all_required_keys(
     passport: Dict[str, str],
-    required_fields: List[str] = (
-        'byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid',
-    ),
+    required_fields: List[str] = REQUIRED_FIELDS,
 ) -> bool:
     return all(rf in passport.keys() for rf in required_fields)
 
 
 def is_valid_passport(
     passport: Dict[str, str],
+    rules: Dict[str, FieldCheck] = COMPILED_RULES,
 ) -> bool:
-    # Validate `Birth Year`
-    byr = passport['byr']
-    if not (len(byr) == 4 and (1920 <= int(byr) <= 2002)):
-        return False
-
-    # Validate `Issue Year`
-    iyr = passport['iyr']
-    if not (len(iyr) == 4 and (2010 <= int(iyr) <= 2020)):
-        return False
-
-    # Validate `Expiration Year`
-    eyr = passport['eyr']
-    if not (len(eyr) == 4 and (2020 <= int(eyr) <= 2030)):
-        return False
-
-    # Validate `Height`
-    hgt = passport['hgt']
-    if not (
-        ('cm' in hgt or 'in' in hgt)
-        and (
-            (('cm' in hgt) and (150 <= int(hgt.split('cm')[0]) <= 193))
-            or (('in' in hgt) and (59 <= int(hgt.split('in')[0]) <= 76))
-        )
-    ):
-        return False
-
-    # Validate `Hair Color`
-    hcl = passport['hcl']
-    if not(
-        len(hcl) == 7
-        and hcl.startswith('#')
-        and all(
-            ('0' <= c <= '9') or ('a' <= c <= 'f')
-            for c in hcl[1:]
-        )
-    ):
-        return False
-
-    # Validate `Eye Color'
-    ecl = passport['ecl']
-    if not any(
-        ecl == v
-        for v in ('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth')
-    ):
-        return False
-
-    # Validate `Passport ID`
-    pid = passport['pid']
-    if not (
-        len(pid) == 9
-        and any('0' <= c <= '9' for c in pid)
-    ):
-        return False
-
-    return True
+    return all(check(passport[field]) for field, check in rules.items())
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def validate_records(
+    path: str,
+    rules: Dict[str, FieldCheck] = COMPILED_RULES,
+) -> ValidationReport:
+    """Validates passports while streaming records (no per-passport dicts)."""
+    num_complete = 0
+    num_valid = 0
+    rejections = {}
 
-    for tf in test_files:
-        print('Test file:', tf)
+    for record in iter_records(path):
+        seen = set()
+        invalid_field = None
+
+        for key, value in iter_fields(record):
+            seen.add(key)
+
+            # Values of already invalid passports are not checked
+            if invalid_field is not None:
+                continue
+
+            check = rules.get(key)
+            if check is not None and not check(value):
+                invalid_field = key
+
+        missing = [field for field in rules if field not in seen]
+        if missing:
+            reason = f'missing {missing[0]}'
+        else:
+            num_complete += 1
+            if invalid_field is None:
+                num_valid += 1
+                continue
+            reason = invalid_field
+
+        rejections[reason] = rejections.get(reason, 0) + 1
+
+    return ValidationReport(
+        num_complete=num_complete,
+        num_valid=num_valid,
+        rejections=rejections,
+    )
 
-        passport_data = parse_file(path=tf)
 
-        num_valid = len([
-            passport
-            for passport in passport_data
-            if has_all_required_keys(passport=passport)
-        ])
+def solve_part_1(path: str) -> int:
+    return validate_records(path=path).num_complete
+
+
+def solve_part_2(path: str) -> int:
+    return validate_records(path=path).num_valid
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
+
+        num_valid = solve_part_1(path=tf)
         print('(Part 1) Number of valid passports:', num_valid)
 
-        num_valid = len([
-            passport
-            for passport in passport_data
-            if (
-                has_all_required_keys(passport=passport)
-                and is_valid_passport(passport=passport)
-            )
-        ])
+        num_valid = solve_part_2(path=tf)
         print('(Part 2) Number of valid passports:', num_valid)
 
         print('-------')
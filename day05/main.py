@@ -1,50 +1,91 @@
 """Day 5 - Advent of Code"""
-from typing import List
+import os
+import sys
+from itertools import repeat
+from typing import Iterable, Iterator, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines, map_file  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/input.txt',),
+}
+
+NUM_SEATS = 128 * 8
+
+_SEAT_BITS = str.maketrans('FBLR', '0101')
+_SEAT_BYTE_BITS = bytes.maketrans(b'FBLR', b'0101')
+
+
+def iter_file(path: str) -> Iterator[str]:
+    for row in iter_lines(path):
+        yield str(row, 'ascii')
 
 
 def parse_file(path: str) -> List[str]:
-    with open(path, 'r') as fin:
-        return [row.strip() for row in fin.readlines()]
+    return list(iter_file(path=path))
 
 
 def parse_seat_id(encoded_seat_id: str) -> int:
-    row = int(
-        encoded_seat_id[:7].replace('F', '0').replace('B', '1'),
-        base=2,
-    )
+    # The row (upper 7 bits) times 8 plus the column (lower 3 bits) is just
+    # the whole boarding pass read as a binary number
+    return int(encoded_seat_id.translate(_SEAT_BITS), base=2)
 
-    column = int(
-        encoded_seat_id[7:].replace('L', '0').replace('R', '1'),
-        base=2,
-    )
 
-    return row * 8 + column
+def iter_seat_ids(path: str, chunk_size: int = 2 ** 20) -> Iterator[int]:
+    """Decodes the boarding passes in bulk, a chunk of lines at a time."""
+    with map_file(path) as view:
+        data, size = view.obj, view.nbytes
 
+        start = 0
+        while start < size:
+            stop = data.find(b'\n', min(start + chunk_size, size))
+            if stop == -1:
+                stop = size
 
-def get_my_seat_id(seat_ids: List[int]) -> int:
-    ssi = sorted(seat_ids)
-    seats_with_gaps = [(i, j) for i, j in zip(ssi, ssi[1:]) if i + 1 != j]
-    assert len(seats_with_gaps) == 1
-    return seats_with_gaps[0][0] + 1
+            chunk = data[start:stop].translate(_SEAT_BYTE_BITS)
+            yield from map(int, chunk.split(), repeat(2))
 
+            start = stop + 1
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
 
-    for tf in test_files:
-        print('Test file:', tf)
+def get_my_seat_id(seat_ids: Iterable[int]) -> int:
+    """Finds the only free seat between the first and last occupied one."""
+    # Repeated seats just set their byte again
+    seats = bytearray(NUM_SEATS)
+    for seat_id in seat_ids:
+        if not 0 <= seat_id < NUM_SEATS:
+            raise ValueError(f'Seat ID out of range: {seat_id}')
+        seats[seat_id] = 1
+
+    first, last = seats.find(1), seats.rfind(1)
+    occupied = seats[first:last + 1]
 
-        boarding_passes = parse_file(path=tf)
-        seat_ids = [
-            parse_seat_id(encoded_seat_id)
-            for encoded_seat_id in boarding_passes
-        ]
+    if occupied.count(0) != 1:
+        raise ValueError(f'{occupied.count(0)} free seats instead of one')
+
+    return first + occupied.index(0)
+
+
+def solve_part_1(path: str) -> int:
+    return max(iter_seat_ids(path=path))
+
+
+def solve_part_2(path: str) -> int:
+    return get_my_seat_id(iter_seat_ids(path=path))
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
-        max_seat_id = max(seat_ids)
+        max_seat_id = solve_part_1(path=tf)
         print('(Part 1) Highest seat ID:', max_seat_id)
 
-        if tf != './data/example.txt':
-            my_seat_id = get_my_seat_id(seat_ids)
+        if tf in INPUT_FILES[2]:
+            my_seat_id = solve_part_2(path=tf)
             print('(Part 2) My seat ID:', my_seat_id)
 
         print('-------')
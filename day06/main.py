@@ -1,46 +1,107 @@
 """Day 6 - Advent of Code"""
-from collections import Counter
-from typing import List
+import os
+import sys
+from functools import reduce
+from operator import and_, or_
+from string import ascii_lowercase
+from typing import Iterable, Iterator, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_records  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+_NEWLINE = ord('\n')
+
+# Answer `a` is bit 0, ..., answer `z` is bit 25 - indexed by the byte value
+_ANSWER_BITS = [
+    1 << ascii_lowercase.index(chr(c)) if chr(c) in ascii_lowercase else 0
+    for c in range(256)
+]
+
+ALL_ANSWERS = (1 << len(ascii_lowercase)) - 1
 
 
 def parse_file(path: str) -> List[List[str]]:
-    with open(path, 'r') as fin:
-        return [
-            group.split('\n')
-            for group in fin.read().split('\n\n')
-        ]
+    return [
+        str(group, 'ascii').split('\n')
+        for group in iter_records(path)
+    ]
+
+
+def get_answer_mask(answers: Iterable[int]) -> int:
+    """OR-reduction of the bits of the answers (bytes), others are ignored."""
+    return reduce(or_, map(_ANSWER_BITS.__getitem__, answers), 0)
+
+
+def iter_any_masks(path: str) -> Iterator[int]:
+    """Yields answers of anyone in a group, streaming over groups."""
+    for group in iter_records(path):
+        # Newlines separating people are ignored, so the whole group can be
+        # reduced at once
+        yield get_answer_mask(group)
+
+
+def iter_all_masks(path: str) -> Iterator[int]:
+    """Yields answers of everyone in a group, streaming over groups."""
+    for group in iter_records(path):
+        # People are separated while scanning the bytes of the group
+        all_mask, person_mask = ALL_ANSWERS, 0
+        for answer in group:
+            if answer == _NEWLINE:
+                all_mask &= person_mask
+                person_mask = 0
+            else:
+                person_mask |= _ANSWER_BITS[answer]
+        yield all_mask & person_mask
+
+
+def count_answers(mask: int) -> int:
+    """Number of answers in the mask (`int.bit_count()` needs Python 3.10)."""
+    return bin(mask).count('1')
+
+
+def _iter_person_masks(group: List[str]) -> Iterator[int]:
+    for person in group:
+        yield get_answer_mask(person.encode('ascii'))
 
 
 def count_any_answer(forms: List[List[str]]) -> int:
-    return sum([len(set(''.join(group))) for group in forms])
+    return sum(
+        count_answers(reduce(or_, _iter_person_masks(group), 0))
+        for group in forms
+    )
 
 
 def count_all_answer(forms: List[List[str]]) -> int:
-    total = 0
-    for group in forms:
-        group_size = len(group)
-        answer_counts = Counter(''.join(group))
-        total += len([
-            answer
-            for answer, count in answer_counts.items()
-            if count == group_size
-        ])
+    return sum(
+        count_answers(
+            reduce(and_, _iter_person_masks(group), ALL_ANSWERS)
+        )
+        for group in forms
+    )
 
-    return total
 
+def solve_part_1(path: str) -> int:
+    return sum(map(count_answers, iter_any_masks(path=path)))
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
 
-    for tf in test_files:
-        print('Test file:', tf)
+def solve_part_2(path: str) -> int:
+    return sum(map(count_answers, iter_all_masks(path=path)))
+
 
-        forms = parse_file(path=tf)
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
-        num_any_answer = count_any_answer(forms=forms)
+        num_any_answer = solve_part_1(path=tf)
         print('(Part 1) Sum of distinct "any" answer counts:', num_any_answer)
 
-        num_all_answer = count_all_answer(forms=forms)
+        num_all_answer = solve_part_2(path=tf)
         print('(Part 2) Sum of distinct "all" answer counts:', num_all_answer)
 
         print('-------')
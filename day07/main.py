@@ -1,5 +1,11 @@
 """Day 7 - Advent of Code"""
-from typing import List
+from graphlib import TopologicalSorter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/example2.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/example2.txt', './data/input.txt'),
+}
 
 
 def parse_file(path: str) -> List[dict]:
@@ -42,89 +48,106 @@ def parse_file(path: str) -> List[dict]:
         return bag_rules
 
 
+class BagGraph:
+    """Bag rules indexed in both directions, built once per input.
+
+    Numbers of bags inside are computed for all colors at once, in
+    topological order (O(V + E)) on the first count query. Containing colors
+    are searched over the reverse index and cached per color.
+    """
+
+    def __init__(self, bag_rules: List[dict]):
+        # Color -> `(inner color, number of bags)` / outer colors
+        self.contents: Dict[str, List[Tuple[str, int]]] = {}
+        self.containers: Dict[str, List[str]] = {}
+
+        for br in bag_rules:
+            self.contents.setdefault(br['parent'], [])
+            self.containers.setdefault(br['parent'], [])
+
+            for ibc in br['inner']:
+                self.contents[br['parent']].append((ibc['color'], ibc['num']))
+                self.contents.setdefault(ibc['color'], [])
+                self.containers.setdefault(ibc['color'], []).append(
+                    br['parent'],
+                )
+
+        self._bags_containing: Dict[str, FrozenSet[str]] = {}
+        self._num_bags_inside: Optional[Dict[str, int]] = None
+
+    def get_bags_containing(self, color: str) -> FrozenSet[str]:
+        if color not in self._bags_containing:
+            found = set()
+            stack = [color]
+            while stack:
+                for parent in self.containers.get(stack.pop(), ()):
+                    if parent not in found:
+                        found.add(parent)
+                        stack.append(parent)
+
+            self._bags_containing[color] = frozenset(found)
+
+        return self._bags_containing[color]
+
+    def get_num_bags_inside(self, color: str) -> int:
+        """Number of bags inside a `color` bag (excluding the bag itself)."""
+        if self._num_bags_inside is None:
+            order = TopologicalSorter({
+                parent: [inner for inner, _ in contents]
+                for parent, contents in self.contents.items()
+            }).static_order()  # Raises `CycleError` for recursive rules
+
+            # Inner bags come first
+            num_bags_inside = {}
+            for parent in order:
+                num_bags_inside[parent] = sum(
+                    num * (1 + num_bags_inside[inner])
+                    for inner, num in self.contents[parent]
+                )
+            self._num_bags_inside = num_bags_inside
+
+        return self._num_bags_inside.get(color, 0)
+
+
 def get_bags_containing(
     bag_rules: List[dict],
     target_bag_color: str,
 ) -> List[str]:
-    bags_containing_target = set()
-
-    # Find parents of `target_bar_color`
-    parents = [
-        br['parent']
-        for br in bag_rules
-        if any(
-            ibc['color'] == target_bag_color
-            for ibc in br['inner']
-        )
-    ]
-    bags_containing_target.update(parents)
-
-    # Find bags containing every parent
-    for parent in parents:
-        bags = get_bags_containing(
-            bag_rules=bag_rules,
-            target_bag_color=parent,
-        )
-        bags_containing_target.update(bags)
-
-    return list(bags_containing_target)
+    return list(BagGraph(bag_rules).get_bags_containing(target_bag_color))
 
 
 def get_num_bags_inside(
     bag_rules: List[dict],
     start_bag_color: str,
 ) -> int:
-    num_bags_inside = 1
-
-    # Find inner bags of `start_bag_color`
-    inner_bags = [
-        inner
-        for br in bag_rules
-        for inner in br['inner']
-        if br['parent'] == start_bag_color
-    ]
-
-    # Find bags inside `inner_bags` bags
-    for inner_bag in inner_bags:
-        num_bags = get_num_bags_inside(
-            bag_rules=bag_rules,
-            start_bag_color=inner_bag['color'],
-        )
-        num_bags_inside += inner_bag['num'] * num_bags
+    """Number of bags inside, including the `start_bag_color` bag."""
+    return 1 + BagGraph(bag_rules).get_num_bags_inside(start_bag_color)
 
-    return num_bags_inside
 
+def solve_part_1(path: str) -> int:
+    graph = BagGraph(bag_rules=parse_file(path=path))
+    return len(graph.get_bags_containing('shiny gold'))
 
-def main():
-    test_files = [
-        './data/example.txt',
-        './data/example2.txt',
-        './data/input.txt',
-    ]
 
-    for tf in test_files:
-        print('Test file:', tf)
+def solve_part_2(path: str) -> int:
+    graph = BagGraph(bag_rules=parse_file(path=path))
+    return graph.get_num_bags_inside('shiny gold')
 
-        bag_rules = parse_file(path=tf)
 
-        bags_containing_target = get_bags_containing(
-            bag_rules=bag_rules,
-            target_bag_color='shiny gold',
-        )
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
+
         print(
             '(Part 1) '
             'Number of distinct bag colors containing a `shiny gold` bag:',
-            len(bags_containing_target),
+            solve_part_1(path=tf),
         )
 
-        num_bags_inside = get_num_bags_inside(
-            bag_rules=bag_rules,
-            start_bag_color='shiny gold',
-        )
         print(
             '(Part 2) '
             'Number of individual bags inside a `shiny gold` bag:',
-            num_bags_inside - 1,
+            solve_part_2(path=tf),
         )
 
         print('-------')
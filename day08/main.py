@@ -1,117 +1,271 @@
 """Day 8 - Advent of Code"""
-from dataclasses import dataclass
-from copy import deepcopy
-from typing import List
+import os
+import sys
+from array import array
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-@dataclass
-class Instruction:
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+
+NOP, ACC, JMP = range(3)
+
+OPCODES = {
+    'nop': NOP,
+    'acc': ACC,
+    'jmp': JMP,
+}
+
+
+class Instruction(NamedTuple):
     opcode: str
     argument: int
 
 
+def iter_file(path: str) -> Iterator[Instruction]:
+    for line in iter_lines(path):
+        opcode, argument = str(line, 'ascii').split(' ')
+        yield Instruction(opcode=opcode, argument=int(argument))
+
+
 def parse_file(path: str) -> List[Instruction]:
-    instructions = []
+    return list(iter_file(path=path))
+
+
+class Program(NamedTuple):
+    opcodes: bytes
+    arguments: array
+
+
+def compile_program(instructions: Iterable[Instruction]) -> Program:
+    opcodes, arguments = bytearray(), array('q')
+
+    for ins in instructions:
+        if ins.opcode not in OPCODES:
+            raise ValueError(f'Unknown instruction: {ins}')
+
+        opcodes.append(OPCODES[ins.opcode])
+        arguments.append(ins.argument)
+
+    return Program(opcodes=bytes(opcodes), arguments=arguments)
+
+
+class VM:
+    """Executes a compiled program, every instruction at most once."""
+
+    def __init__(self, program: Program):
+        self.program = program
+        self.acc = 0
+        self.pc = 0
+        self.visited = bytearray(len(program.opcodes))
+
+    @property
+    def terminated(self) -> bool:
+        return self.pc == len(self.program.opcodes)
+
+    @property
+    def in_loop(self) -> bool:
+        """The next instruction was already executed."""
+        return (
+            0 <= self.pc < len(self.program.opcodes)
+            and self.visited[self.pc] == 1
+        )
+
+    def _check_pc(self):
+        if not 0 <= self.pc <= len(self.program.opcodes):
+            raise RuntimeError(f'Jump outside of the program: {self.pc}')
+
+    def step(self):
+        self._check_pc()
+        if self.terminated:
+            raise RuntimeError('Program already terminated')
+
+        pc = self.pc
+        self.visited[pc] = 1
+
+        opcode = self.program.opcodes[pc]
+        if opcode == ACC:
+            self.acc += self.program.arguments[pc]
+            self.pc += 1
+        elif opcode == JMP:
+            self.pc += self.program.arguments[pc]
+        else:
+            self.pc += 1
+
+    def trace(self) -> Iterator[Tuple[int, int]]:
+        """Steps until termination or a loop, yielding `(pc, acc)` first."""
+        self._check_pc()
+        while not (self.terminated or self.in_loop):
+            yield self.pc, self.acc
+            self.step()
+            self._check_pc()
+
+    def run(self) -> bool:
+        """Runs until termination (`True`) or a loop is detected (`False`)."""
+        opcodes, arguments, visited = (
+            self.program.opcodes, self.program.arguments, self.visited,
+        )
+        acc, pc, end = self.acc, self.pc, len(opcodes)
+
+        while 0 <= pc < end and not visited[pc]:
+            visited[pc] = 1
 
-    with open(path, 'r') as fin:
-        for line in fin.readlines():
-            opcode, argument = line.strip().split(' ')
-            argument = int(argument)
+            opcode = opcodes[pc]
+            if opcode == ACC:
+                acc += arguments[pc]
+                pc += 1
+            elif opcode == JMP:
+                pc += arguments[pc]
+            else:
+                pc += 1
 
-            instructions.append(Instruction(opcode=opcode, argument=argument))
+        self.acc, self.pc = acc, pc
+        self._check_pc()
 
-    return instructions
+        return self.terminated
 
 
 def execute_code(instructions: List[Instruction]):
-    # Registers
+    vm = VM(program=compile_program(instructions))
+    execution_history = [pc for pc, _ in vm.trace()]
+
     registers = {
-        'acc': 0,
-        'pc': 0,
+        'acc': vm.acc,
+        'pc': vm.pc,
     }
 
-    # Keep track of already executed commands (prevent infinite loop)
-    execution_history = []
-    infinite_loop_found = False
+    return registers, execution_history, vm.in_loop
 
-    while True:
-        ins = instructions[registers['pc']]
 
-        execution_history.append(registers['pc'])
+class Repair(NamedTuple):
+    index: int  # of the flipped instruction
+    acc: int  # after termination of the repaired program
 
-        if ins.opcode == 'nop':
-            registers['pc'] += 1
-        elif ins.opcode == 'acc':
-            registers['acc'] += ins.argument
-            registers['pc'] += 1
-        elif ins.opcode == 'jmp':
-            registers['pc'] += ins.argument
-        else:
-            raise RuntimeError(f'Unknown instruction: {ins}')
 
-        if registers['pc'] == len(instructions):
-            break
+def _get_next_pcs(program: Program) -> List[int]:
+    return [
+        pc + argument if opcode == JMP else pc + 1
+        for pc, (opcode, argument) in enumerate(
+            zip(program.opcodes, program.arguments)
+        )
+    ]
 
-        if registers['pc'] in execution_history:
-            infinite_loop_found = True
-            break
 
-    return registers, execution_history, infinite_loop_found
+def _get_terminating(program: Program) -> bytearray:
+    """Marks instructions from which the program terminates (unmodified).
 
+    Computed by walking the jump graph backwards from the end of the program.
+    """
+    end = len(program.opcodes)
 
-def fix_program(instructions: List[Instruction]):
-    # Find all `nop` and `jmp` instructions (their indexes)
-    nop_jmp_instructions_idxs = [
-        i
-        for i, ins in enumerate(instructions)
-        if ins.opcode in ('nop', 'jmp')
-    ]
+    predecessors = [[] for _ in range(end + 1)]
+    for pc, next_pc in enumerate(_get_next_pcs(program)):
+        if 0 <= next_pc <= end:
+            predecessors[next_pc].append(pc)
 
-    # For any of those instructions, flip them and run the program
-    for idx in nop_jmp_instructions_idxs:
-        ins_cpy = deepcopy(instructions)
+    terminating = bytearray(end + 1)
+    terminating[end] = 1
+    stack = [end]
+    while stack:
+        for pc in predecessors[stack.pop()]:
+            if not terminating[pc]:
+                terminating[pc] = 1
+                stack.append(pc)
+
+    return terminating
 
-        if ins_cpy[idx].opcode == 'nop':
-            ins_cpy[idx].opcode = 'jmp'
-        elif ins_cpy[idx].opcode == 'jmp':
-            ins_cpy[idx].opcode = 'nop'
-        else:
-            raise RuntimeError(
-                'We should have either a `nop` or a `jmp` instruction here'
-            )
 
-        registers, _, infinite_loop_found = execute_code(instructions=ins_cpy)
+def repair_program(program: Program) -> Repair:
+    """Finds the `nop` / `jmp` to flip for the program to terminate.
 
-        if not infinite_loop_found:
-            return registers
+    Only instructions executed by the (looping) program are candidates, and
+    flipping one repairs the program iff it then continues at an instruction
+    from which the program terminates - so a single run is enough, O(n).
+    """
+    opcodes, arguments = program.opcodes, program.arguments
+    terminating = _get_terminating(program)
+    end = len(opcodes)
+
+    acc, pc = 0, 0
+    visited = bytearray(end)
+    while 0 <= pc < end and not visited[pc]:
+        visited[pc] = 1
+
+        opcode, argument = opcodes[pc], arguments[pc]
+        if opcode == NOP and 0 <= pc + argument <= end:
+            flipped_pc = pc + argument
+        elif opcode == JMP:
+            flipped_pc = pc + 1
+        else:
+            flipped_pc = None
+
+        if flipped_pc is not None and terminating[flipped_pc]:
+            patched = bytearray(opcodes)
+            patched[pc] = JMP if opcode == NOP else NOP
+
+            vm = VM(program=Program(
+                opcodes=bytes(patched),
+                arguments=arguments,
+            ))
+            vm.acc, vm.pc = acc, flipped_pc
+            vm.run()
+
+            return Repair(index=pc, acc=vm.acc)
+
+        if opcode == ACC:
+            acc += argument
+            pc += 1
+        elif opcode == JMP:
+            pc += argument
+        else:
+            pc += 1
 
     raise RuntimeError('Program could not be fixed!')
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def fix_program(instructions: List[Instruction]):
+    program = compile_program(instructions)
+    repair = repair_program(program=program)
 
-    for tf in test_files:
-        print('Test file:', tf)
+    return {
+        'acc': repair.acc,
+        'pc': len(program.opcodes),
+    }
 
-        instructions = parse_file(path=tf)
 
-        registers, execution_history, infinite_loop_found = execute_code(
-            instructions=instructions,
-        )
-        assert infinite_loop_found
+def solve_part_1(path: str) -> int:
+    vm = VM(program=compile_program(iter_file(path=path)))
+    if vm.run():
+        raise RuntimeError('Program terminated without a loop')
+
+    return vm.acc
+
+
+def solve_part_2(path: str) -> int:
+    program = compile_program(iter_file(path=path))
+    return repair_program(program=program).acc
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Accumulator value before infinite loop:',
-            registers['acc'],
+            solve_part_1(path=tf),
         )
 
-        registers_after_fix = fix_program(instructions=instructions)
         print(
             '(Part 2) '
             'Accumulator value after termination of fixed program:',
-            registers_after_fix['acc'],
+            solve_part_2(path=tf),
         )
         print('-------')
 
@@ -1,72 +1,259 @@
 """Day 9 - Advent of Code"""
-from typing import List, Set
+import os
+import sys
+from collections import Counter, deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+# Length of the preamble (and of the window of previous numbers)
+PREAMBLE_SIZE = 25
+
+# Declared inputs with a different preamble (relative to this directory)
+INPUT_WINDOWS = {
+    './data/example.txt': 5,
+}
+
+
+def iter_file(path: str) -> Iterator[int]:
+    for line in iter_lines(path):
+        yield int(line)
 
 
 def parse_file(path: str) -> List[int]:
-    with open(path, 'r') as fin:
-        return [int(num) for num in fin.readlines()]
+    return list(iter_file(path=path))
+
+
+class SlidingWindow:
+    """The last `size` numbers, indexed by value for pair-sum queries.
+
+    Shifting is O(1), `has_pair_sum` is O(number of distinct values).
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque()
+        self.counts = Counter()
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def push(self, value: int):
+        """Appends the value, dropping the oldest one if the window is full."""
+        if self.full:
+            oldest = self.values.popleft()
+            self.counts[oldest] -= 1
+            if not self.counts[oldest]:
+                del self.counts[oldest]
+
+        self.values.append(value)
+        self.counts[value] += 1
+
+    def has_pair_sum(self, target: int) -> bool:
+        """Any two different values in the window sum up to the target."""
+        counts = self.counts
+        return any(
+            target - value in counts and target - value != value
+            for value in counts
+        )
+
+
+def find_invalid_number(
+    numbers: Iterable[int],
+    window: int,
+) -> Optional[int]:
+    """First number (after the preamble) that is not a pair sum of the
+    previous `window` numbers - numbers may be streamed.
+    """
+    buffer = SlidingWindow(size=window)
+
+    for number in numbers:
+        if buffer.full and not buffer.has_pair_sum(number):
+            return number
+
+        buffer.push(number)
+
+    return None
+
+
+def find_contiguous_range(
+    numbers: Iterable[int],
+    target: int,
+    min_size: int = 2,
+) -> Optional[Tuple[int, int]]:
+    """First range `(start, stop)` of at least `min_size` numbers summing up
+    to the target, using two pointers - only valid for non-negative numbers.
+    """
+    window, total, start = deque(), 0, 0
+
+    for stop, number in enumerate(numbers, start=1):
+        window.append(number)
+        total += number
+
+        while total > target and window:
+            total -= window.popleft()
+            start += 1
+
+        if total == target and len(window) >= min_size:
+            return start, stop
+
+    return None
+
 
+class RangeFinder:
+    """Finds contiguous ranges summing up to any of the targets, while the
+    numbers (any integers) are pushed one by one.
 
-def find_invalid_number(numbers: List[int], window: int) -> int:
-    buffer = numbers[:window]
-    for idx in range(window, len(numbers)):
-        current_number = numbers[idx]
+    A range `[start, stop)` sums up to a target iff the prefix sums differ by
+    it, so the first index of every prefix sum is kept in a hash map.
+    """
 
-        # Check if value fits property
-        if not any([
-            a + b == current_number
-            for a in buffer
-            for b in buffer
-            if a != b
-        ]):
-            return current_number
+    def __init__(self, targets: Iterable[int], min_size: int = 2):
+        if min_size < 1:
+            raise ValueError(f'Ranges must not be empty: {min_size}')
 
-        # Shift buffer
-        buffer = [*buffer[1:], current_number]
+        self.targets = set(targets)
+        self.min_size = min_size
+        self.found: Dict[int, Tuple[int, int]] = {}
+
+        self._remaining = set(self.targets)
+        self._total = 0
+        self._stop = 0
+        # Prefix sums become valid range starts `min_size` numbers later
+        self._pending = deque([0])
+        self._first_index: Dict[int, int] = {}
+
+    @property
+    def done(self) -> bool:
+        return not self._remaining
+
+    def push(self, number: int):
+        if len(self._pending) == self.min_size:
+            self._first_index.setdefault(
+                self._pending.popleft(),
+                self._stop - self.min_size + 1,
+            )
+
+        self._total += number
+        self._stop += 1
+        self._pending.append(self._total)
+
+        found = [
+            (target, self._first_index[self._total - target])
+            for target in self._remaining
+            if self._total - target in self._first_index
+        ]
+        for target, start in found:
+            self.found[target] = (start, self._stop)
+            self._remaining.remove(target)
+
+
+def find_contiguous_ranges(
+    numbers: Iterable[int],
+    targets: Iterable[int],
+    min_size: int = 2,
+) -> Dict[int, Tuple[int, int]]:
+    """First range `(start, stop)` per target, in a single pass (prefix sums).
+
+    Targets without such a range are missing from the result.
+    """
+    finder = RangeFinder(targets=targets, min_size=min_size)
+
+    for number in numbers:
+        if finder.done:
+            break
+        finder.push(number)
+
+    return finder.found
 
 
 def find_contiguous_set(
     numbers: List[int],
     invalid_number: int,
     min_set_size: int = 2,
-) -> Set[int]:
-    for i in range(len(numbers)):
-        for j in range(i + min_set_size, len(numbers)):
-            vals = numbers[i:j]
+) -> Optional[Set[int]]:
+    found = find_contiguous_range(
+        numbers=numbers,
+        target=invalid_number,
+        min_size=min_set_size,
+    )
+    if found is None:
+        return None
 
-            if sum(vals) > invalid_number:
-                break
+    start, stop = found
+    return set(numbers[start:stop])
 
-            if sum(vals) == invalid_number:
-                return set(vals)
 
+def get_window_size(path: str) -> int:
+    """The preamble length of a declared input - any other input (e.g. a
+    generated one) uses the puzzle's preamble.
+    """
+    day_dir = os.path.dirname(os.path.realpath(__file__))
+    windows = {
+        os.path.normpath(os.path.join(day_dir, input_file)): window
+        for input_file, window in INPUT_WINDOWS.items()
+    }
+    return windows.get(os.path.realpath(path), PREAMBLE_SIZE)
 
-def main():
-    test_files = [('./data/example.txt', 5), ('./data/input.txt', 25)]
 
-    for tf, window in test_files:
-        print('Test file:', tf)
+def get_input_params(path: str) -> Dict[str, int]:
+    return {'window': get_window_size(path=path)}
+
+
+def _get_invalid_number(numbers: Iterable[int], window: int) -> int:
+    invalid_number = find_invalid_number(numbers=numbers, window=window)
+    if invalid_number is None:
+        raise ValueError(f'No invalid number for window {window}')
 
-        numbers = parse_file(path=tf)
+    return invalid_number
 
-        invalid_number = find_invalid_number(numbers=numbers, window=window)
+
+def solve_part_1(path: str, window: Optional[int] = None) -> int:
+    if window is None:
+        window = get_window_size(path=path)
+
+    return _get_invalid_number(numbers=iter_file(path=path), window=window)
+
+
+def solve_part_2(path: str, window: Optional[int] = None) -> int:
+    if window is None:
+        window = get_window_size(path=path)
+
+    numbers = parse_file(path=path)
+    invalid_number = _get_invalid_number(numbers=numbers, window=window)
+
+    contiguous_set = find_contiguous_set(
+        numbers=numbers,
+        invalid_number=invalid_number,
+    )
+    if contiguous_set is None:
+        raise ValueError(f'No contiguous set sums up to {invalid_number}')
+
+    return min(contiguous_set) + max(contiguous_set)
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'First number that does not have the property:',
-            invalid_number,
-        )
-
-        contiguous_set = find_contiguous_set(
-            numbers=numbers,
-            invalid_number=invalid_number,
+            solve_part_1(path=tf),
         )
-        weakness = min(contiguous_set) + max(contiguous_set)
 
         print(
             '(Part 2) '
             'Encryption weakness of XMAS-encrypted numbers:',
-            weakness,
+            solve_part_2(path=tf),
         )
 
 
@@ -1,112 +1,185 @@
 """Day 10 - Advent of Code"""
-from itertools import groupby
-from functools import reduce
-from operator import mul
-from typing import Dict, List
+import os
+import sys
+from array import array
+from collections import Counter, deque
+from itertools import compress, islice, repeat
+from typing import (
+    Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple,
+)
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+# Differences of adapters that can be connected (in jolts)
+JOLT_GAPS = (1, 2, 3)
+
+OUTLET_JOLT = 0
+# The device is rated this much higher than the highest adapter
+DEVICE_JOLT_OFFSET = 3
+
+
+def iter_file(path: str) -> Iterator[int]:
+    for line in iter_lines(path):
+        yield int(line)
 
 
 def parse_file(path: str) -> List[int]:
-    with open(path, 'r') as fin:
-        return [int(num) for num in fin.readlines()]
-
-
-def count_jolt_differences(jolts: List[int]) -> Dict[int, int]:
-    differences = [b - a for a, b in zip(jolts, jolts[1:])]
-    return {diff: differences.count(diff) for diff in set(differences)}
-
-
-def count_arrangements(jolts: List[int]) -> int:
-    """Counts number of different arrangements.
-
-    We need to find all blocks of "one differences". For each block size we can
-    manually compute the number of different removals (arrangements) of the
-    power adapters, i.e. (where "_" means a removed adapter),
-
-    Block: [1]
-    Arrangements:
-    - [1]
-    Total: 1
-
-    Block: [1, 1]
-    Arrangements:
-    - [1, 1]
-    - [_, 1]
-    Total: 2
-
-    Block: [1, 1, 1]
-    Arrangements:
-    - [1, 1, 1]
-    - [_, 1, 1]
-    - [1, _, 1]
-    - [_, _, 1]
-    Total: 4
-
-
-    Block: [1, 1, 1, 1]
-    Arrangements:
-    - [1, 1, 1, 1]
-    - [_, 1, 1, 1]
-    - [1, _, 1, 1]
-    - [1, 1, _, 1]
-    - [_, _, 1, 1]
-    - [1, _, _, 1]
-    - [_, 1, _, 1]
-    Total: 7
-
-    For longer block sizes the pattern can be also computed but in the input
-    examples there is no such block.
+    return list(iter_file(path=path))
+
+
+class AdapterChain(NamedTuple):
+    jolts: array  # sorted, from the outlet to the device
+    differences: Dict[int, int]
+    num_arrangements: Optional[int]  # `None` unless counted
+
+
+def sort_adapters(adapters: Iterable[int]) -> array:
+    """Counting sort of the adapters, O(n + max jolt) as jolts are small.
+
+    The outlet and device jolts are added to the adapters.
     """
-    _BLOCK_SIZE_TO_NUM_ARRANGEMENTS = {
-        1: 1,
-        2: 2,
-        3: 4,
-        4: 7,
-    }
+    adapters = array('q', adapters)
+    if not adapters:
+        raise ValueError('No adapters given')
+    if min(adapters) <= OUTLET_JOLT:
+        raise ValueError(f'Adapters must be above {OUTLET_JOLT} jolts')
 
-    differences = [b - a for a, b in zip(jolts, jolts[1:])]
-    one_block_lengths = [
-        len(list(values))
-        for difference, values in groupby(differences)
-        if difference == 1
-    ]
+    device_jolt = max(adapters) + DEVICE_JOLT_OFFSET
 
-    num_arrangements_for_blocks = [
-        _BLOCK_SIZE_TO_NUM_ARRANGEMENTS[block_size]
-        for block_size in one_block_lengths
-    ]
+    present = bytearray(device_jolt + 1)
+    present[OUTLET_JOLT] = present[device_jolt] = 1
+    for jolt in adapters:
+        if present[jolt]:
+            raise ValueError(f'Adapters must be distinct: {jolt}')
+        present[jolt] = 1
 
-    return reduce(mul, num_arrangements_for_blocks)
+    return array('q', compress(range(device_jolt + 1), present))
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def count_jolt_differences(jolts: Sequence[int]) -> Dict[int, int]:
+    return Counter(b - a for a, b in zip(jolts, islice(jolts, 1, None)))
 
-    for tf in test_files:
-        print('Test file:', tf)
 
-        adapter_jolts = parse_file(path=tf)
+def iter_arrangements(
+    jolts: Sequence[int],
+    gaps: Iterable[int] = JOLT_GAPS,
+    modulus: Optional[int] = None,
+) -> Iterator[Tuple[int, int]]:
+    """Yields every jolt with the number of chains from the first jolt to it.
 
-        # Add input and device jolts
-        adapter_jolts = [
-            0, *sorted(adapter_jolts), max(adapter_jolts) + 3
-        ]
+    The number of chains ending at a jolt is the sum of those ending at the
+    jolts one gap below, so only the jolts within the largest gap are kept.
+    Counts grow exponentially with long chains - they can be reduced
+    `modulus` to keep the arithmetic cheap.
+    """
+    gaps = sorted(set(gaps))
+    if not gaps or gaps[0] <= 0:
+        raise ValueError(f'Gaps must be positive: {gaps}')
+    max_gap = gaps[-1]
+
+    ways = {jolts[0]: 1}
+    window = deque([jolts[0]])
+    yield jolts[0], 1
+
+    for previous, jolt in zip(jolts, islice(jolts, 1, None)):
+        if jolt <= previous:
+            raise ValueError(f'Jolts must be sorted and distinct: {jolt}')
+
+        while window and window[0] < jolt - max_gap:
+            del ways[window.popleft()]
+
+        num_ways = sum(ways.get(jolt - gap, 0) for gap in gaps)
+        if modulus is not None:
+            num_ways %= modulus
+
+        ways[jolt] = num_ways
+        window.append(jolt)
+        yield jolt, num_ways
+
+
+def count_arrangements(
+    jolts: Sequence[int],
+    gaps: Iterable[int] = JOLT_GAPS,
+    modulus: Optional[int] = None,
+) -> int:
+    """Counts the chains from the first to the last of the (sorted, distinct)
+    jolts in which every step is one of the allowed gaps.
+    """
+    *_, (_, num_ways) = iter_arrangements(
+        jolts=jolts,
+        gaps=gaps,
+        modulus=modulus,
+    )
+    return num_ways
+
+
+def build_adapter_chain(
+    adapters: Iterable[int],
+    gaps: Iterable[int] = JOLT_GAPS,
+    modulus: Optional[int] = None,
+    arrangements: bool = True,
+) -> AdapterChain:
+    """Sorts the adapters, then counts the differences and arrangements of
+    the chain in a single pass.
+
+    Counting arrangements is skipped unless `arrangements` is set - without
+    a `modulus` the counts of a long chain are huge integers, which dominate
+    the pass.
+    """
+    jolts = sort_adapters(adapters=adapters)
+    if arrangements:
+        steps = iter_arrangements(jolts=jolts, gaps=gaps, modulus=modulus)
+    else:
+        steps = zip(jolts, repeat(None))
+
+    differences = Counter()
+    previous = num_ways = None
+    for jolt, num_ways in steps:
+        if previous is not None:
+            differences[jolt - previous] += 1
+        previous = jolt
+
+    return AdapterChain(
+        jolts=jolts,
+        differences=differences,
+        num_arrangements=num_ways,
+    )
+
+
+def solve_part_1(path: str) -> int:
+    counts = build_adapter_chain(
+        adapters=iter_file(path=path),
+        arrangements=False,
+    ).differences
+    return counts[1] * counts[3]
 
-        counts = count_jolt_differences(jolts=adapter_jolts)
-        solution = counts[1] * counts[3]
+
+def solve_part_2(path: str) -> int:
+    return build_adapter_chain(adapters=iter_file(path=path)).num_arrangements
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Number of 1-jolt differences multiplied by '
             'the number of 3-jolt differences:',
-            solution,
+            solve_part_1(path=tf),
         )
 
-        num_arrangements = count_arrangements(jolts=adapter_jolts)
-
         print(
             '(Part 2) '
             'Number of different arrangements:',
-            num_arrangements,
+            solve_part_2(path=tf),
         )
 
 
@@ -1,11 +1,45 @@
 """Day 11 - Advent of Code"""
+import os
+import sys
+from collections import namedtuple
 from typing import Callable, List, Optional
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
 
 EMPTY_SEAT = 'L'
 OCCUPIED_SEAT = '#'
 FLOOR = '.'
 
+# Occupied neighbors (direct / visible) which make a seat become empty
+DIRECT_TOLERANCE = 4
+VISIBLE_TOLERANCE = 5
+
+# `(row, column)` offsets of the 8 neighbors
+DIRECTIONS = [
+    (dr, dc)
+    for dr in (-1, 0, 1)
+    for dc in (-1, 0, 1)
+    if (dr, dc) != (0, 0)
+]
+
+# Layout as `numpy` arrays of the same shape: `seats` marks all (empty or
+# occupied) seats, `occupied` the occupied ones - both `uint8` 0 / 1 masks
+SeatArrays = namedtuple('SeatArrays', ['seats', 'occupied'])
+
+# Seats visible from every seat: seats are numbered in row-major order
+# (`seat_cells` are their flat cells) and `neighbors[d, i]` is the seat visible
+# from seat `i` in direction `DIRECTIONS[d]` - the number of seats if there is
+# none (`int32` arrays)
+VisibleSeats = namedtuple('VisibleSeats', ['seat_cells', 'neighbors'])
+
 
 def parse_file(path: str) -> List[List[str]]:
     with open(path, 'r') as fin:
@@ -140,6 +174,7 @@ def simulate(
     height, width = len(seats_layout), len(seats_layout[0])
 
     prev_layout, current_layout = seats_layout, []
+    older_layout = None
 
     while True:
         # Perform single simulation step
@@ -172,42 +207,275 @@ def simulate(
         # Check if changed
         if prev_layout == current_layout:
             return current_layout
-        else:
-            prev_layout, current_layout = current_layout, []
 
+        # Some layouts alternate between two states forever
+        if current_layout == older_layout:
+            raise RuntimeError('Layout oscillates between two states')
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+        older_layout, prev_layout, current_layout = (
+            prev_layout, current_layout, [],
+        )
 
-    for tf in test_files:
-        print('Test file:', tf)
 
-        seats_layout = parse_file(path=tf)
+def load_seat_arrays(path: str) -> SeatArrays:
+    """Loads the layout as arrays (requires `numpy`)."""
+    np = lazy_import('numpy')
+
+    rows = [bytes(line) for line in iter_lines(path)]
+    grid = np.frombuffer(b''.join(rows), dtype=np.uint8)
+    grid = grid.reshape(len(rows), len(rows[0]) if rows else 0)
+
+    return SeatArrays(
+        seats=(grid != ord(FLOOR)).view(np.uint8),
+        occupied=(grid == ord(OCCUPIED_SEAT)).view(np.uint8),
+    )
+
+
+def _first_seats(seats, cells, dr: int, dc: int):
+    """Cell of the first seat seen from every cell in direction `(dr, dc)`,
+    -1 if there is none.
+
+    Lines are processed towards the looking direction: a cell sees the seat
+    of the next cell, or whatever that cell sees if it is floor.
+    """
+    np = lazy_import('numpy')
+
+    if dr == 0:
+        # Horizontal directions are the vertical ones of the transposed grid
+        return _first_seats(seats=seats.T, cells=cells.T, dr=dc, dc=0).T
+
+    height, width = seats.shape
+    first = np.full((height, width), -1, dtype=np.int32)
+
+    # Columns of a row and of the next row in the looking direction
+    cols = slice(max(-dc, 0), width - max(dc, 0))
+    next_cols = slice(max(dc, 0), width - max(-dc, 0))
+
+    rows = range(height - 2, -1, -1) if dr > 0 else range(1, height)
+    for row in rows:
+        next_row = row + dr
+        first[row, cols] = np.where(
+            seats[next_row, next_cols],
+            cells[next_row, next_cols],
+            first[next_row, next_cols],
+        )
+
+    return first
+
+
+def build_visible_seats(seats) -> VisibleSeats:
+    """Finds the (at most 8) seats visible from every seat - the floor plan
+    never changes, so this is done once before simulating.
+    """
+    np = lazy_import('numpy')
+
+    cells = np.arange(seats.size, dtype=np.int32).reshape(seats.shape)
+    seat_cells = np.flatnonzero(seats)
+    num_seats = len(seat_cells)
+
+    # Cells without a visible seat (-1) point to the extra seat `num_seats`
+    seat_of_cell = np.full(seats.size + 1, num_seats, dtype=np.int32)
+    seat_of_cell[seat_cells] = np.arange(num_seats, dtype=np.int32)
+
+    neighbors = np.empty((len(DIRECTIONS), num_seats), dtype=np.int32)
+    for direction, (dr, dc) in enumerate(DIRECTIONS):
+        first = _first_seats(seats=seats, cells=cells, dr=dr, dc=dc)
+        neighbors[direction] = seat_of_cell[first.ravel()[seat_cells]]
+
+    return VisibleSeats(seat_cells=seat_cells, neighbors=neighbors)
+
+
+def _direct_neighbor_counter(shape) -> Callable:
+    np = lazy_import('numpy')
+
+    height, width = shape
+    padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    counts = np.empty((height, width), dtype=np.uint8)
+
+    def count_neighbors(occupied):
+        padded[1:-1, 1:-1] = occupied
+
+        counts.fill(0)
+        for dr, dc in DIRECTIONS:
+            np.add(
+                counts,
+                padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width],
+                out=counts,
+            )
+
+        return counts
 
-        final_seats_layout = simulate(
-            seats_layout=seats_layout,
-            neighbor_fn=get_direct_neighbors,
-            tolerance=4,
+    return count_neighbors
+
+
+def _visible_neighbor_counter(visible_seats: VisibleSeats) -> Callable:
+    np = lazy_import('numpy')
+
+    num_seats = len(visible_seats.seat_cells)
+    # The extra seat is never occupied
+    occupied_seats = np.zeros(num_seats + 1, dtype=np.uint8)
+    counts = np.empty(num_seats, dtype=np.uint8)
+    gathered = np.empty(num_seats, dtype=np.uint8)
+
+    def count_neighbors(occupied):
+        occupied_seats[:num_seats] = occupied
+
+        counts.fill(0)
+        for neighbors in visible_seats.neighbors:
+            np.take(occupied_seats, neighbors, out=gathered)
+            np.add(counts, gathered, out=counts)
+
+        return counts
+
+    return count_neighbors
+
+
+def _run_arrays(seats: SeatArrays, tolerance: int, visible: bool):
+    """Returns the last occupied cells, and the cells changing on every step
+    if the layout alternates between two states (`None` once stable).
+    """
+    np = lazy_import('numpy')
+
+    if visible:
+        visible_seats = build_visible_seats(seats=seats.seats)
+        count_neighbors = _visible_neighbor_counter(visible_seats)
+
+        # Only seats are simulated (all of them are seats)
+        is_seat = np.uint8(1)
+        occupied = seats.occupied.ravel()[visible_seats.seat_cells]
+    else:
+        count_neighbors = _direct_neighbor_counter(shape=seats.seats.shape)
+
+        is_seat = seats.seats
+        occupied = seats.occupied & seats.seats
+
+    previous, changing = None, None
+
+    while True:
+        counts = count_neighbors(occupied)
+        updated = is_seat & np.where(
+            occupied,
+            counts < tolerance,
+            counts == 0,
+        )
+
+        if np.array_equal(updated, occupied):
+            break
+        if previous is not None and np.array_equal(updated, previous):
+            changing = (updated != occupied).view(np.uint8)
+            break
+        previous, occupied = occupied, updated
+
+    if visible:
+        def to_cells(values):
+            cells = np.zeros(seats.seats.size, dtype=np.uint8)
+            cells[visible_seats.seat_cells] = values
+            return cells.reshape(seats.seats.shape)
+
+        occupied = to_cells(occupied)
+        if changing is not None:
+            changing = to_cells(changing)
+
+    return occupied, changing
+
+
+def simulate_arrays(
+    seats: SeatArrays,
+    tolerance: int,
+    visible: bool = False,
+) -> SeatArrays:
+    """Simulates the direct (or visible) neighbors rule on whole arrays until
+    stable.
+
+    Direct neighbors are counted for all cells by summing the 8 shifted views
+    of the zero-padded occupied array. Visible neighbors are gathered for the
+    seats only, from the precomputed `VisibleSeats`. Some layouts never become
+    stable but alternate between two states, which raises a `RuntimeError`.
+    """
+    occupied, changing = _run_arrays(
+        seats=seats,
+        tolerance=tolerance,
+        visible=visible,
+    )
+    if changing is not None:
+        raise RuntimeError('Layout oscillates between two states')
+
+    return seats._replace(occupied=occupied)
+
+
+def find_oscillating_seats(
+    seats: SeatArrays,
+    tolerance: int,
+    visible: bool = False,
+):
+    """Mask of the seats alternating forever, `None` if the layout becomes
+    stable (see `simulate_arrays`).
+    """
+    _, changing = _run_arrays(
+        seats=seats,
+        tolerance=tolerance,
+        visible=visible,
+    )
+    return changing
+
+
+def solve_part_1(path: str) -> int:
+    try:
+        seats = load_seat_arrays(path=path)
+    except ModuleNotFoundError:
+        # Without `numpy` the layout is simulated cell by cell
+        pass
+    else:
+        final_seats = simulate_arrays(
+            seats=seats,
+            tolerance=DIRECT_TOLERANCE,
         )
-        num_occupied_seats = sum(row.count('#') for row in final_seats_layout)
+        return int(final_seats.occupied.sum())
+
+    final_seats_layout = simulate(
+        seats_layout=parse_file(path=path),
+        neighbor_fn=get_direct_neighbors,
+        tolerance=DIRECT_TOLERANCE,
+    )
+    return sum(row.count(OCCUPIED_SEAT) for row in final_seats_layout)
+
+
+def solve_part_2(path: str) -> int:
+    try:
+        seats = load_seat_arrays(path=path)
+    except ModuleNotFoundError:
+        # Without `numpy` the layout is simulated cell by cell
+        pass
+    else:
+        final_seats = simulate_arrays(
+            seats=seats,
+            tolerance=VISIBLE_TOLERANCE,
+            visible=True,
+        )
+        return int(final_seats.occupied.sum())
+
+    final_seats_layout = simulate(
+        seats_layout=parse_file(path=path),
+        neighbor_fn=get_visible_neighbors,
+        tolerance=VISIBLE_TOLERANCE,
+    )
+    return sum(row.count(OCCUPIED_SEAT) for row in final_seats_layout)
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Number of occupied seats:',
-            num_occupied_seats,
-        )
-
-        final_seats_layout = simulate(
-            seats_layout=seats_layout,
-            neighbor_fn=get_visible_neighbors,
-            tolerance=5,
+            solve_part_1(path=tf),
         )
-        num_occupied_seats = sum(row.count('#') for row in final_seats_layout)
 
         print(
             '(Part 2) '
             'Number of occupied seats:',
-            num_occupied_seats,
+            solve_part_2(path=tf),
         )
 
 
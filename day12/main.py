@@ -1,7 +1,18 @@
 """Day 12 - Advent of Code"""
+import os
+import sys
 from dataclasses import dataclass
 import math
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
 
 
 @dataclass
@@ -10,12 +21,13 @@ class Point2D:
     y: int
 
 
+def iter_file(path: str) -> Iterator[Tuple[str, int]]:
+    for line in iter_lines(path):
+        yield chr(line[0]), int(line[1:])
+
+
 def parse_file(path: str) -> List[Tuple[str, int]]:
-    with open(path, 'r') as fin:
-        return [
-            (line[0], int(line[1:]))
-            for line in fin.readlines()
-        ]
+    return list(iter_file(path=path))
 
 
 def rotate(
@@ -43,7 +55,7 @@ def rotate(
     return Point2D(int(x), int(y))
 
 
-def navigate_ship(instructions: List[Tuple[str, int]]) -> Point2D:
+def navigate_ship(instructions: Iterable[Tuple[str, int]]) -> Point2D:
     position = Point2D(x=0, y=0)
     direction = Point2D(x=1, y=0)
 
@@ -68,7 +80,7 @@ def navigate_ship(instructions: List[Tuple[str, int]]) -> Point2D:
 
 
 def navigate_ship_using_waypoint(
-    instructions: List[Tuple[str, int]],
+    instructions: Iterable[Tuple[str, int]],
     waypoint_x: int,
     waypoint_y: int,
 ) -> Point2D:
@@ -104,38 +116,38 @@ def navigate_ship_using_waypoint(
     return position
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def solve_part_1(path: str) -> int:
+    final_position = navigate_ship(instructions=iter_file(path=path))
+    return abs(final_position.x) + abs(final_position.y)
 
-    for tf in test_files:
-        print('Test file:', tf)
 
-        instructions = parse_file(path=tf)
+def solve_part_2(path: str) -> int:
+    final_position_using_waypoint = navigate_ship_using_waypoint(
+        instructions=iter_file(path=path),
+        waypoint_x=10,
+        waypoint_y=1,
+    )
+    return (
+        abs(final_position_using_waypoint.x)
+        + abs(final_position_using_waypoint.y)
+    )
 
-        final_position = navigate_ship(instructions=instructions)
-        mh_distance = abs(final_position.x) + abs(final_position.y)
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Ship\'s Manhattan distance from starting position:',
-            mh_distance,
-        )
-
-        final_position_using_waypoint = navigate_ship_using_waypoint(
-            instructions=instructions,
-            waypoint_x=10,
-            waypoint_y=1,
-        )
-        mh_distance_waypoint = (
-            abs(final_position_using_waypoint.x)
-            + abs(final_position_using_waypoint.y)
+            solve_part_1(path=tf),
         )
 
         print(
             '(Part 2) '
             'Ship\'s Manhattan distance from starting position '
             '(using waypoint):',
-            mh_distance_waypoint,
+            solve_part_2(path=tf),
         )
 
 
@@ -1,6 +1,23 @@
 """Day 13 - Advent of Code"""
 from typing import List, Tuple
 
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+# Bus schedules from the puzzle description (`python -m aoc.regression`)
+EXAMPLES = {
+    1: [],
+    2: [
+        ([17, 'x', 13, 19], 3_417),
+        ([67, 7, 59, 61], 754_018),
+        ([67, 'x', 7, 59, 61], 779_210),
+        ([67, 7, 'x', 59, 61], 1_261_476),
+        ([1789, 37, 47, 1889], 1_202_161_486),
+    ],
+}
+
 
 def parse_file(path: str) -> Tuple[int, List[int]]:
     with open(path, 'r') as fin:
@@ -71,44 +88,42 @@ def mul_inv(a, b):
     return 1
 
 
-def main():
-    test_files = ['./data/example.txt', './data/input.txt']
+def solve_part_1(path: str) -> int:
+    timestamp, bus_ids = parse_file(path=path)
 
-    test_cases_part_2 = [
-        ([17, 'x', 13, 19], 3_417),
-        ([67, 7, 59, 61], 754_018),
-        ([67, 'x', 7, 59, 61], 779_210),
-        ([67, 7, 'x', 59, 61], 1_261_476),
-        ([1789, 37, 47, 1889], 1_202_161_486),
-    ]
-    assert all(
-        find_earliest_timestamp(inp) == outp
-        for inp, outp in test_cases_part_2
+    bus_ids_part_1 = [bid for bid in bus_ids if bid != 'x']
+    earliest_bid, waiting_time = find_earliest_bus_ID(
+        timestamp=timestamp,
+        bus_ids=bus_ids_part_1,
     )
 
-    for tf in test_files:
-        print('Test file:', tf)
+    return earliest_bid * waiting_time
 
-        timestamp, bus_ids = parse_file(path=tf)
 
-        bus_ids_part_1 = [bid for bid in bus_ids if bid != 'x']
-        earliest_bid, waiting_time = find_earliest_bus_ID(
-            timestamp=timestamp,
-            bus_ids=bus_ids_part_1,
-        )
+def solve_part_2(path: str) -> int:
+    _, bus_ids = parse_file(path=path)
+    return find_earliest_timestamp(bus_ids=bus_ids)
+
+
+def solve_example(part: int, example: List[int]) -> int:
+    """Only part 2 has examples (bus schedules without a timestamp)."""
+    return find_earliest_timestamp(bus_ids=example)
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
-        solution = earliest_bid * waiting_time
         print(
             '(Part 1) '
             'Bus ID multiplied by the number of minutes to wait:',
-            solution,
+            solve_part_1(path=tf),
         )
 
-        earliest_timestamp = find_earliest_timestamp(bus_ids=bus_ids)
         print(
             '(Part 2) '
             'Earliest timestamp that matches requirements:',
-            earliest_timestamp,
+            solve_part_2(path=tf),
         )
 
 
@@ -1,7 +1,18 @@
 """Day 14 - Advent of Code"""
+import os
+import sys
 from itertools import product
 
-from typing import Dict, Generator, List, NamedTuple, Union
+from typing import Dict, Generator, Iterable, Iterator, List, NamedTuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example2.txt', './data/input.txt'),
+}
 
 
 class MaskInstruction(NamedTuple):
@@ -13,33 +24,33 @@ class MemoryWriteInstruction(NamedTuple):
     value: int
 
 
-Instructions = List[Union[MaskInstruction, MemoryWriteInstruction]]
+Instruction = Union[MaskInstruction, MemoryWriteInstruction]
+Instructions = List[Instruction]
 
 
-def parse_file(path: str) -> Instructions:
-    instructions = []
-    with open(path, 'r') as fin:
-        for line in fin.readlines():
-            if line.startswith('mask'):
-                mask = line.split(' = ')[1].strip()
+def iter_file(path: str) -> Iterator[Instruction]:
+    for line in iter_lines(path):
+        line = str(line, 'ascii')
 
-                instructions.append(MaskInstruction(mask=mask))
+        if line.startswith('mask'):
+            mask = line.split(' = ')[1].strip()
 
-            elif line.startswith('mem'):
-                instr, value = line.split(' = ')
+            yield MaskInstruction(mask=mask)
 
-                address = int(instr.replace('mem[', '').replace(']', ''))
-                value = int(value)
+        elif line.startswith('mem'):
+            instr, value = line.split(' = ')
 
-                instructions.append(MemoryWriteInstruction(
-                    address=address,
-                    value=value,
-                ))
+            address = int(instr.replace('mem[', '').replace(']', ''))
+            value = int(value)
 
-            else:
-                raise ValueError(f'Unknown instruction: \"{line}\"')
+            yield MemoryWriteInstruction(address=address, value=value)
 
-    return instructions
+        else:
+            raise ValueError(f'Unknown instruction: \"{line}\"')
+
+
+def parse_file(path: str) -> Instructions:
+    return list(iter_file(path=path))
 
 
 def apply_mask(value: int, mask: str) -> int:
@@ -52,7 +63,7 @@ def apply_mask(value: int, mask: str) -> int:
     return value
 
 
-def execute(instructions: Instructions) -> Dict[int, int]:
+def execute(instructions: Iterable[Instruction]) -> Dict[int, int]:
     memory = {}
     current_mask = None
 
@@ -90,7 +101,7 @@ def generate_addresses(address: int, mask: str) -> Generator[int, None, None]:
         yield tmp
 
 
-def execute_v2(instructions: Instructions) -> Dict[int, int]:
+def execute_v2(instructions: Iterable[Instruction]) -> Dict[int, int]:
     memory = {}
     current_mask = None
 
@@ -108,35 +119,33 @@ def execute_v2(instructions: Instructions) -> Dict[int, int]:
     return memory
 
 
-def main():
-    for tf in ('./data/example.txt', './data/input.txt'):
-        print('Test file:', tf)
+def solve_part_1(path: str) -> int:
+    memory = execute(instructions=iter_file(path=path))
+    return sum(v for v in memory.values())
+
 
-        instructions = parse_file(path=tf)
+def solve_part_2(path: str) -> int:
+    memory_v2 = execute_v2(instructions=iter_file(path=path))
+    return sum(v for v in memory_v2.values())
 
-        memory = execute(instructions=instructions)
 
-        solution = sum(v for v in memory.values())
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Sum of all values in memory:',
-            solution,
+            solve_part_1(path=tf),
         )
 
-    for tf in ('./data/example2.txt', './data/input.txt'):
+    for tf in INPUT_FILES[2]:
         print('Test file:', tf)
 
-        instructions = parse_file(path=tf)
-
-        memory_v2 = execute_v2(instructions=instructions)
-
-        solution_v2 = sum(v for v in memory_v2.values())
-
         print(
             '(Part 2) '
             'Sum of all values in memory:',
-            solution_v2
+            solve_part_2(path=tf),
         )
 
 
@@ -1,6 +1,42 @@
 """Day 15 - Advent of Code"""
 from typing import List
 
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
+MAX_STEPS = {
+    1: 2020,
+    2: 30_000_000,
+}
+
+# Starting numbers from the puzzle description (besides `data/example.txt`).
+# Part 2 takes minutes, so they are only checked by `python -m aoc.regression`.
+EXAMPLES = {
+    1: [
+        ([1, 3, 2], 1),
+        ([2, 1, 3], 10),
+        ([1, 2, 3], 27),
+        ([2, 3, 1], 78),
+        ([3, 2, 1], 438),
+        ([3, 1, 2], 1836),
+    ],
+    2: [
+        ([1, 3, 2], 2_578),
+        ([2, 1, 3], 3_544_142),
+        ([1, 2, 3], 261_214),
+        ([2, 3, 1], 6_895_259),
+        ([3, 2, 1], 18),
+        ([3, 1, 2], 362),
+    ],
+}
+
+
+def parse_file(path: str) -> List[int]:
+    with open(path, 'r') as fin:
+        return [int(num) for num in fin.read().strip().split(',')]
+
 
 def simulate_game(starting_numbers: List[int], max_step: int) -> int:
     numbers = {n: [i+1] for i, n in enumerate(starting_numbers)}
@@ -21,42 +57,36 @@ def simulate_game(starting_numbers: List[int], max_step: int) -> int:
     return last_spoken
 
 
+def solve_part_1(path: str) -> int:
+    return simulate_game(
+        starting_numbers=parse_file(path=path),
+        max_step=MAX_STEPS[1],
+    )
+
+
+def solve_part_2(path: str) -> int:
+    return simulate_game(
+        starting_numbers=parse_file(path=path),
+        max_step=MAX_STEPS[2],
+    )
+
+
+def solve_example(part: int, example: List[int]) -> int:
+    return simulate_game(starting_numbers=example, max_step=MAX_STEPS[part])
+
+
 def main():
-    test_inputs = {
-        2020: [
-            ([0, 3, 6], 436),
-            ([1, 3, 2], 1),
-            ([2, 1, 3], 10),
-            ([1, 2, 3], 27),
-            ([2, 3, 1], 78),
-            ([3, 2, 1], 438),
-            ([3, 1, 2], 1836),
-        ],
-        30_000_000: [
-            ([0, 3, 6], 175_594),
-            ([1, 3, 2], 2_578),
-            ([2, 1, 3], 3_544_142),
-            ([1, 2, 3], 261_214),
-            ([2, 3, 1], 6_895_259),
-            ([3, 2, 1], 18),
-            ([3, 1, 2], 362),
-        ],
-    }
-    my_puzzle_input = [19, 20, 14, 0, 9, 1]
-
-    for idx, max_step in enumerate((2020, 30_000_000)):
-        assert all(
-            simulate_game(starting_numbers=ti, max_step=max_step) == expected
-            for ti, expected in test_inputs[max_step]
-        )
+    tf = INPUT_FILES[1][-1]
 
+    for part, max_step in MAX_STEPS.items():
+        my_puzzle_input = parse_file(path=tf)
         print('My input:', my_puzzle_input)
         value = simulate_game(
             starting_numbers=my_puzzle_input,
             max_step=max_step,
         )
 
-        print(f'(Part {idx + 1}) The {max_step}th number is: {value}')
+        print(f'(Part {part}) The {max_step}th number is: {value}')
 
 
 if __name__ == '__main__':
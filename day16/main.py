@@ -4,6 +4,11 @@ from functools import reduce
 from operator import mul
 from typing import List, NamedTuple, Tuple
 
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/input.txt',),
+}
+
 
 class ValidationRule(NamedTuple):
     name: str
@@ -116,56 +121,65 @@ def match_names(
     return [n for n, _ in sorted(zip(names, idxs), key=lambda v: v[1])]
 
 
-def main():
-    for tf in ('./data/example.txt', './data/input.txt'):
-        print('Test file:', tf)
-
-        task_input = parse_file(path=tf)
-
-        invalid_numbers = find_invalid_numbers(
-            nearby_tickets=task_input.nearby_tickets,
+def match_ticket_fields(task_input: TaskInput) -> List[str]:
+    valid_tickets = [
+        ticket
+        for ticket in task_input.nearby_tickets
+        if is_valid_ticket(
+            ticket=ticket,
             validation_rules=task_input.validation_rules,
         )
-        error_rate = sum(invalid_numbers)
+    ]
+
+    return match_names(
+        tickets=[task_input.your_ticket, *valid_tickets],
+        validation_rules=task_input.validation_rules,
+    )
+
+
+def solve_part_1(path: str) -> int:
+    task_input = parse_file(path=path)
+
+    invalid_numbers = find_invalid_numbers(
+        nearby_tickets=task_input.nearby_tickets,
+        validation_rules=task_input.validation_rules,
+    )
+    return sum(invalid_numbers)
+
+
+def solve_part_2(path: str) -> int:
+    task_input = parse_file(path=path)
+    names = match_ticket_fields(task_input=task_input)
+
+    departure_values = [
+        value
+        for name, value in zip(names, task_input.your_ticket)
+        if name.startswith('departure')
+    ]
+    return reduce(mul, departure_values)
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Ticket scanning error rate:',
-            error_rate,
+            solve_part_1(path=tf),
         )
 
-    for tf in ('./data/example2.txt', './data/input.txt'):
+    for tf in ('./data/example2.txt', *INPUT_FILES[2]):
         print('Test file:', tf)
 
-        task_input = parse_file(path=tf)
-
-        valid_tickets = [
-            ticket
-            for ticket in task_input.nearby_tickets
-            if is_valid_ticket(
-                ticket=ticket,
-                validation_rules=task_input.validation_rules,
-            )
-        ]
-
-        names = match_names(
-            tickets=[task_input.your_ticket, *valid_tickets],
-            validation_rules=task_input.validation_rules,
-        )
+        names = match_ticket_fields(task_input=parse_file(path=tf))
         print('Matched names:', names)
 
-        if tf == './data/input.txt':
-            departure_values = [
-                value
-                for name, value in zip(names, task_input.your_ticket)
-                if name.startswith('departure')
-            ]
-            solution = reduce(mul, departure_values)
-
+        if tf in INPUT_FILES[2]:
             print(
                 '(Part 2) '
                 'Multiplied departure values:',
-                solution,
+                solve_part_2(path=tf),
             )
 
 
@@ -3,6 +3,11 @@ from typing import Dict, List, Tuple
 
 DEBUG = True
 
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
+
 ACTIVE = '#'
 INACTIVE = '.'
 
@@ -150,26 +155,30 @@ def simulate_4d(
     return grid
 
 
+def solve_part_1(path: str) -> int:
+    final_grid_3d = simulate_3d(layer0=parse_file(path=path), num_steps=6)
+    return list(final_grid_3d.values()).count(ACTIVE)
+
+
+def solve_part_2(path: str) -> int:
+    final_grid_4d = simulate_4d(layer0=parse_file(path=path), num_steps=6)
+    return list(final_grid_4d.values()).count(ACTIVE)
+
+
 def main():
-    for tf in ('./data/example.txt', './data/input.txt'):
+    for tf in INPUT_FILES[1]:
         print('Test file:', tf)
 
-        layer0 = parse_file(path=tf)
-
-        final_grid_3d = simulate_3d(layer0=layer0, num_steps=6)
-        num_active_cubes_3d = list(final_grid_3d.values()).count(ACTIVE)
         print(
             '(Part 1) '
             '[3D] Number of active cubes after six cycles:',
-            num_active_cubes_3d,
+            solve_part_1(path=tf),
         )
 
-        final_grid_4d = simulate_4d(layer0=layer0, num_steps=6)
-        num_active_cubes_4d = list(final_grid_4d.values()).count(ACTIVE)
         print(
             '(Part 2) '
             '[4D] Number of active cubes after six cycles:',
-            num_active_cubes_4d,
+            solve_part_2(path=tf),
         )
 
 
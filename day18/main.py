@@ -1,10 +1,45 @@
 """Day 18 - Advent of Code"""
-from typing import Callable, List, Tuple
+import os
+import sys
+from typing import Callable, Iterator, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/input.txt',),
+    2: ('./data/input.txt',),
+}
+
+# Expressions from the puzzle description (`python -m aoc.regression`)
+EXAMPLES = {
+    1: [
+        ('1 + 2 * 3 + 4 * 5 + 6', 71),
+        ('1 + (2 * 3) + (4 * (5 + 6))', 51),
+        ('2 * 3 + (4 * 5)', 26),
+        ('5 + (8 * 3 + 9 + 3 * 4 * 3)', 437),
+        ('5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))', 12240),
+        ('((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2', 13632),
+    ],
+    2: [
+        ('1 + 2 * 3 + 4 * 5 + 6', 231),
+        ('1 + (2 * 3) + (4 * (5 + 6))', 51),
+        ('2 * 3 + (4 * 5)', 46),
+        ('5 + (8 * 3 + 9 + 3 * 4 * 3)', 1445),
+        ('5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))', 669060),
+        ('((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2', 23340),
+    ],
+}
+
+
+def iter_file(path: str) -> Iterator[str]:
+    for line in iter_lines(path):
+        yield str(line, 'ascii').strip()
 
 
 def parse_file(path: str) -> List[str]:
-    with open(path, 'r') as fin:
-        return [line.strip() for line in fin.readlines()]
+    return list(iter_file(path=path))
 
 
 def find_parenthesis(expression: str) -> Tuple[int, int]:
@@ -103,53 +138,45 @@ def compute(
     return result
 
 
-def main():
-    test_cases = [
-        '1 + 2 * 3 + 4 * 5 + 6',
-        '1 + (2 * 3) + (4 * (5 + 6))',
-        '2 * 3 + (4 * 5)',
-        '5 + (8 * 3 + 9 + 3 * 4 * 3)',
-        '5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))',
-        '((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2',
-    ]
-
-    tf = './data/input.txt'
-    print('Test file:', tf)
+def solve_part_1(path: str) -> int:
+    """Multiplication and addition have the same precedence."""
+    return sum(
+        compute(expression=ex, simple_compute_fn=_compute_same_precedence)
+        for ex in iter_file(path=path)
+    )
 
-    expressions = parse_file(path=tf)
 
-    # Part 1 - multiplication and addition have same precedence
-    same_precedence_results = [71, 51, 26, 437, 12240, 13632]
-    assert all(
-        compute(ex, _compute_same_precedence) == res
-        for ex, res in zip(test_cases, same_precedence_results)
+def solve_part_2(path: str) -> int:
+    """Addition is evaluated **before** multiplication."""
+    return sum(
+        compute(expression=ex, simple_compute_fn=_compute_diff_precedence)
+        for ex in iter_file(path=path)
     )
 
-    all_expressions_sum = sum([
-        compute(expression=ex, simple_compute_fn=_compute_same_precedence)
-        for ex in expressions
-    ])
+
+def solve_example(part: int, example: str) -> int:
+    simple_compute_fn = (
+        _compute_same_precedence if part == 1 else _compute_diff_precedence
+    )
+    return compute(expression=example, simple_compute_fn=simple_compute_fn)
+
+
+def main():
+    tf = INPUT_FILES[1][0]
+    print('Test file:', tf)
+
+    # Part 1 - multiplication and addition have same precedence
     print(
         '(Part 1) '
         'Sum of all expressions:',
-        all_expressions_sum,
+        solve_part_1(path=tf),
     )
 
     # Part 2 - addition is evaluated **before** multiplication
-    diff_precedence_results = [231, 51, 46, 1445, 669060, 23340]
-    assert all(
-        compute(ex, _compute_diff_precedence) == res
-        for ex, res in zip(test_cases, diff_precedence_results)
-    )
-
-    all_expressions_sum = sum([
-        compute(expression=ex, simple_compute_fn=_compute_diff_precedence)
-        for ex in expressions
-    ])
     print(
         '(Part 2) '
         'Sum of all expressions:',
-        all_expressions_sum,
+        solve_part_2(path=tf),
     )
 
 
@@ -4,6 +4,11 @@ from __future__ import annotations
 from itertools import product
 from typing import Dict, List, NamedTuple, Tuple, Union
 
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example2.txt', './data/input.txt'),
+}
+
 
 class Constant(NamedTuple):
     value: str
@@ -121,40 +126,48 @@ def matches_looped_rule_set(rules: Dict[str, Rule], message: str) -> bool:
     )
 
 
+def solve_part_1(path: str) -> int:
+    rules, messages = parse_file(path=path)
+
+    rule_0_possible_values = rules['0'].get(rules)
+
+    matched_messages = (
+        set(messages)
+        .intersection(set(rule_0_possible_values))
+    )
+    return len(matched_messages)
+
+
+def solve_part_2(path: str) -> int:
+    rules, messages = parse_file(path=path)
+
+    num_matched_messages = 0
+    for msg in messages:
+        if matches_looped_rule_set(rules, msg):
+            num_matched_messages += 1
+
+    return num_matched_messages
+
+
 def main():
     # Part 1
-    for tf in ('./data/example.txt', './data/input.txt'):
+    for tf in INPUT_FILES[1]:
         print('Test file:', tf)
 
-        rules, messages = parse_file(path=tf)
-
-        rule_0_possible_values = rules['0'].get(rules)
-
-        matched_messages = (
-            set(messages)
-            .intersection(set(rule_0_possible_values))
-        )
         print(
             '(Part 1) '
             'Number of messages matched using rule `0`:',
-            len(matched_messages),
+            solve_part_1(path=tf),
         )
 
     # Part 2
-    for tf in ('./data/example2.txt', './data/input.txt'):
+    for tf in INPUT_FILES[2]:
         print('Test file:', tf)
 
-        rules, messages = parse_file(path=tf)
-
-        num_matched_messages = 0
-        for msg in messages:
-            if matches_looped_rule_set(rules, msg):
-                num_matched_messages += 1
-
         print(
             '(Part 2) '
             'Number of messages matched using rule `0` (with loops):',
-            num_matched_messages,
+            solve_part_2(path=tf),
         )
 
 
@@ -1,10 +1,20 @@
 """Day 20 - Advent of Code"""
 from __future__ import annotations
 
+import os
+import sys
 from math import sqrt
 from typing import Generator, List, NamedTuple, Optional
 
-from tqdm import tqdm
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import progress  # noqa: E402
+from aoc.loader import iter_records  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
 
 # For clarity the pattern includes `-` instead of spaces
 SEA_MONSTER_PATTERN = """
@@ -90,14 +100,13 @@ class Tile(NamedTuple):
 
 def parse_file(path: str) -> List[Tile]:
     tiles = []
-    with open(path, 'r') as fin:
-        for tile in fin.read().split('\n\n'):
-            parts = tile.split('\n')
+    for tile in iter_records(path):
+        parts = str(tile, 'ascii').split('\n')
 
-            tid = int(parts[0].replace('Tile ', '').replace(':', ''))
-            image = parts[1:]
+        tid = int(parts[0].replace('Tile ', '').replace(':', ''))
+        image = parts[1:]
 
-            tiles.append(Tile(tid=tid, pixels=image))
+        tiles.append(Tile(tid=tid, pixels=image))
 
     return tiles
 
@@ -112,7 +121,7 @@ def align_tiles(tiles: List[Tile]) -> List[List[Tile]]:
     # Find the first row of the grid
     used_tiles = {upper_left_tile.tid}
 
-    for col in tqdm(range(1, image_size), desc='Fill first row'):
+    for col in progress(range(1, image_size), desc='Fill first row'):
         tiles = [t for t in tiles if t.tid not in used_tiles]
 
         for tile in tiles:
@@ -136,7 +145,7 @@ def align_tiles(tiles: List[Tile]) -> List[List[Tile]]:
         for col in range(image_size)
         for row in range(1, image_size)
     ]
-    for col, row in tqdm(positions, desc='Fill columns'):
+    for col, row in progress(positions, desc='Fill columns'):
         tiles = [t for t in tiles if t.tid not in used_tiles]
         for tile in tiles:
             res = find_matching_border(
@@ -159,7 +168,7 @@ def align_tiles(tiles: List[Tile]) -> List[List[Tile]]:
 def _find_upper_left_tile(tiles: List[Tile]) -> Tile:
     upper_left_tiles = []
 
-    for current_tile in tqdm(tiles, desc='Find upper left tile'):
+    for current_tile in progress(tiles, desc='Find upper left tile'):
         no_top_match = all(
             find_matching_border(
                 target_border=current_tile.border(which='top'),
@@ -263,9 +272,41 @@ def get_image_transforms(image: Tile) -> Generator[Tile, None, None]:
             yield image.flip(flip_type)
 
 
+def count_water_roughness(grid: List[List[Tile]]) -> int:
+    image = construct_image(grid=grid)
+    num_monsters = max(
+        count_monsters(img)
+        for img in get_image_transforms(image=image)
+    )
+
+    num_all_hashes = len([
+        c
+        for line in image.pixels
+        for c in line
+        if c == '#'
+    ])
+    num_monster_hashes = len(SEA_MONSTER_INDEXES) * num_monsters
+    return num_all_hashes - num_monster_hashes
+
+
+def solve_part_1(path: str) -> int:
+    grid = align_tiles(tiles=parse_file(path=path))
+    N = len(grid)
+
+    return (
+        grid[0][0].tid * grid[0][N - 1].tid
+        * grid[N - 1][0].tid * grid[N - 1][N - 1].tid
+    )
+
+
+def solve_part_2(path: str) -> int:
+    grid = align_tiles(tiles=parse_file(path=path))
+    return count_water_roughness(grid=grid)
+
+
 def main():
 
-    for tf in ('./data/example.txt', './data/input.txt'):
+    for tf in INPUT_FILES[1]:
         print('Test file:', tf)
 
         tiles = parse_file(path=tf)
@@ -284,20 +325,7 @@ def main():
         )
 
         # Part 2
-        image = construct_image(grid=grid)
-        num_monsters = max(
-            count_monsters(img)
-            for img in get_image_transforms(image=image)
-        )
-
-        num_all_hashes = len([
-            c
-            for line in image.pixels
-            for c in line
-            if c == '#'
-        ])
-        num_monster_hashes = len(SEA_MONSTER_INDEXES) * num_monsters
-        water_roughness = num_all_hashes - num_monster_hashes
+        water_roughness = count_water_roughness(grid=grid)
 
         print(
             '(Part 2) '
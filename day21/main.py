@@ -1,26 +1,38 @@
 """Day 21 - Advent of Code"""
+import os
+import sys
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
 
 Food = Tuple[List[str], List[str]]
 
 
+def iter_file(path: str) -> Iterator[Food]:
+    for line in iter_lines(path):
+        ingredients, allergens = str(line, 'ascii').split('(')
+        ingredients = ingredients.strip().split(' ')
+        allergens = (
+            allergens
+            .strip()
+            .replace('contains', '')
+            .replace(')', '')
+            .replace(' ', '')
+            .split(',')
+        )
+        yield ingredients, allergens
+
+
 def parse_file(path: str) -> List[Food]:
-    food = []
-    with open(path, 'r') as fin:
-        for line in fin.readlines():
-            ingredients, allergens = line.split('(')
-            ingredients = ingredients.strip().split(' ')
-            allergens = (
-                allergens
-                .strip()
-                .replace('contains', '')
-                .replace(')', '')
-                .replace(' ', '')
-                .split(',')
-            )
-            food.append((ingredients, allergens))
-    return food
+    return list(iter_file(path=path))
 
 
 def get_unique_ingredients_and_allergens(
@@ -74,44 +86,51 @@ def get_allergen_to_ingredient_mapping(
     return mapping
 
 
-def main():
-    # Part 1
-    for tf in ('./data/example.txt', './data/input.txt'):
-        print('Test file:', tf)
+def solve_part_1(path: str) -> int:
+    food = parse_file(path=path)
 
-        food = parse_file(path=tf)
+    all_ingredients, _ = get_unique_ingredients_and_allergens(food=food)
+    allergen2ingredient = get_allergen_to_ingredient_mapping(food=food)
 
-        all_ingredients, all_allergens = get_unique_ingredients_and_allergens(
-            food=food
-        )
-        allergen2ingredient = get_allergen_to_ingredient_mapping(food=food)
+    ingredients_without_allegrens = (
+        all_ingredients - set(allergen2ingredient.values())
+    )
 
-        ingredients_without_allegrens = (
-            all_ingredients - set(allergen2ingredient.values())
-        )
+    count = 0
+    for ingredients, _ in food:
+        for i in ingredients:
+            if i in ingredients_without_allegrens:
+                count += 1
+
+    return count
+
+
+def solve_part_2(path: str) -> str:
+    allergen2ingredient = get_allergen_to_ingredient_mapping(
+        food=parse_file(path=path),
+    )
+
+    return ','.join([
+        e[1]
+        for e in
+        sorted(allergen2ingredient.items(), key=lambda x: x[0])
+    ])
 
-        count = 0
-        for ingredients, _ in food:
-            for i in ingredients:
-                if i in ingredients_without_allegrens:
-                    count += 1
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Number of occurrences of non-allergen ingredients:',
-            count,
+            solve_part_1(path=tf),
         )
 
-        dangerous_ingredients = ','.join([
-            e[1]
-            for e in
-            sorted(allergen2ingredient.items(), key=lambda x: x[0])
-        ])
-
         print(
             '(Part 2) '
             'Canonical dangerous ingredient list:',
-            dangerous_ingredients
+            solve_part_2(path=tf),
         )
 
 
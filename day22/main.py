@@ -1,14 +1,24 @@
 """Day 22 - Advent of Code"""
+import os
+import sys
 from typing import List, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def parse_file(path: str) -> Tuple[List[int], List[int]]:
-    with open(path, 'r') as fin:
-        player_1_deck, player_2_deck = fin.read().split('\n\n')
+from aoc.loader import iter_records  # noqa: E402
+
+INPUT_FILES = {
+    1: ('./data/example.txt', './data/input.txt'),
+    2: ('./data/example.txt', './data/input.txt'),
+}
 
-        player_1_deck = [int(card) for card in player_1_deck.split('\n')[1:]]
-        player_2_deck = [int(card) for card in player_2_deck.split('\n')[1:]]
-        return player_1_deck, player_2_deck
+
+def parse_file(path: str) -> Tuple[List[int], List[int]]:
+    player_1_deck, player_2_deck = [
+        [int(card) for card in str(deck, 'ascii').split('\n')[1:]]
+        for deck in iter_records(path)
+    ]
+    return player_1_deck, player_2_deck
 
 
 def play(deck1: List[int], deck2: List[int]) -> List[int]:
@@ -69,41 +79,41 @@ def play_recursive(deck1: List[int], deck2: List[int]):
         history.add((tuple(deck1), tuple(deck2)))
 
 
-def main():
-    for tf in ('./data/example.txt', './data/input.txt'):
-        print('Test file:', tf)
+def compute_score(deck: List[int]) -> int:
+    return sum(
+        (idx + 1) * card
+        for idx, card in enumerate(reversed(deck))
+    )
 
-        player_1_deck, player_2_deck = parse_file(path=tf)
-        winning_deck = play(
-            deck1=player_1_deck.copy(),
-            deck2=player_2_deck.copy(),
-        )
 
-        winning_player_score = sum(
-            (idx + 1) * card
-            for idx, card in enumerate(reversed(winning_deck))
-        )
+def solve_part_1(path: str) -> int:
+    player_1_deck, player_2_deck = parse_file(path=path)
+    return compute_score(deck=play(deck1=player_1_deck, deck2=player_2_deck))
+
+
+def solve_part_2(path: str) -> int:
+    player_1_deck, player_2_deck = parse_file(path=path)
+    _, winning_deck_recursive = play_recursive(
+        deck1=player_1_deck,
+        deck2=player_2_deck,
+    )
+    return compute_score(deck=winning_deck_recursive)
+
+
+def main():
+    for tf in INPUT_FILES[1]:
+        print('Test file:', tf)
 
         print(
             '(Part 1) '
             'Winning player score:',
-            winning_player_score,
-        )
-
-        _, winning_deck_recursive = play_recursive(
-            deck1=player_1_deck.copy(),
-            deck2=player_2_deck.copy(),
-        )
-
-        winning_player_score_recursive = sum(
-            (idx + 1) * card
-            for idx, card in enumerate(reversed(winning_deck_recursive))
+            solve_part_1(path=tf),
         )
 
         print(
             '(Part 2) '
             'Winning player score (in recursive game):',
-            winning_player_score_recursive,
+            solve_part_2(path=tf),
         )
 
 